@@ -27,6 +27,9 @@ class startup(SuprocBenchmarks):
         self.env = os.environ.copy()
         self.env['PATH'] = '%s:%s' % (python_path, self.env.get('PATH', ''))
 
+    def time_version(self):
+        call(["datalad", "--version"], env=self.env)
+
     def time_usage_advice(self):
         call(["datalad"], env=self.env)
 
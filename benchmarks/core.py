@@ -68,3 +68,37 @@ class witlessrunner(SuprocBenchmarks):
 
     def time_echo_gitrunner_fullcapture(self):
         self.git_runner.run(["echo"], protocol=StdOutErrCapture)
+
+
+class runner_backends(SuprocBenchmarks):
+    """Per-call overhead of the runner backends for small git commands
+    """
+
+    params = ['threads', 'selector']
+    param_names = ['backend']
+
+    def setup(self, backend):
+        self._orig_backend = os.environ.get('DATALAD_RUNNER_BACKEND')
+        os.environ['DATALAD_RUNNER_BACKEND'] = backend
+        self.git_runner = GitRunner(cwd=osp.dirname(__file__))
+
+    def teardown(self, backend):
+        if self._orig_backend is None:
+            del os.environ['DATALAD_RUNNER_BACKEND']
+        else:
+            os.environ['DATALAD_RUNNER_BACKEND'] = self._orig_backend
+
+    def time_git_version(self, backend):
+        self.git_runner.run(["git", "--version"], protocol=StdOutErrCapture)
+
+    def time_git_rev_parse(self, backend):
+        self.git_runner.run(
+            ["git", "rev-parse", "--show-toplevel"],
+            protocol=StdOutErrCapture)
+
+    def time_git_10_calls(self, backend):
+        for i in range(10):
+            self.git_runner.run(
+                ["git", "config", "--get", "user.name"],
+                protocol=StdOutErrCapture,
+                exception_on_error=False)
@@ -0,0 +1,36 @@
+# Import functions to be tested with _ suffix and name the suite after the
+# original function so we could easily benchmark it e.g. by
+#    asv run --python=same -b Digester
+# without need to discover what benchmark to use etc
+
+import os
+import os.path as op
+import tempfile
+
+from datalad.support.digests import Digester as Digester_
+
+from ..common import SuprocBenchmarks
+
+
+class Digester(SuprocBenchmarks):
+
+    def setup(self):
+        self.path = tempfile.mkdtemp()
+        self.remove_paths.append(self.path)
+        self.bigfile = op.join(self.path, 'big')
+        with open(self.bigfile, 'wb') as f:
+            f.write(os.urandom(64 << 20))
+        self.smalldir = op.join(self.path, 'small')
+        os.mkdir(self.smalldir)
+        for i in range(200):
+            with open(op.join(self.smalldir, 'file%d' % i), 'wb') as f:
+                f.write(os.urandom(1 << 16))
+
+    def time_all_digests_bigfile(self):
+        Digester_()(self.bigfile)
+
+    def time_md5_bigfile(self):
+        Digester_(['md5'])(self.bigfile)
+
+    def time_md5_dir(self):
+        Digester_(['md5']).digest_dir(self.smalldir)
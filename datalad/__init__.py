@@ -152,11 +152,20 @@ def teardown_package():
 # To analyze/initiate our decision making on what current directory to return
 getpwd()
 
-lgr.log(5, "Instantiating ssh manager")
-from .support.sshconnector import SSHManager
 
-ssh_manager = SSHManager()
-atexit.register(ssh_manager.close, allow_fail=False)
+def __getattr__(name):
+    # the SSH manager is only instantiated on first access, to keep the
+    # import of the package (and thereby CLI startup) as fast as possible
+    if name == 'ssh_manager':
+        global ssh_manager
+        lgr.log(5, "Instantiating ssh manager")
+        from .support.sshconnector import SSHManager
+        ssh_manager = SSHManager()
+        atexit.register(ssh_manager.close, allow_fail=False)
+        return ssh_manager
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 atexit.register(lgr.log, 5, "Exiting")
 
 from ._version import get_versions
@@ -84,35 +84,10 @@ class HelpAction(argparse.Action):
             (options if in_options else preamble).append(line)
 
         intf = self._get_all_interfaces()
-        from datalad.interface.base import (
-            get_cmd_doc,
-            load_interface,
-        )
-        from .interface import (
-            get_cmdline_command_name,
-            alter_interface_docs_for_cmdline,
-        )
         preamble = get_description_with_cmd_summary(
             # produce a mapping of command groups to
             # [(cmdname, description), ...]
-            {
-                i[0]: [(
-                    get_cmdline_command_name(c),
-                    # alter_interface_docs_for_cmdline is only needed, because
-                    # some commands use sphinx markup in their summary line
-                    # stripping that takes 10-30ms for a typical datalad
-                    # installation with some extensions
-                    alter_interface_docs_for_cmdline(
-                        # we only take the first line
-                        get_cmd_doc(
-                            # we must import the interface class
-                            # this will engage @build_doc -- unavoidable right
-                            # now
-                            load_interface(c)
-                        ).split('\n', maxsplit=1)[0]))
-                    for c in i[2]]
-                for i in intf
-            },
+            get_cmd_summary_table(intf),
             intf,
             '\n'.join(preamble),
         )
@@ -206,6 +181,112 @@ def get_commands_from_groups(groups):
     }
 
 
+def get_cmd_summary_table(interface_groups):
+    """Get a mapping of command groups to [(cmdname, summary), ...]
+
+    Obtaining a command summary requires importing the interface class
+    (this engages @build_doc). Because this is slow for a typical datalad
+    installation with some extensions, summaries are cached in a table in
+    the user's cache directory. An entry is only regenerated, when the
+    module file providing the interface changed, or the datalad version
+    differs from the one the table was produced with.
+    """
+    from importlib.util import find_spec
+    from .interface import get_cmdline_command_name
+
+    cache_file = _get_cmd_summary_cache_file()
+    cached = _load_cmd_summary_cache(cache_file)
+    table = {}
+    entries = {}
+    for grp_name, _, specs in interface_groups:
+        grp_summaries = table[grp_name] = []
+        for spec in specs:
+            cmd_name = get_cmdline_command_name(spec)
+            entry_id = '{}:{}'.format(*spec[:2])
+            try:
+                origin = find_spec(spec[0]).origin
+                st = os.stat(origin)
+                stamp = [origin, st.st_mtime_ns, st.st_size]
+            except Exception as e:
+                # no reliable way to tell whether a cached summary is
+                # still valid
+                lgr.debug("Cannot determine origin of %s: %s",
+                          spec[0], CapturedException(e))
+                stamp = None
+            entry = cached.get(entry_id)
+            if stamp is None or entry is None or entry['stamp'] != stamp:
+                summary = _get_cmd_summary(spec)
+                if summary is None:
+                    # interface failed to load, error was logged already
+                    continue
+                entry = dict(stamp=stamp, summary=summary)
+            if stamp is not None:
+                entries[entry_id] = entry
+            grp_summaries.append((cmd_name, entry['summary']))
+    if entries != cached:
+        _save_cmd_summary_cache(cache_file, entries)
+    return table
+
+
+def _get_cmd_summary(spec):
+    from datalad.interface.base import (
+        get_cmd_doc,
+        load_interface,
+    )
+    from .interface import alter_interface_docs_for_cmdline
+    # we must import the interface class
+    intf = load_interface(spec)
+    if intf is None:
+        return None
+    # alter_interface_docs_for_cmdline is only needed, because
+    # some commands use sphinx markup in their summary line
+    return alter_interface_docs_for_cmdline(
+        # we only take the first line
+        get_cmd_doc(intf).split('\n', maxsplit=1)[0])
+
+
+def _get_cmd_summary_cache_file():
+    from datalad import cfg
+    return os.path.join(
+        cfg.obtain('datalad.locations.cache'), 'cli', 'cmd_summaries.json')
+
+
+def _load_cmd_summary_cache(path):
+    import json
+    try:
+        with open(path, encoding='utf-8') as f:
+            cache = json.load(f)
+    except FileNotFoundError:
+        return {}
+    except Exception as e:
+        lgr.debug("Ignoring unreadable command summary cache %s: %s",
+                  path, CapturedException(e))
+        return {}
+    if not isinstance(cache, dict) or cache.get('version') != __version__:
+        return {}
+    return cache.get('entries', {})
+
+
+def _save_cmd_summary_cache(path, entries):
+    import json
+    import tempfile
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # write to a temporary file and move into place, such that
+        # concurrent readers never see a partial table
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path))
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(dict(version=__version__, entries=entries), f)
+            os.replace(tmp, path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+    except Exception as e:
+        lgr.debug("Could not update command summary cache %s: %s",
+                  path, CapturedException(e))
+
+
 def _fix_datalad_ri(s):
     """Fixup argument if it was a DataLadRI and had leading / removed
 
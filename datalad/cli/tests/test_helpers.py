@@ -10,9 +10,22 @@
 
 __docformat__ = 'restructuredtext'
 
-from datalad.tests.utils_pytest import assert_equal
+import os
+from unittest.mock import patch
 
-from ..helpers import _fix_datalad_ri
+from datalad.interface.base import get_interface_groups
+from datalad.tests.utils_pytest import (
+    assert_equal,
+    assert_in,
+    assert_raises,
+    ok_exists,
+    with_tempfile,
+)
+
+from ..helpers import (
+    _fix_datalad_ri,
+    get_cmd_summary_table,
+)
 
 
 def test_fix_datalad_ri():
@@ -24,3 +37,31 @@ def test_fix_datalad_ri():
     assert_equal(_fix_datalad_ri('///a'), '///a')
     assert_equal(_fix_datalad_ri('//a/b'), '///a/b')
     assert_equal(_fix_datalad_ri('///a/b'), '///a/b')
+
+
+@with_tempfile
+def test_get_cmd_summary_table(path=None):
+    groups = get_interface_groups()
+    cache_file = os.path.join(path, 'cmd_summaries.json')
+    with patch('datalad.cli.helpers._get_cmd_summary_cache_file',
+               return_value=cache_file):
+        table = get_cmd_summary_table(groups)
+        ok_exists(cache_file)
+        assert_equal(set(table), set(g[0] for g in groups))
+        assert_in(
+            ('wtf', 'Generate a report about the DataLad installation and '
+                    'configuration'),
+            table['3misc'])
+        # summaries come from the table now, no interface is loaded
+        with patch('datalad.cli.helpers._get_cmd_summary',
+                   side_effect=RuntimeError):
+            assert_equal(get_cmd_summary_table(groups), table)
+            # but a modified module invalidates its entry
+            st = os.stat(__file__)
+            with patch('os.stat', return_value=os.stat_result(
+                    (st.st_mode, 0, 0, 1, 0, 0, 1, 0, 0, 0))):
+                assert_raises(RuntimeError, get_cmd_summary_table, groups)
+        # an unusable table is ignored
+        with open(cache_file, 'w') as f:
+            f.write('{broken')
+        assert_equal(get_cmd_summary_table(groups), table)
@@ -2,9 +2,14 @@
 
 __docformat__ = 'restructuredtext'
 
+import sys
 from io import StringIO
 from unittest.mock import patch
 
+from datalad.cmd import (
+    StdOutCapture,
+    WitlessRunner,
+)
 from datalad.tests.utils_pytest import (
     assert_equal,
     assert_in,
@@ -80,3 +85,31 @@ def test_setup():
         list(parser._positionals._group_actions[0].choices.keys()),
         ['wtf']
     )
+
+
+_lean_import_check = """\
+import sys
+import datalad.cli.main
+from datalad.cli.parser import setup_parser
+from datalad.interface.base import get_interface_groups
+print(sorted(m for m in (
+    'datalad.support.annexrepo',
+    'datalad.support.gitrepo',
+    'datalad.support.sshconnector') if m in sys.modules))
+setup_parser(['datalad', 'wtf'])
+print(sorted(spec[0] for _, _, specs in get_interface_groups()
+             for spec in specs if spec[0] in sys.modules))
+"""
+
+
+def test_lean_parser_import():
+    # this needs a fresh process, where nothing was imported yet
+    out = WitlessRunner().run(
+        [sys.executable, '-c', _lean_import_check],
+        protocol=StdOutCapture)
+    assert_equal(
+        out['stdout'].splitlines(),
+        # the CLI does not pull in the repository implementations
+        ['[]',
+         # and only the module of the selected command is loaded
+         "['datalad.local.wtf']"])
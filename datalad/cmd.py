@@ -18,10 +18,13 @@ import os
 import queue
 import sys
 import warnings
+from collections import deque
 from subprocess import TimeoutExpired
 from typing import (
     Any,
     Callable,
+    Generator,
+    Iterable,
     List,
     Optional,
     Tuple,
@@ -58,7 +61,7 @@ from datalad.runner.nonasyncrunner import (
 )
 from datalad.runner.protocol import GeneratorMixIn
 from datalad.runner.runner import WitlessRunner
-from datalad.runner.utils import LineSplitter
+from datalad.runner.utils import BytesLineSplitter
 from datalad.utils import (
     auto_repr,
     ensure_unicode,
@@ -99,19 +102,29 @@ class BatchedCommandProtocol(GeneratorMixIn, StdOutErrCapture):
                  done_future: Any = None,
                  encoding: Optional[str] = None,
                  output_proc: Callable = None,
+                 line_separator: Optional[str] = None,
                  ):
         GeneratorMixIn.__init__(self)
         StdOutErrCapture.__init__(self, done_future, encoding)
         self.batched_command = batched_command
         self.output_proc = output_proc
-        self.line_splitter = LineSplitter()
+        # stdout is split into lines before it is decoded, hence multi-byte
+        # characters that are split across chunks are decoded in one piece.
+        self.line_splitter = BytesLineSplitter(
+            line_separator.encode(self.encoding)
+            if line_separator is not None else None)
+
+    def _decode(self, line: bytes) -> str:
+        # Undecodable bytes are preserved as surrogates, in order to not
+        # lose or block on them.
+        return line.decode(self.encoding, errors='surrogateescape')
 
     def pipe_data_received(self, fd: int, data: bytes):
         if fd == STDERR_FILENO:
             self.send_result((fd, data))
         elif fd == STDOUT_FILENO:
-            for line in self.line_splitter.process(data.decode(self.encoding)):
-                self.send_result((fd, line))
+            for line in self.line_splitter.process(data):
+                self.send_result((fd, self._decode(line)))
         else:
             raise ValueError(f"unknown file descriptor: {fd}")
 
@@ -119,6 +132,7 @@ class BatchedCommandProtocol(GeneratorMixIn, StdOutErrCapture):
         if fd == STDOUT_FILENO:
             remaining_line = self.line_splitter.finish_processing()
             if remaining_line is not None:
+                remaining_line = self._decode(remaining_line)
                 lgr.debug(f"unterminated line: {remaining_line}")
                 self.send_result((fd, remaining_line))
 
@@ -150,6 +164,62 @@ class ReadlineEmulator:
         return self.batched_command.get_one_line()
 
 
+class BatchedCommandFuture:
+    """
+    Pending response of a BatchedCommand to a request that was sent with
+    `BatchedCommand.submit()`.
+
+    Responses are read from the subprocess in the order of the requests.
+    Reading happens on demand, i.e. when the result of this, or of a later
+    request is asked for, or when the number of requests in flight would
+    exceed the window of the BatchedCommand.
+    """
+    __slots__ = ('batched_command', '_done', '_result', '_exception')
+
+    def __init__(self,
+                 batched_command: "BatchedCommand"):
+        self.batched_command = batched_command
+        self._done = False
+        self._result = None
+        self._exception = None
+
+    def done(self) -> bool:
+        """Whether the response was already received"""
+        return self._done
+
+    def result(self) -> Any:
+        """
+        Return the response to the request, wait for it if necessary.
+
+        Raises
+        ------
+        CommandError
+            If the subprocess exited before the response was received.
+        """
+        while not self._done:
+            self.batched_command._receive_next()
+        if self._exception is not None:
+            raise self._exception
+        return self._result
+
+    def exception(self) -> Optional[BaseException]:
+        """
+        Return the exception that was raised while receiving the response,
+        or None, wait for the response if necessary.
+        """
+        while not self._done:
+            self.batched_command._receive_next()
+        return self._exception
+
+    def _set_result(self, result: Any):
+        self._result = result
+        self._done = True
+
+    def _set_exception(self, exception: BaseException):
+        self._exception = exception
+        self._done = True
+
+
 class SafeDelCloseMixin(object):
     """A helper class to use where __del__ would call .close() which might
     fail if "too late in GC game"
@@ -170,6 +240,18 @@ class BatchedCommand(SafeDelCloseMixin):
     """
     Container for a running subprocess. Supports communication with the
     subprocess via stdin and stdout.
+
+    Responses are read line-wise. By default, lines are split on any known
+    line ending. If `line_separator` is given, lines are only split on this
+    separator, which allows an `output_proc` to reassemble responses that
+    contain arbitrary content verbatim.
+
+    If `terminate_on_close` is set, the subprocess is terminated right away
+    when the instance is closed (explicitly, or when too many instances are
+    active), instead of waiting for it to exit after closing its stdin. The
+    wait could block indefinitely if the stdin pipe was inherited by a forked
+    child process (e.g. via multiprocessing). This is only suitable for
+    commands that do not modify anything, such as `git cat-file`.
     """
 
     # Collection of active BatchedCommands as a mapping from object IDs to
@@ -182,6 +264,8 @@ class BatchedCommand(SafeDelCloseMixin):
                  output_proc: Callable = None,
                  timeout: Optional[float] = None,
                  exception_on_timeout: bool = False,
+                 line_separator: Optional[str] = None,
+                 terminate_on_close: bool = False,
                  ):
 
         command = cmd
@@ -190,6 +274,8 @@ class BatchedCommand(SafeDelCloseMixin):
         self.output_proc = output_proc
         self.timeout = timeout
         self.exception_on_timeout = exception_on_timeout
+        self.line_separator = line_separator
+        self.terminate_on_close = terminate_on_close
 
         self.stdin_queue = None
         self.stderr_output = b""
@@ -199,6 +285,8 @@ class BatchedCommand(SafeDelCloseMixin):
         self.wait_timed_out = None
         self.return_code = None
         self._abandon_cache = None
+        self._window = None
+        self._pending = deque()
 
         self._active = 0
         self._active_last = _now()
@@ -270,6 +358,7 @@ class BatchedCommand(SafeDelCloseMixin):
             # Keyword arguments for the protocol
             batched_command=self,
             output_proc=self.output_proc,
+            line_separator=self.line_separator,
         )
         self.encoding = self.generator.runner.protocol.encoding
 
@@ -344,32 +433,173 @@ class BatchedCommand(SafeDelCloseMixin):
 
         self._active += 1
         try:
+            # responses to submitted requests come first
+            self._receive_pending()
 
             if not self.process_running():
                 self._initialize()
 
-            # Send request to subprocess
-            if not isinstance(request, str):
-                request = ' '.join(request)
-            self.stdin_queue.put((request + "\n").encode())
-
-            # Get the response from the generator. We only consider
-            # data received on stdout as a response.
-            if self.output_proc:
-                # If we have an output procedure, let the output procedure
-                # read stdout and decide about the nature of the response
-                response = self.output_proc(ReadlineEmulator(self))
-            else:
-                # If there is no output procedure we assume that a response
-                # is one line.
-                response = self.get_one_line()
-                if response is not None:
-                    response = response.rstrip()
-            return response
+            self._send_request(request)
+            return self._get_response()
 
         finally:
             self._active -= 1
 
+    def process_requests(self,
+                         requests: Iterable[Union[Tuple, str]],
+                         window: Optional[int] = None,
+                         ) -> Generator:
+        """
+        Send a sequence of requests to the subprocess and yield the responses
+        in the order of the requests.
+
+        In contrast to `__call__()`, the next request is sent without
+        waiting for the response to the previous one. Up to `window` requests
+        are in flight at any time, hence the latency of a round-trip to the
+        subprocess is only paid once per window rather than for every
+        request.
+
+        Parameters
+        ----------
+        requests : iterable of (str or tuple)
+            requests for the subprocess. The iterable is consumed lazily.
+        window : int, optional
+            Maximum number of requests that are sent ahead of the response
+            that is yielded next. Defaults to the value of the configuration
+            setting "datalad.runtime.max-batched-requests".
+
+        Yields
+        ------
+        str
+            Response for each request, as determined by `output_proc`.
+
+        Raises
+        ------
+        CommandError
+            If the subprocess exits while responses are pending. The
+            subprocess will be restarted on the next request.
+        """
+        self._active += 1
+        try:
+            futures = deque()
+            for request in requests:
+                futures.append(self.submit(request, window=window))
+                while futures[0].done():
+                    yield futures.popleft().result()
+            while futures:
+                yield futures.popleft().result()
+        finally:
+            # responses to requests that were sent, but not yielded, are
+            # received (and discarded) with the next request
+            self._active -= 1
+
+    def submit(self,
+               request: Union[Tuple, str],
+               window: Optional[int] = None,
+               ) -> BatchedCommandFuture:
+        """
+        Send a request to the subprocess without waiting for the response.
+
+        If the subprocess does not exist yet it is started before the request
+        is sent.
+
+        Parameters
+        ----------
+        request : str or tuple
+            request for the subprocess
+        window : int, optional
+            Maximum number of requests in flight. If it would be exceeded,
+            responses to earlier requests are received first. Defaults to
+            the value of the configuration setting
+            "datalad.runtime.max-batched-requests".
+
+        Returns
+        -------
+        BatchedCommandFuture
+            Its `result()` is the response to the request, as determined by
+            `output_proc`.
+        """
+        if window is None:
+            if self._window is None:
+                from . import cfg
+                self._window = cfg.obtain(
+                    "datalad.runtime.max-batched-requests")
+            window = self._window
+        window = max(window, 1)
+        while len(self._pending) >= window:
+            self._receive_next()
+        if not self._pending and not self.process_running():
+            self._initialize()
+        self._send_request(request)
+        future = BatchedCommandFuture(self)
+        self._pending.append(future)
+        # a command with requests in flight must not be closed as inactive
+        self._active += 1
+        return future
+
+    def _receive_next(self):
+        """Receive the response to the oldest request in flight"""
+        future = self._pending.popleft()
+        self._active -= 1
+        self._active_last = _now()
+        try:
+            response = self._get_response()
+        except StopIteration:
+            # the responses to the pending requests are lost with the
+            # process
+            self.return_code = self.generator.return_code
+            self._fail_pending(
+                future,
+                CommandError(
+                    cmd=self.command,
+                    msg=f"process exited with {len(self._pending) + 1} "
+                        f"pending request(s)",
+                    code=self.return_code,
+                    stderr=ensure_unicode(self.stderr_output),
+                    cwd=self.path))
+        except CommandError as command_error:
+            self.return_code = command_error.code
+            self._fail_pending(future, command_error)
+        except Exception as e:
+            future._set_exception(e)
+        else:
+            future._set_result(response)
+
+    def _fail_pending(self,
+                      future: BatchedCommandFuture,
+                      error: CommandError):
+        lgr.debug(f"{self}: command exited with pending requests: {error}")
+        self.runner = None
+        future._set_exception(error)
+        while self._pending:
+            self._pending.popleft()._set_exception(error)
+            self._active -= 1
+
+    def _receive_pending(self):
+        """Receive the responses to all requests in flight"""
+        while self._pending:
+            self._receive_next()
+
+    def _send_request(self, request: Union[Tuple, str]):
+        if not isinstance(request, str):
+            request = ' '.join(request)
+        self.stdin_queue.put((request + "\n").encode())
+
+    def _get_response(self) -> str:
+        # Get the response from the generator. We only consider
+        # data received on stdout as a response.
+        if self.output_proc:
+            # If we have an output procedure, let the output procedure
+            # read stdout and decide about the nature of the response
+            response = self.output_proc(ReadlineEmulator(self))
+        else:
+            # If there is no output procedure we assume that a response
+            # is one line.
+            response = self.get_one_line()
+            if response is not None:
+                response = response.rstrip()
+        return response
+
     def proc1(self,
               single_command: str):
         """
@@ -436,6 +666,19 @@ class BatchedCommand(SafeDelCloseMixin):
           stderr output if return_stderr is True, None otherwise
         """
 
+        # let submitted requests be answered before the process goes away
+        self._receive_pending()
+
+        if self.runner and self.terminate_on_close:
+            if self.process_running():
+                # let the stdin writer thread exit
+                self.generator.runner.close_stdin()
+                self.generator.runner.process.terminate()
+            # the remaining runner threads finish with the process
+            self.runner = None
+            self.stderr_output = b""
+            return None
+
         if self.runner:
 
             abandon = self._get_abandon()
@@ -12,6 +12,7 @@
 import json
 import logging
 import os
+import os.path as op
 import re
 import threading
 import warnings
@@ -70,6 +71,19 @@ _scope_reload_doc = """
 _stat_result = namedtuple('_stat_result', 'st_ino st_size st_ctime st_mtime')
 
 
+# Process-wide snapshots of the configuration git reads independent of any
+# repository (system, global, and command line scope). They are shared
+# across all ConfigManager instances, keyed on the environment that
+# determines the configuration sources, and validated against the stats of
+# the files they were read from.
+_shared_snapshots = {}
+_shared_snapshots_lock = threading.Lock()
+
+# environment variables (besides any GIT_CONFIG*) that determine which files
+# git reads its system and global configuration from
+_shared_snapshot_env = ('HOME', 'XDG_CONFIG_HOME', 'PREFIX', 'PATH')
+
+
 # we cannot import external_versions here, as the cfg comes before anything
 # and we would have circular imports
 @lru_cache()
@@ -192,6 +206,280 @@ def parse_gitconfig_dump(dump, cwd=None, multi_value=True):
 _parse_gitconfig_dump = parse_gitconfig_dump
 
 
+class _GitConfigUnsupported(ValueError):
+    """Configuration that the native reader cannot (or must not) handle"""
+    pass
+
+
+# maximum depth of nested includes, like git's
+_gitconfig_max_include_depth = 10
+# git-config syntax elements
+_gitcfg_section_regex = re.compile(
+    r'\[([a-zA-Z0-9.-]+)(?:[ \t]+"((?:[^"\\\n]|\\.)*)")?\]')
+_gitcfg_name_regex = re.compile(r'[a-zA-Z][a-zA-Z0-9-]*')
+_gitcfg_simple_value_regex = re.compile(r'[^"\\#;\n]*(?=[\n#;]|$)')
+_gitcfg_whitespace_table = str.maketrans('\t\r', '  ')
+_gitcfg_value_escapes = {'n': '\n', 't': '\t', 'b': '\b', '\\': '\\', '"': '"'}
+
+
+def read_gitconfig(paths, includes=True, gitdir=None, multi_value=True):
+    """Read git-config files without calling `git config`
+
+    This is a reader for the git-config file syntax that reports the same
+    as `parse_gitconfig_dump()` reports for the output of `git config -z -l
+    --show-origin` for the same files.
+
+    Parameters
+    ----------
+    paths : list of Path
+      Configuration files to read, in order of increasing precedence.
+      Absent files are ignored.
+    includes : bool, optional
+      Whether to follow `include` and `includeIf` directives, like with
+      `git config --includes`.
+    gitdir : Path, optional
+      Git directory of the repository the configuration is read for.
+      Used to evaluate `includeIf` conditions. Without it, no such
+      condition is considered to be met.
+    multi_value : bool, optional
+      If True, report values from multiple specifications of the
+      same key as a tuple of values assigned to this key. Otherwise,
+      the last configuration is reported.
+
+    Returns
+    -------
+    dict, set
+      Configuration items, and a set of Path objects of all files that
+      contributed configuration items.
+
+    Raises
+    ------
+    ValueError
+      For invalid syntax or configuration that requires an evaluation
+      by git itself (e.g. `includeIf.hasconfig:`).
+    """
+    dct = {}
+    fileset = set()
+
+    def _add(path, k, v):
+        fileset.add(path)
+        present_v = dct.get(k, None)
+        if present_v is None or not multi_value:
+            dct[k] = v
+        elif isinstance(present_v, tuple):
+            dct[k] = present_v + (v,)
+        else:
+            dct[k] = (present_v, v)
+
+    def _read(path, depth):
+        if depth > _gitconfig_max_include_depth:
+            raise _GitConfigUnsupported(
+                'exceeded maximum include depth reading {}'.format(path))
+        try:
+            text = path.read_bytes().decode('utf-8')
+        except FileNotFoundError:
+            return
+        if text.startswith('\ufeff'):
+            text = text[1:]
+        for k, v in _iter_gitconfig_items(text.replace('\r\n', '\n'), path):
+            _add(path, k, v)
+            if not includes or not k.endswith('.path') or not (
+                    k == 'include.path' or k.startswith('includeif.')):
+                continue
+            if v is None:
+                raise _GitConfigUnsupported(
+                    'missing value for {} in {}'.format(k, path))
+            if k != 'include.path' and not _match_include_condition(
+                    k[10:-5], path, gitdir):
+                continue
+            include = Path(v).expanduser()
+            _read(include if include.is_absolute() else path.parent / include,
+                  depth + 1)
+
+    for p in paths:
+        _read(Path(p), 0)
+    return dct, fileset
+
+
+def _iter_gitconfig_items(text, path):
+    """Helper for read_gitconfig() to parse git-config syntax
+
+    Yields
+    ------
+    str, str
+      Key and value. The value is None for a key without any value.
+    """
+    i = 0
+    n = len(text)
+    section = None
+    while i < n:
+        c = text[i]
+        if c in ' \t\n\r':
+            i += 1
+            continue
+        if c in '#;':
+            i = text.find('\n', i)
+            if i < 0:
+                break
+            continue
+        if c == '[':
+            m = _gitcfg_section_regex.match(text, i)
+            if not m:
+                raise _GitConfigUnsupported(
+                    'bad config section in {}'.format(path))
+            section, subsection = m.groups()
+            section = section.lower()
+            if subsection is not None:
+                section = '{}.{}'.format(
+                    section, re.sub(r'\\(.)', r'\1', subsection))
+            i = m.end()
+            continue
+        m = _gitcfg_name_regex.match(text, i)
+        if not m or section is None:
+            raise _GitConfigUnsupported(
+                'bad config line in {}'.format(path))
+        key = '{}.{}'.format(section, m.group().lower())
+        i = m.end()
+        while i < n and text[i] in ' \t':
+            i += 1
+        if i >= n or text[i] == '\n':
+            # no value, a boolean true
+            yield key, None
+            continue
+        if text[i] != '=':
+            raise _GitConfigUnsupported(
+                'bad config line in {}'.format(path))
+        m = _gitcfg_simple_value_regex.match(text, i + 1)
+        if m:
+            # the common case, no quotes, escapes, or continuation lines.
+            # like git, report any inner whitespace as spaces
+            yield key, m.group().strip(' \t\r').translate(
+                _gitcfg_whitespace_table)
+            i = m.end()
+            continue
+        value, i = _parse_gitconfig_value(text, i + 1, path)
+        yield key, value
+
+
+def _parse_gitconfig_value(text, i, path):
+    """Helper for _iter_gitconfig_items() to parse a value like git does"""
+    value = []
+    # whitespace is only kept, if there is something to follow it
+    space = 0
+    quote = False
+    comment = False
+    n = len(text)
+    while i < n:
+        c = text[i]
+        i += 1
+        if c == '\n':
+            if quote:
+                break
+            return ''.join(value), i
+        if comment:
+            continue
+        if c in ' \t\r' and not quote:
+            if value:
+                space += 1
+            continue
+        if not quote and c in '#;':
+            comment = True
+            continue
+        if space:
+            value.append(' ' * space)
+            space = 0
+        if c == '\\':
+            if i >= n:
+                break
+            c = text[i]
+            i += 1
+            if c == '\n':
+                # continuation line
+                continue
+            if c not in _gitcfg_value_escapes:
+                break
+            value.append(_gitcfg_value_escapes[c])
+        elif c == '"':
+            quote = not quote
+        else:
+            value.append(c)
+    else:
+        if not quote:
+            return ''.join(value), i
+    raise _GitConfigUnsupported('bad config value in {}'.format(path))
+
+
+def _match_include_condition(condition, path, gitdir):
+    """Helper for read_gitconfig() to evaluate an includeIf condition"""
+    kind, _, pattern = condition.partition(':')
+    if kind in ('gitdir', 'gitdir/i'):
+        if gitdir is None:
+            return False
+        if pattern.startswith('~/'):
+            pattern = str(Path(pattern).expanduser())
+        elif pattern.startswith('./'):
+            pattern = str(path.parent / pattern[2:])
+        if not op.isabs(pattern) and not pattern.startswith('**/'):
+            pattern = '**/' + pattern
+        candidates = {str(gitdir), op.realpath(str(gitdir))}
+    elif kind == 'onbranch':
+        if gitdir is None:
+            return False
+        try:
+            head = (Path(gitdir) / 'HEAD').read_text().strip()
+        except OSError:
+            return False
+        if not head.startswith('ref: refs/heads/'):
+            return False
+        candidates = {head[16:]}
+    else:
+        # e.g. hasconfig:, needs the full configuration
+        raise _GitConfigUnsupported(
+            'unsupported includeIf condition {!r} in {}'.format(
+                condition, path))
+    if pattern.endswith('/'):
+        pattern += '**'
+    regex = re.compile(
+        _wildmatch_to_regex(pattern),
+        flags=re.IGNORECASE if kind == 'gitdir/i' else 0)
+    return any(regex.match(c) for c in candidates)
+
+
+def _wildmatch_to_regex(pattern):
+    """Translate a wildmatch pattern (with WM_PATHNAME) to a regex"""
+    regex = []
+    i = 0
+    n = len(pattern)
+    while i < n:
+        if pattern.startswith('**/', i):
+            regex.append('(?:.*/)?')
+            i += 3
+        elif pattern.startswith('**', i):
+            regex.append('.*')
+            i += 2
+        elif pattern[i] == '*':
+            regex.append('[^/]*')
+            i += 1
+        elif pattern[i] == '?':
+            regex.append('[^/]')
+            i += 1
+        elif pattern[i] == '[' and pattern.find(']', i + 2) > 0:
+            end = pattern.find(']', i + 2)
+            cls = pattern[i + 1:end]
+            negate = cls[:1] in ('!', '^')
+            regex.append('[{}{}]'.format(
+                '^/' if negate else '',
+                re.escape(cls[1:] if negate else cls).replace('\\-', '-')))
+            i = end + 1
+        elif pattern[i] == '\\' and i + 1 < n:
+            regex.append(re.escape(pattern[i + 1]))
+            i += 2
+        else:
+            regex.append(re.escape(pattern[i]))
+            i += 1
+    return r'\A{}\Z'.format(''.join(regex))
+
+
 def _gitcfg_rec_to_keyvalue(rec):
     """Helper for parse_gitconfig_dump()
 
@@ -219,6 +507,38 @@ def _gitcfg_rec_to_keyvalue(rec):
     return k, v
 
 
+def _merge_gitconfig(*cfgs):
+    """Merge parsed configurations like `parse_gitconfig_dump()` would
+
+    Multiple values of the same key are reported as a tuple of values, in
+    the order of the given configurations.
+    """
+    dct = {}
+    for cfg in cfgs:
+        for k, values in cfg.items():
+            for v in values if isinstance(values, tuple) else (values,):
+                present_v = dct.get(k, None)
+                if present_v is None:
+                    dct[k] = v
+                elif isinstance(present_v, tuple):
+                    dct[k] = present_v + (v,)
+                else:
+                    dct[k] = (present_v, v)
+    return dct
+
+
+def _has_conditional_include(path):
+    """Whether a config file has includeIf sections
+
+    Their conditions may depend on the repository the configuration is
+    read for.
+    """
+    try:
+        return 'includeif' in path.read_text(errors='replace').lower()
+    except OSError:
+        return False
+
+
 def _update_from_env(store):
     overrides = {}
     dct = {}
@@ -347,14 +667,20 @@ class ConfigManager(object):
 
         self._repo_dot_git = None
         self._repo_pathobj = None
+        # persistent `git cat-file` reader of the repository, if any.
+        # we do not keep a reference to the repo itself, to not create
+        # a reference cycle
+        self._repo_cat_file = None
         if dataset:
             if hasattr(dataset, 'dot_git'):
                 # `dataset` is actually a Repo instance
                 self._repo_dot_git = dataset.dot_git
                 self._repo_pathobj = dataset.pathobj
+                self._repo_cat_file = getattr(dataset, '_cat_file', None)
             elif dataset.repo:
                 self._repo_dot_git = dataset.repo.dot_git
                 self._repo_pathobj = dataset.repo.pathobj
+                self._repo_cat_file = getattr(dataset.repo, '_cat_file', None)
 
         self._config_cmd = ['git', 'config']
         # public dict to store variables that always override any setting
@@ -435,16 +761,9 @@ class ConfigManager(object):
             if self._repo_dot_git == self._repo_pathobj:
                 # this is a bare repo, we go with the default HEAD,
                 # if it has a config
-                try:
-                    # will blow if absent
-                    self._runner.run([
-                        'git', 'cat-file', '-e', 'HEAD:.datalad/config'],
-                        protocol=KillOutput)
+                if self._has_branch_config_blob():
                     to_run['branch'] = run_args + [
                         '--blob', 'HEAD:.datalad/config']
-                except CommandError:
-                    # all good, just no branch config
-                    pass
             else:
                 # non-bare repo
                 # we could use the same strategy as for bare repos, and rely
@@ -466,7 +785,10 @@ class ConfigManager(object):
         # reload everything that was found todo
         while to_run:
             store_id, runargs = to_run.popitem()
-            self._stores[store_id] = self._reload(runargs)
+            self._stores[store_id] = \
+                self._reload_git(runargs) \
+                if store_id == 'git' and self._src_mode != 'branch-local' \
+                else self._reload(runargs)
 
         # always update the merged representation, even if we did not reload
         # anything from a file. ENV or overrides could change independently
@@ -482,6 +804,20 @@ class ConfigManager(object):
             _update_from_env(merged)
         self._merged_store = merged
 
+    def _has_branch_config_blob(self):
+        """Whether there is a committed dataset config in HEAD"""
+        obj = 'HEAD:.datalad/config'
+        if self._repo_cat_file is not None:
+            return self._repo_cat_file.check(obj) is not None
+        try:
+            # will blow if absent
+            self._runner.run(['git', 'cat-file', '-e', obj],
+                             protocol=KillOutput)
+            return True
+        except CommandError:
+            # all good, just no branch config
+            return False
+
     def _need_reload(self, store):
         storestats = store['stats']
         if not storestats:
@@ -492,13 +828,17 @@ class ConfigManager(object):
         curstats = self._get_stats(store)
         return any(curstats[f] != storestats[f] for f in store['files'])
 
-    def _reload(self, run_args):
+    def _reload(self, run_args, env=None):
+        store = self._reload_native(run_args, env)
+        if store is not None:
+            return store
         # query git-config
         stdout, stderr = self._run(
             run_args,
             protocol=StdOutErrCapture,
             # always expect git-config to output utf-8
             encoding='utf-8',
+            env=env,
         )
         store = {}
         store['cfg'], store['files'] = parse_gitconfig_dump(
@@ -509,6 +849,162 @@ class ConfigManager(object):
         store['stats'] = self._get_stats(store)
         return store
 
+    def _reload_native(self, run_args, env=None):
+        """Emulate a `git config` query of `_reload()` by reading files
+
+        Returns
+        -------
+        dict or None
+          None is returned, if the query cannot be emulated, or the
+          configuration files need an evaluation by git.
+        """
+        env = env or self._runner.env or os.environ
+        gitdir = self._repo_dot_git
+        if any(k in env for k in ('GIT_DIR', 'GIT_COMMON_DIR', 'GIT_CONFIG')):
+            # leave any redirection to git
+            return None
+        if '--file' in run_args:
+            paths = [Path(run_args[run_args.index('--file') + 1])]
+            includes = False
+        elif gitdir is None or '--blob' in run_args \
+                or (gitdir / 'commondir').exists():
+            # no repository, committed config, or a linked worktree
+            return None
+        elif '--local' in run_args:
+            paths = [gitdir / 'config']
+            includes = False
+        elif env.get('GIT_CONFIG_NOSYSTEM') == '1' \
+                and env.get('GIT_CONFIG_GLOBAL') == os.devnull:
+            # all repository configuration, but only that
+            paths = [gitdir / 'config']
+            includes = True
+        else:
+            return None
+        store = {}
+        try:
+            store['cfg'], store['files'] = read_gitconfig(
+                paths, includes=includes, gitdir=gitdir)
+            worktreeconfig = store['cfg'].get(
+                'extensions.worktreeconfig', 'false')
+            if isinstance(worktreeconfig, tuple):
+                worktreeconfig = worktreeconfig[-1]
+            if includes and (
+                    worktreeconfig is None or anything2bool(worktreeconfig)):
+                store['cfg'], store['files'] = read_gitconfig(
+                    paths + [gitdir / 'config.worktree'],
+                    includes=includes, gitdir=gitdir)
+        except (ValueError, TypeError, OSError) as e:
+            lgr.debug('Cannot read configuration without git: %s', e)
+            return None
+        store['stats'] = self._get_stats(store)
+        return store
+
+    def _reload_git(self, run_args):
+        """Load the git config store, reusing a shared snapshot if possible
+
+        Only the repository-specific configuration is read from scratch,
+        system, global, and command line configuration is taken from
+        a process-wide snapshot.
+        """
+        env = self._runner.env or os.environ
+        snapshot = self._get_shared_snapshot(env)
+        if snapshot is None:
+            # read everything in one go
+            return self._reload(run_args)
+
+        if self._config_cmd[1:2] == ['--git-dir=']:
+            # there is no repository to read from
+            local = dict(cfg={}, files=set(), stats={})
+        else:
+            local_env = {
+                k: v for k, v in env.items()
+                if k not in ('GIT_CONFIG_PARAMETERS', 'GIT_CONFIG_COUNT')
+            }
+            local_env.update(
+                GIT_CONFIG_NOSYSTEM='1',
+                GIT_CONFIG_GLOBAL=os.devnull,
+            )
+            local = self._reload(run_args, env=local_env)
+        store = {}
+        # keep git's order of precedence
+        store['cfg'] = _merge_gitconfig(
+            snapshot['cfg'], local['cfg'], snapshot['cmdline'])
+        store['files'] = snapshot['files'].union(local['files'])
+        store['stats'] = dict(snapshot['stats'])
+        store['stats'].update(local['stats'])
+        return store
+
+    def _get_shared_snapshot(self, env):
+        """Return the process-wide configuration snapshot for an environment
+
+        Returns
+        -------
+        dict or None
+          None is returned, if the snapshot cannot be shared across
+          repositories, or `git` does not support isolating repository
+          configuration (requires 2.32).
+        """
+        key = tuple(sorted(
+            (k, v) for k, v in env.items()
+            if k.startswith('GIT_CONFIG') or k in _shared_snapshot_env))
+        with _shared_snapshots_lock:
+            snapshot = _shared_snapshots.get(key)
+            if snapshot is not None and snapshot['stats'] == self._get_stats(
+                    {'files': snapshot['stats']}):
+                return snapshot if snapshot['shareable'] else None
+            snapshot = self._read_shared_snapshot(env)
+            _shared_snapshots[key] = snapshot
+        lgr.debug('Read shared configuration snapshot from %s',
+                  sorted(map(str, snapshot['files'])))
+        return snapshot if snapshot['shareable'] else None
+
+    def _read_shared_snapshot(self, env):
+        snapshot = dict(cfg={}, cmdline={}, files=set(), shareable=False)
+        try:
+            stdout = self._runner.run(
+                ['git', '--git-dir=', 'config', '-z', '-l', '--show-origin'],
+                protocol=StdOutErrCapture,
+                # always expect git-config to output utf-8
+                encoding='utf-8',
+                env=env,
+            )['stdout']
+        except CommandError as e:
+            # e.g. conditional includes cannot be evaluated without
+            # a repository
+            lgr.debug('Cannot read shared configuration snapshot: %s', e)
+            stdout = None
+        if stdout is not None:
+            # command line configuration is reported last, but takes
+            # precedence over any repository configuration
+            cmdline_start = 0 if stdout.startswith('command line:') \
+                else stdout.find('\0command line:') + 1 or len(stdout)
+            snapshot['cfg'], snapshot['files'] = parse_gitconfig_dump(
+                stdout[:cmdline_start], cwd=self._runner.cwd)
+            snapshot['cmdline'], _ = parse_gitconfig_dump(
+                stdout[cmdline_start:])
+            snapshot['shareable'] = \
+                tuple(int(v) for v in get_git_version().split('.')[:2]) \
+                >= (2, 32) \
+                and not any(_has_conditional_include(f)
+                            for f in snapshot['files']
+                            if isinstance(f, Path))
+        # also watch the default locations of configuration files, to
+        # detect files that get created or modified
+        global_cfg = env.get('GIT_CONFIG_GLOBAL')
+        home = env.get('HOME')
+        watched = set(snapshot['files'])
+        if global_cfg:
+            watched.add(Path(global_cfg))
+        elif home:
+            watched.add(Path(home) / '.gitconfig')
+            watched.add(
+                Path(env.get('XDG_CONFIG_HOME') or Path(home) / '.config')
+                / 'git' / 'config')
+        if env.get('GIT_CONFIG_SYSTEM'):
+            watched.add(Path(env['GIT_CONFIG_SYSTEM']))
+        snapshot['stats'] = self._get_stats({'files': watched})
+        return snapshot
+
     def _get_stats(self, store):
         stats = {}
         for f in store['files']:
@@ -47,6 +47,7 @@ ANNEX_TEMP_DIR = join('.git', 'annex', 'tmp')
 ANNEX_TRANSFER_DIR = join('.git', 'annex', 'transfer')
 
 SEARCH_INDEX_DOTGITDIR = join('datalad', 'search_index')
+PUSH_JOURNAL_DOTGITDIR = join('datalad', 'tmp', 'push')
 
 DATASETS_TOPURL = os.environ.get("DATALAD_DATASETS_TOPURL", None) \
                   or "https://datasets.datalad.org/"
@@ -13,9 +13,13 @@
 __docformat__ = 'restructuredtext'
 
 from collections import OrderedDict
+from hashlib import md5
+import json
 import logging
 import re
+import threading
 
+from datalad.consts import PUSH_JOURNAL_DOTGITDIR
 from datalad.interface.base import (
     Interface,
     build_doc,
@@ -42,6 +46,10 @@ from datalad.support.constraints import (
     EnsureChoice,
 )
 from datalad.support.exceptions import CommandError
+from datalad.support.parallel import (
+    ProducerConsumer,
+    no_subds_in_futures,
+)
 from datalad.utils import (
     Path,
     ensure_list,
@@ -229,6 +237,9 @@ class Push(Interface):
                     if sr
                     else 'No targets configured in dataset.'))
             return
+        # as given, for identifying an interrupted run with the same
+        # parameters
+        since_arg = since
         if since == '^':
             # figure out state of remote branch and set `since`
             since = _get_corresponding_remote_state(ds_repo, to)
@@ -252,18 +263,68 @@ class Push(Interface):
             recursive,
             recursion_limit)
 
-        # instead of a loop, this could all be done in parallel
+        # datasets that were pushed completely by an earlier, interrupted
+        # run with the same parameters need no second attempt
+        journal = _PushJournal(
+            ds,
+            [to, since_arg, [str(p) for p in paths], data, force,
+             recursive, recursion_limit])
+
         matched_anything = False
-        for dspath, dsrecords in ds_spec:
-            matched_anything = True
+
+        def produce_ds():
+            nonlocal matched_anything
+            for ds_spec_ in ds_spec:
+                matched_anything = True
+                yield ds_spec_
+
+        def push_ds(ds_spec_):
+            dspath, dsrecords = ds_spec_
+            hexsha = Dataset(dspath).repo.get_hexsha()
+            if journal.is_done(dspath, hexsha):
+                res = dict(
+                    res_kwargs,
+                    status='notneeded',
+                    type='dataset',
+                    path=dspath,
+                    message='Already pushed by an earlier, interrupted run')
+                if to:
+                    res['target'] = to
+                yield res
+                return
             lgr.debug('Pushing Dataset at %s', dspath)
             pbars = {}
-            yield from _push(
-                dspath, dsrecords, to, data, force, jobs, res_kwargs.copy(), pbars,
-                got_path_arg=True if path else False)
+            complete = True
+            for res in _push(
+                    dspath, dsrecords, to, data, force, jobs,
+                    res_kwargs.copy(), pbars,
+                    got_path_arg=True if path else False):
+                complete &= res.get('status') in ('ok', 'notneeded')
+                yield res
             # take down progress bars for this dataset
-            for i, ds in pbars.items():
-                log_progress(lgr.info, i, 'Finished push of %s', ds)
+            for i, ds_ in pbars.items():
+                log_progress(lgr.info, i, 'Finished push of %s', ds_)
+            if complete:
+                journal.record(dspath, hexsha)
+
+        # subdatasets come first (bottom-up), and a dataset is only pushed
+        # once none of its subdatasets is pushed anymore, so that a
+        # superdataset never references a subdataset state that is not yet
+        # available at the target
+        failed = False
+        finished = False
+        try:
+            for res in ProducerConsumer(
+                    produce_ds,
+                    push_ds,
+                    safe_to_consume=no_subds_in_futures,
+                    producer_future_key=lambda ds_spec_: ds_spec_[0],
+                    jobs=jobs):
+                failed |= res.get('status') in ('impossible', 'error')
+                yield res
+            finished = True
+        finally:
+            journal.close(complete=finished and not failed)
         if not matched_anything:
             potential_remote = False
             if not to and len(paths) == 1:
@@ -402,6 +463,68 @@ def _datasets_since_(dataset, since, paths, recursive, recursion_limit):
         yield (cur_ds, ds_res)
 
 
+class _PushJournal(object):
+    """On-disk record of datasets that a push has completed
+
+    The journal is kept in the reference dataset, and is specific to a set
+    of push parameters. Each dataset is recorded with the commit that was
+    pushed, so that a dataset that changed since is pushed again. The journal
+    is removed once a push has finished without failures.
+    """
+    def __init__(self, ds, params):
+        self._refpath = ds.pathobj
+        self.path = ds.repo.dot_git / PUSH_JOURNAL_DOTGITDIR / md5(
+            json.dumps(params).encode('utf-8')).hexdigest()
+        self._lock = threading.Lock()
+        self._fp = None
+        self._done = {}
+        try:
+            with self.path.open() as f:
+                for line in f:
+                    try:
+                        rec = json.loads(line)
+                        self._done[rec['path']] = rec['hexsha']
+                    except (ValueError, KeyError, TypeError):
+                        # e.g. a partial record written by a run that was
+                        # interrupted
+                        continue
+        except FileNotFoundError:
+            pass
+        if self._done:
+            lgr.debug('Loaded %d dataset(s) from push journal %s',
+                      len(self._done), self.path)
+
+    def _relpath(self, dspath):
+        return Path(dspath).relative_to(self._refpath).as_posix()
+
+    def is_done(self, dspath, hexsha):
+        return hexsha is not None and \
+            self._done.get(self._relpath(dspath)) == hexsha
+
+    def record(self, dspath, hexsha):
+        if hexsha is None:
+            # nothing committed, nothing to resume
+            return
+        with self._lock:
+            if self._fp is None:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                self._fp = self.path.open('a')
+            self._fp.write(json.dumps(
+                dict(path=self._relpath(dspath), hexsha=hexsha)) + '\n')
+            self._fp.flush()
+
+    def close(self, complete):
+        with self._lock:
+            if self._fp is not None:
+                self._fp.close()
+                self._fp = None
+            if complete:
+                try:
+                    self.path.unlink()
+                except FileNotFoundError:
+                    pass
+
+
 @todo_interface_for_extensions
 def _transfer_data(repo, ds, target, content, data, force, jobs, res_kwargs,
                    got_path_arg):
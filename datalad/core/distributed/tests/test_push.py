@@ -450,6 +450,63 @@ def test_push_subds_no_recursion(src_path=None, dst_top=None, dst_sub=None, dst_
         res, action='publish', type='dataset', path=subsub.path)
 
 
+@with_tempfile(mkdir=True)
+@with_tempfile(mkdir=True)
+@with_tempfile(mkdir=True)
+@with_tempfile(mkdir=True)
+def test_push_recursive_resume(src_path=None, dst_top=None, dst_sub1=None,
+                               dst_sub2=None):
+    top = Dataset(src_path).create()
+    sub1 = top.create('sub1')
+    sub2 = top.create('sub2')
+    assert_repo_status(top.path)
+    mk_push_target(top, 'target', dst_top, annex=True)
+    mk_push_target(sub1, 'target', dst_sub1, annex=True)
+    # sub2 has no target yet, pushing it fails
+    res = top.push(to='target', recursive=True, jobs=2, on_failure='ignore')
+    check_datasets_order(res)
+    assert_in_results(res, status='error', type='dataset', path=sub2.path)
+    # the superdataset is only pushed once all subdatasets are done
+    eq_([r['path'] for r in res if r.get('type') == 'dataset'][-1],
+        top.path)
+    journal = list((top.repo.dot_git / 'datalad' / 'tmp' / 'push').iterdir())
+    eq_(len(journal), 1)
+
+    # a new commit needs to be pushed again, regardless of the journal
+    (sub1.pathobj / 'file').write_text('content')
+    sub1.save()
+    top.save()
+    mk_push_target(sub2, 'target', dst_sub2, annex=True)
+    res = top.push(to='target', recursive=True, jobs=2)
+    assert_in_results(res, status='ok', type='dataset', path=sub1.path,
+                      refspec=DEFAULT_REFSPEC)
+    assert_in_results(res, status='ok', type='dataset', path=sub2.path,
+                      refspec=DEFAULT_REFSPEC)
+    assert_in_results(res, status='ok', type='dataset', path=top.path,
+                      refspec=DEFAULT_REFSPEC)
+    # the journal is gone after a complete push
+    assert_false(journal[0].exists())
+
+    # simulate an interrupted push, after sub1 was pushed completely
+    (sub1.pathobj / 'file2').write_text('content')
+    (sub2.pathobj / 'file2').write_text('content')
+    top.save(recursive=True)
+    journal[0].write_text(
+        '{"path": "sub1", "hexsha": "%s"}\n{"path": "sub2", "hexs'
+        % sub1.repo.get_hexsha())
+    res = top.push(to='target', recursive=True)
+    assert_result_count(res, 1, type='dataset', path=sub1.path)
+    assert_in_results(res, status='notneeded', type='dataset',
+                      path=sub1.path, target='target')
+    # sub1 is not looked at again
+    assert_not_in_results(res, action='copy', path=str(sub1.pathobj / 'file2'))
+    assert_in_results(res, status='ok', type='dataset', path=sub2.path,
+                      refspec=DEFAULT_REFSPEC)
+    assert_in_results(res, status='ok', type='dataset', path=top.path,
+                      refspec=DEFAULT_REFSPEC)
+    assert_false(journal[0].exists())
+
+
 @with_tempfile(mkdir=True)
 @with_tempfile(mkdir=True)
 def test_force_checkdatapresent(srcpath=None, dstpath=None):
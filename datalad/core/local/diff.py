@@ -14,6 +14,7 @@ __docformat__ = 'restructuredtext'
 import logging
 import os.path as op
 from collections import OrderedDict
+from functools import partial
 from datalad.utils import (
     ensure_list,
     ensure_unicode,
@@ -46,6 +47,7 @@ from datalad.core.local.status import (
 from datalad.support.exceptions import (
     InvalidGitReferenceError,
 )
+from datalad.support.parallel import TreeQueryPrefetcher
 
 lgr = logging.getLogger('datalad.core.local.diff')
 
@@ -127,7 +129,8 @@ class Diff(Interface):
             annex=None,
             untracked='normal',
             recursive=False,
-            recursion_limit=None):
+            recursion_limit=None,
+            jobs=None):
         yield from diff_dataset(
             dataset=dataset,
             fr=ensure_unicode(fr),
@@ -137,7 +140,8 @@ class Diff(Interface):
             annex=annex,
             untracked=untracked,
             recursive=recursive,
-            recursion_limit=recursion_limit)
+            recursion_limit=recursion_limit,
+            jobs=jobs)
 
     @staticmethod
     def custom_result_renderer(res, **kwargs):  # pragma: more cover
@@ -157,6 +161,7 @@ def diff_dataset(
         eval_file_type=True,
         reporting_order='depth-first',
         datasets_only=False,
+        jobs=None,
 ):
     """Internal helper to diff a dataset
 
@@ -201,6 +206,10 @@ def diff_dataset(
       Consider only changes to (sub)datasets but limiting operation only to
       paths of subdatasets.
       Note: ATM incompatible with explicit specification of `path`.
+    jobs : int or 'auto', optional
+      If given, the differences in subdatasets are evaluated in (at most)
+      this many parallel threads, ahead of reporting. The order of reports
+      is not affected.
 
     Yields
     ------
@@ -279,37 +288,88 @@ def diff_dataset(
 
     # cache to help avoid duplicate status queries
     content_info_cache = {}
-    for res in _diff_ds(
-            ds,
-            fr,
-            to,
-            constant_refs,
-            recursion_limit
-            if recursion_limit is not None and recursive
-            else -1 if recursive else 0,
+    fetch = TreeQueryPrefetcher(
+        partial(
+            _query_ds_diff,
+            constant_refs=constant_refs,
             # TODO recode paths to repo path reference
             origpaths=None if not path else OrderedDict(path),
             untracked=untracked,
             annexinfo=annex,
             eval_file_type=eval_file_type,
             cache=content_info_cache,
-            order=reporting_order,
             datasets_only=datasets_only,
-    ):
-        res.update(
-            refds=ds.path,
-            logger=lgr,
-            action='diff',
-        )
-        yield res
+        ),
+        key=lambda node: node[0].pathobj,
+        jobs=jobs,
+    )
+    try:
+        for res in _diff_ds(
+                fetch,
+                (ds,
+                 fr,
+                 to,
+                 recursion_limit
+                 if recursion_limit is not None and recursive
+                 else -1 if recursive else 0),
+                order=reporting_order,
+        ):
+            res.update(
+                refds=ds.path,
+                logger=lgr,
+                action='diff',
+            )
+            yield res
+    finally:
+        fetch.close()
+
+
+def _diff_ds(fetch, node, order):
+    """Internal helper of diff_dataset() to report in order"""
+    records, _ = fetch(node)
+    # potentially collect subdataset diff call specs for the end
+    # (if order == 'breadth-first')
+    ds_diffs = []
+    subds_diffcalls = []
+    for path_rec, subds_node in records:
+        if order in ('breadth-first', 'depth-first'):
+            yield path_rec
+        elif order == 'bottom-up':
+            ds_diffs.append(path_rec)
+        else:
+            raise ValueError(order)
+        if subds_node is None:
+            continue
+        if order in ('depth-first', 'bottom-up'):
+            yield from _diff_ds(fetch, subds_node, order)
+        elif order == 'breadth-first':
+            subds_diffcalls.append(subds_node)
+        else:
+            raise ValueError(order)
+    # deal with staged ds diffs (for bottom-up)
+    for rec in ds_diffs:
+        yield rec
+    # deal with staged subdataset diffs (for breadth-first)
+    for subds_node in subds_diffcalls:
+        yield from _diff_ds(fetch, subds_node, order)
+
 
+def _query_ds_diff(node, constant_refs, origpaths, untracked, annexinfo,
+                   eval_file_type, cache, datasets_only=False):
+    """Internal helper of diff_dataset() to query a single dataset
 
-def _diff_ds(ds, fr, to, constant_refs, recursion_level, origpaths, untracked,
-             annexinfo, eval_file_type, cache, order='depth-first', datasets_only=False):
+    Returns
+    -------
+    list, list
+      A list of (result record, subdataset node or None) tuples, and the
+      (dataset, fr, to, recursion level) query specifications of the
+      subdatasets to recurse into.
+    """
+    ds, fr, to, recursion_level = node
     if not ds.is_installed():
         # asked to query a subdataset that is not available
         lgr.debug("Skip diff of unavailable subdataset: %s", ds)
-        return
+        return [], []
 
     repo = ds.repo
     repo_path = repo.pathobj
@@ -326,7 +386,7 @@ def _diff_ds(ds, fr, to, constant_refs, recursion_level, origpaths, untracked,
         )
         if not paths:
             # no subdatasets, nothing todo???
-            return
+            return [], []
     else:
         # filter and normalize paths that match this dataset before passing them
         # onto the low-level query method
@@ -348,34 +408,32 @@ def _diff_ds(ds, fr, to, constant_refs, recursion_level, origpaths, untracked,
             eval_submodule_state='full' if to is None else 'commit',
             _cache=cache)
     except InvalidGitReferenceError as e:
-        yield dict(
+        return [(dict(
             path=ds.path,
             status='impossible',
             message=str(e),
-        )
-        return
+        ), None)], []
 
-    if annexinfo and hasattr(repo, 'get_content_annexinfo'):
-        # this will amend `diff_state`
-        repo.get_content_annexinfo(
-            paths=paths_arg,
-            init=diff_state,
-            eval_availability=annexinfo in ('availability', 'all'),
-            ref=to)
-        # if `fr` is None, we compare against a preinit state, and
-        # a get_content_annexinfo on that state doesn't get us anything new
-        if fr and fr != to:
-            repo.get_content_annexinfo(
+    if annexinfo and hasattr(repo, 'iter_content_annexinfo'):
+        # this will amend `diff_state`, while the git-annex report is read
+        for path, props in repo.iter_content_annexinfo(
                 paths=paths_arg,
                 init=diff_state,
                 eval_availability=annexinfo in ('availability', 'all'),
-                ref=fr,
-                key_prefix="prev_")
+                ref=to):
+            diff_state[path] = props
+        # if `fr` is None, we compare against a preinit state, and
+        # a get_content_annexinfo on that state doesn't get us anything new
+        if fr and fr != to:
+            for path, props in repo.iter_content_annexinfo(
+                    paths=paths_arg,
+                    init=diff_state,
+                    eval_availability=annexinfo in ('availability', 'all'),
+                    ref=fr,
+                    key_prefix="prev_"):
+                diff_state[path] = props
 
-    # potentially collect subdataset diff call specs for the end
-    # (if order == 'breadth-first')
-    ds_diffs = []
-    subds_diffcalls = []
+    records = []
     for path, props in diff_state.items():
         pathinds = str(ds.pathobj / path.relative_to(repo_path))
         path_rec = dict(
@@ -386,12 +444,7 @@ def _diff_ds(ds, fr, to, constant_refs, recursion_level, origpaths, untracked,
             parentds=ds.path,
             status='ok',
         )
-        if order in ('breadth-first', 'depth-first'):
-            yield path_rec
-        elif order == 'bottom-up':
-            ds_diffs.append(path_rec)
-        else:
-            raise ValueError(order)
+        subds_node = None
         # for a dataset we need to decide whether to dive in, or not
         if props.get('type', None) == 'dataset' and (
                 # subdataset path was given in rsync-style 'ds/'
@@ -406,12 +459,11 @@ def _diff_ds(ds, fr, to, constant_refs, recursion_level, origpaths, untracked,
             subds_state = props.get('state', None)
             if subds_state in ('clean', 'deleted'):
                 # no need to look into the subdataset
-                continue
+                pass
             elif subds_state in ('added', 'modified'):
                 # dive
-                subds = Dataset(pathinds)
-                call_args = (
-                    subds,
+                subds_node = (
+                    Dataset(pathinds),
                     # from before time or from the reported state
                     fr if constant_refs
                     else None
@@ -421,37 +473,17 @@ def _diff_ds(ds, fr, to, constant_refs, recursion_level, origpaths, untracked,
                     None if to is None
                     else to if constant_refs
                     else props['gitshasum'],
-                    constant_refs,
-                )
-                call_kwargs = dict(
                     # subtract on level on the way down, unless the path
                     # args instructed to go inside this subdataset
-                    recursion_level=recursion_level
+                    recursion_level
                     # protect against dropping below zero (would mean unconditional
                     # recursion)
                     if not recursion_level or (paths and paths.get(path, False))
                     else recursion_level - 1,
-                    origpaths=origpaths,
-                    untracked=untracked,
-                    annexinfo=annexinfo,
-                    eval_file_type=eval_file_type,
-                    cache=cache,
-                    order=order,
-                    datasets_only=datasets_only,
                 )
-                if order in ('depth-first', 'bottom-up'):
-                    yield from _diff_ds(*call_args, **call_kwargs)
-                elif order == 'breadth-first':
-                    subds_diffcalls.append((call_args, call_kwargs))
-                else:
-                    raise ValueError(order)
             else:
                 raise RuntimeError(
                     "Unexpected subdataset state '{}'. That sucks!".format(
                         subds_state))
-    # deal with staged ds diffs (for bottom-up)
-    for rec in ds_diffs:
-        yield rec
-    # deal with staged subdataset diffs (for breadth-first)
-    for call_args, call_kwargs in subds_diffcalls:
-        yield from _diff_ds(*call_args, **call_kwargs)
+        records.append((path_rec, subds_node))
+    return records, [n for _, n in records if n is not None]
@@ -15,6 +15,7 @@ import logging
 import os
 import os.path as op
 from collections import OrderedDict
+from functools import partial
 import warnings
 
 from datalad.utils import (
@@ -39,9 +40,11 @@ import datalad.support.ansi_colors as ac
 from datalad.support.param import Parameter
 from datalad.support.constraints import (
     EnsureChoice,
+    EnsureInt,
     EnsureNone,
     EnsureStr,
 )
+from datalad.support.parallel import TreeQueryPrefetcher
 from datalad.distribution.dataset import (
     Dataset,
     EnsureDataset,
@@ -96,7 +99,17 @@ _common_diffstatus_params = dict(
         untracked directories are reported as such; 'all': report
         individual files even in fully untracked directories."""),
     recursive=recursion_flag,
-    recursion_limit=recursion_limit)
+    recursion_limit=recursion_limit,
+    jobs=Parameter(
+        args=("-J", "--jobs"),
+        metavar="NJOBS",
+        constraints=EnsureInt() | EnsureNone() | EnsureChoice('auto'),
+        doc="""how many subdatasets to evaluate in parallel when operating
+        recursively. "auto" corresponds to the number defined by the
+        'datalad.runtime.max-jobs' configuration item. By default, subdatasets
+        are evaluated one after another. The order of reports is not
+        affected."""),
+)
 
 
 STATE_COLOR_MAP = {
@@ -110,7 +123,7 @@ STATE_COLOR_MAP = {
 
 def yield_dataset_status(ds, paths, annexinfo, untracked, recursion_limit,
                          queried, eval_submodule_state, eval_filetype, cache,
-                         reporting_order):
+                         reporting_order, jobs=None):
     """Internal helper to obtain status information on a dataset
 
     Parameters
@@ -138,6 +151,10 @@ def yield_dataset_status(ds, paths, annexinfo, untracked, recursion_limit,
       on the subdataset's submodule in a superdataset (depth-first).
       Alternatively, report all superdataset records first, before reporting
       any subdataset content records (breadth-first).
+    jobs : int or 'auto', optional
+      If given, the status of subdatasets is evaluated in (at most) this
+      many parallel threads, ahead of reporting. The order of reports is
+      not affected.
 
     Yields
     ------
@@ -156,6 +173,35 @@ def yield_dataset_status(ds, paths, annexinfo, untracked, recursion_limit,
     if ds.pathobj in queried:
         # do not report on a single dataset twice
         return
+    fetch = TreeQueryPrefetcher(
+        partial(
+            _query_dataset_status,
+            annexinfo=annexinfo,
+            untracked=untracked,
+            eval_submodule_state=eval_submodule_state,
+            cache=cache,
+        ),
+        key=lambda node: node[0].pathobj,
+        jobs=jobs,
+    )
+    try:
+        yield from _yield_dataset_status(
+            fetch, (ds, paths, recursion_limit), queried, reporting_order)
+    finally:
+        fetch.close()
+
+
+def _query_dataset_status(node, annexinfo, untracked, eval_submodule_state,
+                          cache):
+    """Internal helper of yield_dataset_status() to query a single dataset
+
+    Returns
+    -------
+    dict, list
+      The status of the dataset, and the (dataset, paths, recursion limit)
+      query specifications of the subdatasets to recurse into.
+    """
+    ds, paths, recursion_limit = node
     # take the dataset that went in first
     repo = ds.repo
     repo_path = repo.pathobj
@@ -169,14 +215,43 @@ def yield_dataset_status(ds, paths, annexinfo, untracked, recursion_limit,
         untracked=untracked,
         eval_submodule_state=eval_submodule_state,
         _cache=cache)
-    if annexinfo and hasattr(repo, 'get_content_annexinfo'):
-        lgr.debug('Querying %s.get_content_annexinfo() for paths: %s', repo, paths)
-        # this will amend `status`
-        repo.get_content_annexinfo(
-            paths=paths,
-            init=status,
-            eval_availability=annexinfo in ('availability', 'all'),
-            ref=None)
+    if annexinfo and hasattr(repo, 'iter_content_annexinfo'):
+        lgr.debug('Querying %s.iter_content_annexinfo() for paths: %s', repo, paths)
+        # this will amend `status`, while the git-annex report is read
+        for path, props in repo.iter_content_annexinfo(
+                paths=paths,
+                init=status,
+                eval_availability=annexinfo in ('availability', 'all'),
+                ref=None):
+            status[path] = props
+    subds_nodes = []
+    if not recursion_limit:
+        return status, subds_nodes
+    for path, props in status.items():
+        if props.get('type', None) != 'dataset':
+            continue
+        cpath = ds.pathobj / path.relative_to(repo_path)
+        if cpath == ds.pathobj:
+            # ATM can happen if there is something wrong with this repository
+            # We will just skip it here and rely on some other exception to bubble up
+            # See https://github.com/datalad/datalad/pull/4526 for the usecase
+            lgr.debug("Got status for itself, which should not happen, skipping %s", path)
+            continue
+        subds = Dataset(str(cpath))
+        if subds.is_installed():
+            subds_nodes.append((subds, None, recursion_limit - 1))
+    return status, subds_nodes
+
+
+def _yield_dataset_status(fetch, node, queried, reporting_order):
+    """Internal helper of yield_dataset_status() to report in order"""
+    ds = node[0]
+    if ds.pathobj in queried:
+        # do not report on a single dataset twice
+        return
+    status, subds_nodes = fetch(node)
+    subds_nodes = {n[0].pathobj: n for n in subds_nodes}
+    repo_path = ds.repo.pathobj
     # potentially collect subdataset status call specs for the end
     # (if order == 'breadth-first')
     subds_statuscalls = []
@@ -190,37 +265,19 @@ def yield_dataset_status(ds, paths, annexinfo, untracked, recursion_limit,
             parentds=ds.path,
         )
         queried.add(ds.pathobj)
-        if recursion_limit and props.get('type', None) == 'dataset':
-            if cpath == ds.pathobj:
-                # ATM can happen if there is something wrong with this repository
-                # We will just skip it here and rely on some other exception to bubble up
-                # See https://github.com/datalad/datalad/pull/4526 for the usecase
-                lgr.debug("Got status for itself, which should not happen, skipping %s", path)
-                continue
-            subds = Dataset(str(cpath))
-            if subds.is_installed():
-                call_args = (
-                    subds,
-                    None,
-                    annexinfo,
-                    untracked,
-                    recursion_limit - 1,
-                    queried,
-                    eval_submodule_state,
-                    None,
-                    cache,
-                )
-                call_kwargs = dict(
-                    reporting_order='depth-first',
-                )
-                if reporting_order == 'depth-first':
-                    yield from yield_dataset_status(*call_args, **call_kwargs)
-                else:
-                    subds_statuscalls.append((call_args, call_kwargs))
+        subds_node = subds_nodes.get(cpath)
+        if subds_node is None:
+            continue
+        if reporting_order == 'depth-first':
+            yield from _yield_dataset_status(
+                fetch, subds_node, queried, 'depth-first')
+        else:
+            subds_statuscalls.append(subds_node)
 
     # deal with staged subdataset status calls
-    for call_args, call_kwargs in subds_statuscalls:
-        yield from yield_dataset_status(*call_args, **call_kwargs)
+    for subds_node in subds_statuscalls:
+        yield from _yield_dataset_status(
+            fetch, subds_node, queried, 'depth-first')
 
 
 @build_doc
@@ -370,7 +427,8 @@ class Status(Interface):
             recursive=False,
             recursion_limit=None,
             eval_subdataset_state='full',
-            report_filetype=None):
+            report_filetype=None,
+            jobs=None):
         if report_filetype is not None:
             warnings.warn(
                 "status(report_filetype=) no longer supported, and will be removed "
@@ -411,7 +469,8 @@ class Status(Interface):
                     eval_subdataset_state,
                     None,
                     content_info_cache,
-                    reporting_order='depth-first'):
+                    reporting_order='depth-first',
+                    jobs=jobs):
                 if 'status' not in r:
                     r['status'] = 'ok'
                 yield dict(
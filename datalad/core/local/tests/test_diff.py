@@ -332,6 +332,20 @@ def test_diff_recursive(path=None):
         action='diff', state='modified', path=sub.path, type='dataset')
 
 
+@with_tempfile(mkdir=True)
+def test_diff_jobs(path=None):
+    ds = get_deeply_nested_structure(path)
+    for kwargs in (dict(recursive=True),
+                   dict(recursive=True, annex='basic', untracked='all'),
+                   dict(recursive=True, fr=DEFAULT_BRANCH + '~1')):
+        target = ds.diff(result_renderer='disabled', **kwargs)
+        # parallel evaluation of subdatasets does not change the reports
+        # or their order
+        for jobs in (1, 3):
+            eq_(ds.diff(result_renderer='disabled', jobs=jobs, **kwargs),
+                target)
+
+
 # https://github.com/datalad/datalad/issues/3725
 @known_failure_githubci_win
 @with_tempfile(mkdir=True)
@@ -542,8 +556,8 @@ def test_diff_fr_none_one_get_content_annexinfo_call(path=None):
     ds = Dataset(path).create()
     (ds.pathobj / "foo").write_text("foo")
     ds.save()
-    # get_content_annexinfo() is expensive.  If fr=None, we should
-    # only need to call it once.
-    with patch.object(AnnexRepo, "get_content_annexinfo") as gca:
+    # querying annex info (iter_content_annexinfo()) is expensive.  If
+    # fr=None, we should only need to call it once.
+    with patch.object(AnnexRepo, "iter_content_annexinfo") as gca:
         res = ds.diff(fr=None, to="HEAD", annex="all", result_renderer='disabled')
         eq_(gca.call_count, 1)
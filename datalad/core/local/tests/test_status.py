@@ -277,6 +277,21 @@ def test_subds_status(path=None):
         refds=subds.path)
 
 
+@with_tempfile(mkdir=True)
+def test_status_jobs(path=None):
+    ds = get_deeply_nested_structure(path)
+    for kwargs in (dict(recursive=True),
+                   dict(recursive=True, annex='basic', untracked='all'),
+                   dict(recursive=True, recursion_limit=1),
+                   dict(path='subds_modified', recursive=True)):
+        target = ds.status(result_renderer='disabled', **kwargs)
+        # parallel evaluation of subdatasets does not change the reports
+        # or their order
+        for jobs in (1, 3):
+            eq_(ds.status(result_renderer='disabled', jobs=jobs, **kwargs),
+                target)
+
+
 @with_tempfile
 def test_status_symlinked_dir_within_repo(path=None):
     if not has_symlink_capability():
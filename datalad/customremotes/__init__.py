@@ -12,13 +12,22 @@
 
 __docformat__ = 'restructuredtext'
 
-__all__ = ['RemoteError', 'SpecialRemote']
+__all__ = ['Master', 'RemoteError', 'SpecialRemote']
+
+import queue
+import sys
+import threading
+import traceback
+from contextvars import ContextVar
 
 from annexremote import (
+    Master as _Master,
     ProtocolError,
     SpecialRemote as _SpecialRemote,
     RemoteError as _RemoteError,
+    UnsupportedRequest,
 )
+from annexremote.annexremote import Protocol as _Protocol
 from datalad.support.exceptions import format_exception_with_cause
 
 
@@ -52,6 +61,10 @@ class RemoteError(_RemoteError):
 class SpecialRemote(_SpecialRemote):
     """Common base class for all of DataLad's special remote implementations"""
 
+    # whether the implementation can handle concurrent requests from
+    # multiple threads (see `Master`)
+    SUPPORTS_ASYNC = False
+
     def message(self, msg, type='debug'):
         handler = dict(
             debug=self.annex.debug,
@@ -70,3 +83,144 @@ class SpecialRemote(_SpecialRemote):
             # If we can't have an actual info message, at least have a
             # debug message.
             self.annex.debug(msg)
+
+
+# job number of the request processed in the current thread, if the ASYNC
+# protocol extension is in use
+_current_job = ContextVar('_current_job', default=None)
+
+
+class _AsyncProtocol(_Protocol):
+    """Protocol that accepts the ASYNC extension if the remote supports it"""
+
+    def __init__(self, remote):
+        super().__init__(remote)
+        self.async_ = False
+
+    def do_EXTENSIONS(self, param):
+        reply = super().do_EXTENSIONS(param)
+        if 'ASYNC' in self.extensions \
+                and getattr(self.remote, 'SUPPORTS_ASYNC', False):
+            self.async_ = True
+            reply += ' ASYNC'
+        return reply
+
+
+class _JobInput(object):
+    """Input that provides the replies of git-annex to the current job"""
+
+    def __init__(self, master, input):
+        self._master = master
+        self._input = input
+
+    def readline(self):
+        job = _current_job.get()
+        if job is None:
+            return self._input.readline()
+        return self._master._get_job_queue(job).get()
+
+
+class Master(_Master):
+    """annexremote's Master with support for the ASYNC protocol extension
+
+    If the linked remote declares `SUPPORTS_ASYNC`, and git-annex offers the
+    ASYNC extension, git-annex sends all requests of its concurrent jobs
+    (``-J``) to a single special remote process, prefixed with a job
+    number. Each job is then processed in its own thread, and all messages
+    sent on behalf of a job carry its job number. Any thread started while
+    processing a job must be run in a copy of the job's context (see
+    `contextvars.copy_context()`) to send messages, like progress reports,
+    on behalf of the job.
+    """
+
+    def __init__(self, output=sys.stdout):
+        super().__init__(output=output)
+        self._send_lock = threading.Lock()
+        self._jobs = {}
+        self._jobs_lock = threading.Lock()
+        self._failed = False
+
+    def LinkRemote(self, remote):
+        self.remote = remote
+        self.protocol = _AsyncProtocol(remote)
+
+    def Listen(self, input=sys.stdin):
+        if not (hasattr(self, "remote") and hasattr(self, "protocol")):
+            return super().Listen(input=input)
+
+        self.input = _JobInput(self, input)
+        self._send(self.protocol.version)
+        threads = []
+        while not self._failed:
+            line = input.readline()
+            if not line:
+                break
+            line = line.rstrip()
+            if self.protocol.async_ and line.startswith('J '):
+                try:
+                    _, job, request = line.split(' ', 2)
+                except ValueError:
+                    raise SyntaxError('Expected J n REQUEST, got %r' % line)
+                with self._jobs_lock:
+                    job_queue = self._jobs.get(job)
+                    if job_queue is None:
+                        # a new job
+                        self._jobs[job] = queue.Queue()
+                if job_queue is not None:
+                    # reply to a request of a running job
+                    job_queue.put(request)
+                    continue
+                thread = threading.Thread(
+                    target=self._run_job, args=(job, request))
+                thread.start()
+                threads = [t for t in threads if t.is_alive()]
+                threads.append(thread)
+            elif not self._process_request(line):
+                raise SystemExit
+        for thread in threads:
+            thread.join()
+        if self._failed:
+            raise SystemExit
+
+    def _get_job_queue(self, job):
+        with self._jobs_lock:
+            return self._jobs[job]
+
+    def _run_job(self, job, request):
+        _current_job.set(job)
+        if not self._process_request(request, job=job):
+            self._failed = True
+
+    def _process_request(self, line, job=None):
+        """Process a request and send the reply
+
+        Returns
+        -------
+        bool
+          False, if processing failed fatally.
+        """
+        try:
+            reply = self.protocol.command(line)
+        except UnsupportedRequest:
+            reply = "UNSUPPORTED-REQUEST"
+        except Exception as e:
+            for tb_line in traceback.format_exc().splitlines():
+                self.debug(tb_line)
+            self.error(e)
+            return False
+        finally:
+            if job is not None:
+                # the job number may be reused by git-annex as soon as the
+                # reply is sent
+                with self._jobs_lock:
+                    del self._jobs[job]
+        if reply:
+            self._send(reply)
+        return True
+
+    def _send(self, *args, **kwargs):
+        job = _current_job.get()
+        if job is not None:
+            args = ('J', job) + args
+        with self._send_lock:
+            super()._send(*args, **kwargs)
@@ -14,7 +14,11 @@ import logging
 import os
 import os.path as op
 import shutil
-from collections import OrderedDict
+import threading
+from collections import (
+    OrderedDict,
+    defaultdict,
+)
 from operator import itemgetter
 from pathlib import Path
 from urllib.parse import urlparse
@@ -94,6 +98,10 @@ class ArchiveAnnexCustomRemote(AnnexCustomRemote):
 
     AVAILABILITY = "local"
     COST = 500
+    # concurrent jobs share the extraction cache. Archives are obtained and
+    # extracted by one job at a time, and queries of batched annex commands
+    # are serialized
+    SUPPORTS_ASYNC = True
 
     def __init__(self, annex, path=None, persistent_cache=True, **kwargs):
         super().__init__(annex)
@@ -110,8 +118,18 @@ class ArchiveAnnexCustomRemote(AnnexCustomRemote):
         # heuristic let's use the most recently asked one
 
         self._last_url = None  # for heuristic to choose among multiple URLs
-        self._cache = ArchivesCache(self.path, persistent=persistent_cache)
+        config = self.repo.config
+        self._cache = ArchivesCache(
+            self.path,
+            persistent=persistent_cache,
+            # no size budget by default
+            max_size=config.obtain('datalad.archives.cache-size')
+            if 'datalad.archives.cache-size' in config else None)
         self._contentlocations = DictCache(size_limit=100)  # TODO: config ?
+        # guards batched annex commands and the caches of their results
+        self._repo_lock = threading.RLock()
+        # per archive key, guards obtaining and extracting an archive
+        self._archive_locks = defaultdict(threading.Lock)
 
     def stop(self, *args):
         """Stop communication with annex"""
@@ -259,17 +277,18 @@ class ArchiveAnnexCustomRemote(AnnexCustomRemote):
         caching of the result (we are asking the location for the same archive
         key often)
         """
-        if key not in self._contentlocations:
-            fpath = self.repo.get_contentlocation(key, batch=True)
-            if fpath:  # shouldn't store empty ones
-                self._contentlocations[key] = fpath
-        else:
-            fpath = self._contentlocations[key]
-            # but verify that it exists
-            if verify_exists and not op.lexists(op.join(self.path, fpath)):
-                # prune from cache
-                del self._contentlocations[key]
-                fpath = ''
+        with self._repo_lock:
+            if key not in self._contentlocations:
+                fpath = self.repo.get_contentlocation(key, batch=True)
+                if fpath:  # shouldn't store empty ones
+                    self._contentlocations[key] = fpath
+            else:
+                fpath = self._contentlocations[key]
+                # but verify that it exists
+                if verify_exists and not op.lexists(op.join(self.path, fpath)):
+                    # prune from cache
+                    del self._contentlocations[key]
+                    fpath = ''
 
         if absolute and fpath:
             return op.join(self.path, fpath)
@@ -325,9 +344,11 @@ class ArchiveAnnexCustomRemote(AnnexCustomRemote):
         # the same archive, so let's not ask it twice since here we don't care
         # about "afile"
         for akey, _ in self._gen_akey_afiles(key, unique_akeys=True):
-            if self.get_contentlocation(akey) \
-                    or self.repo.is_available(akey, batch=True, key=True):
+            if self.get_contentlocation(akey):
                 return True
+            with self._repo_lock:
+                if self.repo.is_available(akey, batch=True, key=True):
+                    return True
         # it is unclear to MIH why this must be UNKNOWN rather than FALSE
         # but this is how I found it
         raise RemoteError('Key not present')
@@ -373,52 +394,30 @@ class ArchiveAnnexCustomRemote(AnnexCustomRemote):
                             akey, key)
                 continue
             akeys_tried.append(akey)
+            with self._repo_lock:
+                archive_lock = self._archive_locks[akey]
             try:
-                with lock_if_check_fails(
-                    check=(self.get_contentlocation, (akey,)),
-                    lock_path=(
-                        lambda k: op.join(self.repo.path,
-                                          '.git',
-                                          'datalad-archives-%s' % k),
-                        (akey,)),
-                    operation="annex-get"
-                ) as (akey_fpath, lock):
-                    if lock:
-                        assert not akey_fpath
-                        self._annex_get_archive_by_key(akey)
-                        akey_fpath = self.get_contentlocation(akey)
-
-                if not akey_fpath:
-                    raise RuntimeError(
-                        "We were reported to fetch it alright but now can't "
-                        "get its location.  Check logic"
-                    )
-
-                akey_path = op.join(self.repo.path, akey_fpath)
-                assert op.exists(akey_path), \
-                       "Key file %s is not present" % akey_path
-
-                # Extract that bloody file from the bloody archive
-                # TODO: implement/use caching, for now a simple one
-                #  actually patool doesn't support extraction of a single file
-                #  https://github.com/wummel/patool/issues/20
-                # so
-                pwd = getpwd()
+                with archive_lock:
+                    akey_path = self._get_archive(akey)
+                earchive = self.cache[akey_path]
+                # read just the requested file from the archive, unless it
+                # was extracted already anyways
+                if not earchive.is_extracted \
+                        and earchive.extract_file(afile, file):
+                    return
+                # Extract that bloody archive, all other files requested
+                # from it will be served from the cache
                 lgr.debug(
-                    "Getting file {afile} from {akey_path} "
-                    "while PWD={pwd}".format(**locals()))
-                was_extracted = self.cache[akey_path].is_extracted
-                apath = self.cache[akey_path].get_extracted_file(afile)
-                link_file_load(apath, file)
-                if not was_extracted and self.cache[akey_path].is_extracted:
-                    self.message(
-                        "%s special remote is using an extraction cache "
-                        "under %s. Remove it with DataLad's 'clean' "
-                        "command to save disk space." %
-                        (ARCHIVES_SPECIAL_REMOTE,
-                         self.cache[akey_path].path),
-                        type='info',
-                    )
+                    "Getting {akey_path} extracted while PWD={pwd}".format(
+                        akey_path=akey_path, pwd=getpwd()))
+                with earchive.use():
+                    with archive_lock:
+                        was_extracted = earchive.is_extracted
+                        earchive.assure_extracted()
+                    apath = earchive.get_extracted_file(afile)
+                    link_file_load(apath, file)
+                if not was_extracted:
+                    self._report_cache()
                 return
             except Exception as exc:
                 ce = CapturedException(exc)
@@ -437,6 +436,53 @@ class ArchiveAnnexCustomRemote(AnnexCustomRemote):
             "Tried: {akeys_tried}".format(**locals())
         )
 
+    def _report_cache(self):
+        """Evict from the extraction cache if needed, and hint users to it"""
+        from humanize import naturalsize
+
+        self.cache.evict()
+        stats = self.cache.get_stats()
+        self.message(
+            "%s special remote is using an extraction cache under %s "
+            "(%d archives, %s%s). Remove it with DataLad's 'clean' "
+            "command to save disk space." % (
+                ARCHIVES_SPECIAL_REMOTE,
+                stats['path'],
+                stats['archives'],
+                naturalsize(stats['size']),
+                '' if stats['max_size'] is None
+                else ' of at most %s' % naturalsize(stats['max_size'])),
+            type='info',
+        )
+
+    def _get_archive(self, akey):
+        """Obtain an archive, if needed, and return its path"""
+        with lock_if_check_fails(
+            check=(self.get_contentlocation, (akey,)),
+            lock_path=(
+                lambda k: op.join(self.repo.path,
+                                  '.git',
+                                  'datalad-archives-%s' % k),
+                (akey,)),
+            operation="annex-get"
+        ) as (akey_fpath, lock):
+            if lock:
+                assert not akey_fpath
+                self._annex_get_archive_by_key(akey)
+                akey_fpath = self.get_contentlocation(akey)
+
+        if not akey_fpath:
+            raise RuntimeError(
+                "We were reported to fetch it alright but now can't "
+                "get its location.  Check logic"
+            )
+
+        akey_path = op.join(self.repo.path, akey_fpath)
+        assert op.exists(akey_path), \
+               "Key file %s is not present" % akey_path
+
+        return akey_path
+
     def claimurl(self, url):
         scheme = urlparse(url).scheme
         if scheme in self.SUPPORTED_SCHEMES:
@@ -32,6 +32,9 @@ class DataladAnnexCustomRemote(AnnexCustomRemote):
     """
 
     SUPPORTED_SCHEMES = ('http', 'https', 's3', 'shub')
+    # downloads for concurrent jobs share the downloaders (and thereby
+    # their sessions) of the providers
+    SUPPORTS_ASYNC = True
 
     def __init__(self, annex, **kwargs):
         super().__init__(annex)
@@ -46,7 +46,7 @@ def setup_parser(remote_name, description):
 def _main(args, cls):
     """Unprotected portion"""
     assert(cls is not None)
-    from annexremote import Master
+    from datalad.customremotes import Master
     master = Master()
     remote = cls(master)
     master.LinkRemote(remote)
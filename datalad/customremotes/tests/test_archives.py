@@ -114,9 +114,9 @@ def test_basic_scenario(d=None, d2=None):
 
     with swallow_logs(new_level=logging.INFO) as cml:
         annex.get(fn_extracted)
-        # Hint users to the extraction cache (and to datalad clean)
-        cml.assert_logged(msg="datalad-archives special remote is using an "
-                              "extraction", level="INFO", regex=False)
+        # the file is read directly from the tarball, so there is no
+        # extraction cache to hint users to
+        assert_not_in("is using an extraction cache", cml.out)
     assert_true(annex.file_has_content(fn_extracted))
 
     annex.rm_url(fn_extracted, file_url)
@@ -9,6 +9,8 @@
 """Tests for the base of our custom remotes"""
 
 
+import queue
+import threading
 from os.path import isabs
 
 import pytest
@@ -20,6 +22,7 @@ from datalad.api import (
 from datalad.consts import DATALAD_SPECIAL_REMOTE
 from datalad.support.annexrepo import AnnexRepo
 from datalad.tests.utils_pytest import (
+    assert_equal,
     assert_false,
     assert_in,
     assert_not_in,
@@ -30,6 +33,10 @@ from datalad.tests.utils_pytest import (
 )
 from datalad.utils import Path
 
+from .. import (
+    Master,
+    SpecialRemote,
+)
 from ..archives import ArchiveAnnexCustomRemote
 from ..base import (
     ensure_datalad_remote,
@@ -86,3 +93,109 @@ def test_ensure_datalad_remote_maybe_enable(path=None, *, autoenable):
         assert_not_in("datalad", repo.get_remotes())
     ensure_datalad_remote(repo)
     assert_in("datalad", repo.get_remotes())
+
+
+class _FakeAnnex(object):
+    """Plays git-annex's part of the special remote protocol
+
+    Requests are read from a queue, replies of the special remote are
+    answered via `respond`. A request None closes the input.
+    """
+    def __init__(self, requests, respond):
+        self.lines = queue.Queue()
+        self.replies = []
+        self._respond = respond
+        self._buffer = ''
+        for r in requests:
+            self.lines.put(r)
+
+    # input of the special remote
+    def readline(self):
+        line = self.lines.get(timeout=10)
+        return '' if line is None else line + '\n'
+
+    # output of the special remote
+    def write(self, s):
+        self._buffer += s
+        while '\n' in self._buffer:
+            line, self._buffer = self._buffer.split('\n', 1)
+            self.replies.append(line)
+            for r in self._respond(line):
+                self.lines.put(r)
+
+    def flush(self):
+        pass
+
+
+def _run_remote(remote_cls, requests, respond):
+    annex = _FakeAnnex(requests, respond)
+    master = Master(output=annex)
+    master.LinkRemote(remote_cls(master))
+    master.Listen(input=annex)
+    return annex.replies
+
+
+def test_async_protocol():
+    # both jobs must be in progress at the same time
+    barrier = threading.Barrier(2, timeout=10)
+
+    class AsyncRemote(SpecialRemote):
+        SUPPORTS_ASYNC = True
+
+        def initremote(self):
+            pass
+
+        def prepare(self):
+            pass
+
+        def transfer_store(self, key, filename):
+            pass
+
+        def transfer_retrieve(self, key, filename):
+            urls = self.annex.geturls(key, 'http:')
+            assert_equal(urls, ['http://example.com/' + key])
+            barrier.wait()
+            self.annex.progress(10)
+
+        def checkpresent(self, key):
+            return True
+
+        def remove(self, key):
+            pass
+
+    done = []
+
+    def respond(line):
+        words = line.split(' ')
+        if words[2:3] == ['GETURLS']:
+            return ['J {} VALUE http://example.com/{}'.format(words[1], words[3]),
+                    'J {} VALUE'.format(words[1])]
+        if words[2:3] == ['TRANSFER-SUCCESS']:
+            done.append(words[4])
+            if len(done) == 2:
+                # no more requests
+                return [None]
+        return []
+
+    replies = _run_remote(
+        AsyncRemote,
+        ['EXTENSIONS INFO ASYNC',
+         'J 1 TRANSFER RETRIEVE K1 f1',
+         'J 2 TRANSFER RETRIEVE K2 f2'],
+        respond)
+    assert_equal(replies[:2], ['VERSION 1', 'EXTENSIONS ASYNC'])
+    assert_equal(sorted(done), ['K1', 'K2'])
+    for job, key in (('1', 'K1'), ('2', 'K2')):
+        assert_in('J {} GETURLS {} http:'.format(job, key), replies)
+        assert_in('J {} PROGRESS 10'.format(job), replies)
+        assert_in('J {} TRANSFER-SUCCESS RETRIEVE {}'.format(job, key),
+                  replies)
+
+    # without support, ASYNC is not accepted
+    AsyncRemote.SUPPORTS_ASYNC = False
+    replies = _run_remote(
+        AsyncRemote,
+        ['EXTENSIONS INFO ASYNC', 'CHECKPRESENT K1', None],
+        lambda line: [])
+    assert_equal(replies,
+                 ['VERSION 1', 'EXTENSIONS', 'CHECKPRESENT-SUCCESS K1'])
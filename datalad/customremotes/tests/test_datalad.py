@@ -11,8 +11,12 @@
 import glob
 import logging
 import os.path as op
+from time import sleep
+from unittest.mock import patch
 
 from datalad.distribution.dataset import Dataset
+from datalad.downloaders.http import HTTPDownloader
+from datalad.downloaders.providers import Providers
 from datalad.downloaders.tests.utils import get_test_providers
 from datalad.support.exceptions import CommandError
 from datalad.support.external_versions import external_versions
@@ -20,6 +24,8 @@ from datalad.tests.utils_pytest import (
     assert_in,
     assert_raises,
     eq_,
+    ok_file_has_content,
+    patch_config,
     serve_path_via_http,
     skip_if_no_network,
     swallow_logs,
@@ -27,6 +33,9 @@ from datalad.tests.utils_pytest import (
     with_tree,
 )
 
+from ..datalad import DataladAnnexCustomRemote
+from .test_base import _run_remote
+
 
 @with_tempfile()
 @skip_if_no_network
@@ -90,3 +99,54 @@ def test_basic_scenario_local_url(p=None, local_url=None):
 
 def test_basic_scenario_s3():
     check_basic_scenario('s3://datalad-test0-versioned/3versions-allversioned.txt')
+
+
+
+@with_tree(tree={'f1': 'content1', 'f2': 'content2'})
+@serve_path_via_http
+@with_tempfile(mkdir=True)
+def test_async_transfer_retrieve(path=None, url=None, dest=None):
+    sessions = []
+    get_new_session = HTTPDownloader._get_new_session
+
+    def slow_new_session():
+        sessions.append(get_new_session())
+        # give the other job the chance to set up a session meanwhile
+        sleep(0.2)
+        return sessions[-1]
+
+    done = []
+
+    def respond(line):
+        words = line.split(' ')
+        if words[2:3] == ['GETURLS']:
+            job, key, scheme = words[1], words[3], words[4]
+            return (['J {} VALUE {}{}'.format(job, url, key)]
+                    if scheme == 'http:' else []) + ['J {} VALUE'.format(job)]
+        if words[2:3] in (['TRANSFER-SUCCESS'], ['TRANSFER-FAILURE']):
+            done.append(words[4])
+            if len(done) == 2:
+                return [None]
+        return []
+
+    # no downloaders (and sessions) from previous uses of the providers, and
+    # no waiting for the authentication lock of other processes
+    with patch.object(Providers, 'from_config_files', Providers), \
+            patch_config({'datalad.locations.locks':
+                          op.join(dest, 'locks')}), \
+            patch.object(HTTPDownloader, '_get_new_session',
+                         staticmethod(slow_new_session)):
+        replies = _run_remote(
+            DataladAnnexCustomRemote,
+            ['EXTENSIONS INFO ASYNC'] + [
+                'J {i} TRANSFER RETRIEVE f{i} {}'.format(
+                    op.join(dest, 'f%d' % i), i=i)
+                for i in (1, 2)],
+            respond)
+    assert_in('EXTENSIONS ASYNC', replies)
+    for i in (1, 2):
+        assert_in('J {i} TRANSFER-SUCCESS RETRIEVE f{i}'.format(i=i), replies)
+    ok_file_has_content(op.join(dest, 'f1'), 'content1')
+    ok_file_has_content(op.join(dest, 'f2'), 'content2')
+    # both jobs shared the session of the downloader
+    eq_(len(sessions), 1)
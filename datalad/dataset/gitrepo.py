@@ -33,7 +33,9 @@ from weakref import (
 )
 
 from datalad.cmd import (
+    BatchedCommand,
     GitWitlessRunner,
+    SafeDelCloseMixin,
     StdOutErrCapture,
 )
 from datalad.config import ConfigManager
@@ -97,6 +99,148 @@ def _get_git_ignore_exception(exception):
     return None
 
 
+def _read_cat_file_object(stdout):
+    """Read a single response of `git cat-file --batch`
+
+    Returns
+    -------
+    tuple or None
+      `(hexsha, type, content)` for the requested object, or None if the
+      object could not be found.
+    """
+    header = stdout.readline()
+    if header is None:
+        return None
+    props = header.split()
+    if len(props) != 3:
+        # '<object> missing' or '<object> ambiguous'
+        return None
+    hexsha, objtype, size = props
+    size = int(size)
+    # the content is followed by a newline, and we get it split on newlines
+    # only, hence we can reassemble it verbatim, until we have consumed
+    # size + 1 bytes
+    lines = []
+    consumed = 0
+    while consumed <= size:
+        line = stdout.readline()
+        if line is None:
+            return None
+        lines.append(line)
+        consumed += len(line.encode(preferred_encoding, 'surrogateescape')) + 1
+    return hexsha, objtype, '\n'.join(lines)
+
+
+class GitCatFileReader(SafeDelCloseMixin):
+    """Persistent `git cat-file --batch[-check]` processes for a repository
+
+    Object lookups that would otherwise require one git process per
+    query (commit existence, hexsha resolution, blob content) are answered
+    via a pipe round-trip to long-lived `git cat-file` processes instead.
+    Both processes are started on first use, and are restarted transparently
+    when they have been closed (e.g. by the cleanup of inactive
+    `BatchedCommand` instances).
+    """
+    def __init__(self, path):
+        self.path = str(path)
+        # the processes handle a single request at a time, serialize
+        # access across threads
+        self._lock = threading.Lock()
+        self._check = None
+        self._contents = None
+
+    @staticmethod
+    def is_batchable(obj):
+        """Whether `obj` can be passed to a batch process at all"""
+        return bool(obj) and '\n' not in obj and '\r' not in obj
+
+    def check(self, obj):
+        """Query type and size of an object
+
+        Parameters
+        ----------
+        obj : str
+          Any object name understood by `git cat-file`, e.g.
+          'HEAD^{commit}' or 'HEAD:.datalad/config'.
+
+        Returns
+        -------
+        tuple or None
+          `(hexsha, type, size)`, or None if the object does not exist.
+
+        Raises
+        ------
+        CommandError
+          If no response could be obtained from the git process.
+        """
+        with self._lock:
+            if self._check is None:
+                self._check = BatchedCommand(
+                    GitRepo._git_cmd_prefix + ['cat-file', '--batch-check'],
+                    path=self.path,
+                    # cat-file only reads, it is safe to terminate it
+                    terminate_on_close=True,
+                )
+            out = self._check(obj)
+        if out is None:
+            raise CommandError(
+                cmd=self._check.command,
+                msg='No response for object {!r}'.format(obj),
+                code=self._check.return_code,
+                cwd=self.path)
+        props = out.split()
+        if len(props) != 3:
+            return None
+        hexsha, objtype, size = props
+        return hexsha, objtype, int(size)
+
+    def contents(self, obj):
+        """Query type and content of an object
+
+        Parameters
+        ----------
+        obj : str
+          Any object name understood by `git cat-file`.
+
+        Returns
+        -------
+        tuple or None
+          `(hexsha, type, content)`, or None if the object does not exist.
+          The content is decoded to str, undecodable bytes are represented
+          as surrogates (see `surrogateescape` error handler).
+
+        Raises
+        ------
+        CommandError
+          If no response could be obtained from the git process.
+        """
+        with self._lock:
+            if self._contents is None:
+                self._contents = BatchedCommand(
+                    GitRepo._git_cmd_prefix + ['cat-file', '--batch'],
+                    path=self.path,
+                    output_proc=_read_cat_file_object,
+                    line_separator='\n',
+                    terminate_on_close=True,
+                )
+            out = self._contents(obj)
+            if out is None and not self._contents.process_running():
+                raise CommandError(
+                    cmd=self._contents.command,
+                    msg='No response for object {!r}'.format(obj),
+                    code=self._contents.return_code,
+                    cwd=self.path)
+        return out
+
+    def close(self):
+        """Terminate all running `git cat-file` processes"""
+        for p in (self._check, self._contents):
+            if p is not None:
+                # terminates without waiting (see `terminate_on_close`),
+                # this is also called from a finalizer, which must not block
+                p.close()
+
+
 @path_based_str_repr
 class GitRepo(RepoInterface, metaclass=PathBasedFlyweight):
     """Representation of a Git repository
@@ -119,12 +263,18 @@ class GitRepo(RepoInterface, metaclass=PathBasedFlyweight):
         pass
 
     @classmethod
-    def _cleanup(cls, path):
+    def _cleanup(cls, path, cat_file=None):
         # Ben: I think in case of GitRepo there's nothing to do ATM. Statements
         #      like the one in the out commented __del__ above, don't make sense
         #      with python's GC, IMO, except for manually resolving cyclic
         #      references (not the case w/ ConfigManager ATM).
         lgr.log(1, "Finalizer called on: GitRepo(%s)", path)
+        if cat_file is not None:
+            try:
+                cat_file.close()
+            except TypeError:
+                # too late in the GC game, the process will go away anyway
+                pass
 
     def __hash__(self):
         # the flyweight key is already determining unique instances
@@ -152,13 +302,18 @@ class GitRepo(RepoInterface, metaclass=PathBasedFlyweight):
 
         self._line_splitter = None
 
+        # persistent `git cat-file` processes for object lookups, started on
+        # demand
+        self._cat_file = GitCatFileReader(self.pathobj)
+
         # Finally, register a finalizer (instead of having a __del__ method).
         # This will be called by garbage collection as well as "atexit". By
         # keeping the reference here, we can also call it explicitly.
         # Note, that we can pass required attributes to the finalizer, but not
         # `self` itself. This would create an additional reference to the object
         # and thereby preventing it from being collected at all.
-        self._finalizer = finalize(self, GitRepo._cleanup, self.pathobj)
+        self._finalizer = finalize(self, GitRepo._cleanup, self.pathobj,
+                                   self._cat_file)
 
     def __eq__(self, obj):
         """Decides whether or not two instances of this class are equal.
@@ -526,6 +681,57 @@ class GitRepo(RepoInterface, metaclass=PathBasedFlyweight):
             return False
         return True
 
+    def cat_file_check(self, obj):
+        """Report hexsha, type, and size of a Git object
+
+        The query is answered by a persistent `git cat-file --batch-check`
+        process, hence repeated calls do not spawn new processes.
+
+        Parameters
+        ----------
+        obj : str
+          Any object name understood by `git cat-file`, e.g.
+          'HEAD^{commit}', or 'HEAD:.datalad/config'.
+
+        Returns
+        -------
+        tuple or None
+          `(hexsha, type, size)`, or None if no object could be found.
+
+        Raises
+        ------
+        ValueError
+          If `obj` cannot be communicated to a batch process (e.g. contains
+          a newline).
+        """
+        _check_batchable(obj)
+        return self._cat_file.check(obj)
+
+    def cat_file(self, obj):
+        """Report hexsha, type, and content of a Git object
+
+        The query is answered by a persistent `git cat-file --batch`
+        process, hence repeated calls do not spawn new processes.
+
+        Parameters
+        ----------
+        obj : str
+          Any object name understood by `git cat-file`.
+
+        Returns
+        -------
+        tuple or None
+          `(hexsha, type, content)`, or None if no object could be found.
+
+        Raises
+        ------
+        ValueError
+          If `obj` cannot be communicated to a batch process (e.g. contains
+          a newline).
+        """
+        _check_batchable(obj)
+        return self._cat_file.contents(obj)
+
     def init(self, sanity_checks=True, init_options=None):
         """Initializes the Git repository.
 
@@ -657,6 +863,13 @@ class GitRepo(RepoInterface, metaclass=PathBasedFlyweight):
 #
 # Internal helpers
 #
+def _check_batchable(obj):
+    if not GitCatFileReader.is_batchable(obj):
+        raise ValueError(
+            "Object name cannot be queried via git cat-file --batch: "
+            "{!r}".format(obj))
+
+
 def _get_dot_git(pathobj, *, ok_missing=False, resolved=False):
     """Given a pathobj to a repository return path to the .git directory
 
@@ -11,6 +11,7 @@
 """
 
 import logging
+import threading
 
 from datalad.support.exceptions import InvalidInstanceRequestError
 from datalad.support.network import RI
@@ -18,6 +19,9 @@ from datalad import utils as ut
 
 lgr = logging.getLogger('datalad.repo')
 
+# guards the registries of all flyweight classes
+_flyweight_lock = threading.RLock()
+
 
 class Flyweight(type):
     """Metaclass providing an implementation of the flyweight pattern.
@@ -143,31 +147,35 @@ class Flyweight(type):
 
     def __call__(cls, *args, **kwargs):
 
-        id_, new_args, new_kwargs = cls._flyweight_id_from_args(*args, **kwargs)
-        instance = cls._unique_instances.get(id_, None)
-
-        if instance is None or instance._flyweight_invalid():
-            # we have no such instance yet or the existing one is invalidated,
-            # so we instantiate:
-            instance = type.__call__(cls, *new_args, **new_kwargs)
-            cls._unique_instances[id_] = instance
-        else:
-            # we have an instance already that is not invalid itself; check
-            # whether there is a conflict, otherwise return existing one:
-            # TODO
-            # Note, that this might (and probably should) go away, when we
-            # decide how to deal with currently possible invalid constructor
-            # calls for the repo classes. In particular this is about calling
-            # it with different options than before, that might lead to
-            # fundamental changes in the repository (like annex repo version
-            # change or re-init of git)
-
-            # force? may not mean the same thing
-            msg = cls._flyweight_reject(id_, *new_args, **new_kwargs)
-            if msg is not None:
-                raise InvalidInstanceRequestError(id_, msg)
-
-        return instance
+        # instances might be requested from parallel threads, and neither
+        # must create a second instance for the same ID. The lock is
+        # reentrant, as constructors can request other flyweights
+        with _flyweight_lock:
+            id_, new_args, new_kwargs = cls._flyweight_id_from_args(*args, **kwargs)
+            instance = cls._unique_instances.get(id_, None)
+
+            if instance is None or instance._flyweight_invalid():
+                # we have no such instance yet or the existing one is invalidated,
+                # so we instantiate:
+                instance = type.__call__(cls, *new_args, **new_kwargs)
+                cls._unique_instances[id_] = instance
+            else:
+                # we have an instance already that is not invalid itself; check
+                # whether there is a conflict, otherwise return existing one:
+                # TODO
+                # Note, that this might (and probably should) go away, when we
+                # decide how to deal with currently possible invalid constructor
+                # calls for the repo classes. In particular this is about calling
+                # it with different options than before, that might lead to
+                # fundamental changes in the repository (like annex repo version
+                # change or re-init of git)
+
+                # force? may not mean the same thing
+                msg = cls._flyweight_reject(id_, *new_args, **new_kwargs)
+                if msg is not None:
+                    raise InvalidInstanceRequestError(id_, msg)
+
+            return instance
 
 
 class PathBasedFlyweight(Flyweight):
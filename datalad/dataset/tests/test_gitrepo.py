@@ -259,6 +259,37 @@ def test_gitrepo_call_git_methods(path=None):
         assert_not_in("expected blob type", cml.out)
 
 
+@with_tree({"foo": "foo\r\ncontent\n\n", "bar": "", "baz": "b\u00e4z"})
+def test_gitrepo_cat_file(path=None):
+    gr = GitRepo(path).init()
+    eq_(gr.cat_file_check("HEAD^{commit}"), None)
+    eq_(gr.cat_file("HEAD^{commit}"), None)
+    gr.call_git(['add', "foo", "bar", "baz"])
+    gr.call_git(['commit', '-m', "foobar"])
+
+    hexsha = gr.call_git_oneline(['rev-parse', 'HEAD'], read_only=True)
+    rec = gr.cat_file_check("HEAD^{commit}")
+    eq_(rec[:2], (hexsha, 'commit'))
+    for f, content in (("foo", "foo\r\ncontent\n\n"),
+                       ("bar", ""),
+                       ("baz", "b\u00e4z")):
+        eq_(gr.cat_file("HEAD:" + f)[1:], ('blob', content))
+        eq_(gr.cat_file_check("HEAD:" + f)[1:],
+            ('blob', len(content.encode('utf-8'))))
+    eq_(gr.cat_file_check("HEAD:nothere"), None)
+    eq_(gr.cat_file("HEAD:nothere"), None)
+    # the processes are kept around and reflect repository changes
+    gr.call_git(['commit', '--allow-empty', '-m', "second"])
+    hexsha2 = gr.call_git_oneline(['rev-parse', 'HEAD'], read_only=True)
+    neq_(hexsha, hexsha2)
+    eq_(gr.cat_file_check("HEAD")[0], hexsha2)
+    ok_(gr.cat_file("HEAD")[2].endswith("\n\nsecond\n"))
+    # a closed reader restarts on demand
+    gr._cat_file.close()
+    eq_(gr.cat_file_check("HEAD~1")[0], hexsha)
+    assert_raises(ValueError, gr.cat_file, "HEAD:new\nline")
+
+
 @with_tree(tree={"foo": "foo content",
                  "bar": "bar content"})
 def test_fake_dates(path=None):
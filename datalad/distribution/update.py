@@ -592,11 +592,11 @@ def _reobtain(ds, update_fn):
         # get all annexed files that have data present
         lgr.info('Recording file content availability '
                  'to re-obtain updated files later on')
-        ainfo = repo.get_content_annexinfo(
+        ainfo = repo.iter_content_annexinfo(
             init=None, eval_availability=True)
         # Recode paths for ds.get() call.
         present_files = [str(ds.pathobj / f.relative_to(repo_pathobj))
-                         for f, st in ainfo.items() if st["has_content"]]
+                         for f, st in ainfo if st["has_content"]]
 
         yield from update_fn(*args, **kwargs)
 
@@ -15,6 +15,7 @@ __docformat__ = 'restructuredtext'
 import msgpack
 import os
 import sys
+import threading
 import time
 
 from abc import ABCMeta, abstractmethod
@@ -68,11 +69,35 @@ class DownloaderSession(object):
         self.headers = headers
         self.url = url
 
+    # whether .download_resumable can be used
+    resumable = False
+
     def download(self, f=None, pbar=None, size=None):
         raise NotImplementedError("must be implemented in subclases")
 
         # TODO: get_status ?
 
+    def download_resumable(self, filepath, pbar=None):
+        """Download into a file, continuing a previous partial download
+
+        Must only be used if `resumable` is True. If the download fails or
+        gets interrupted, the partially downloaded `filepath` (and its
+        accompanying state file, see `get_resume_state_filename`) can be
+        passed to a later call to continue the download.
+
+        Raises
+        ------
+        IncompleteDownloadError
+          If not all content could be downloaded.
+        """
+        raise NotImplementedError("must be implemented in subclases")
+
+    @staticmethod
+    def get_resume_state_filename(filepath):
+        """Return the name of the file recording the state of a partial download
+        """
+        return filepath + "-state"
+
 
 @auto_repr
 class BaseDownloader(object, metaclass=ABCMeta):
@@ -112,6 +137,10 @@ class BaseDownloader(object, metaclass=ABCMeta):
         self.credential = credential
         self.authenticator = authenticator
         self._cache = None  # for fetches, not downloads
+        # the InterProcessLock used in access() does not exclude threads of
+        # the same process, which might share this downloader (e.g. jobs of
+        # a special remote)
+        self._session_lock = threading.RLock()
 
     def access(self, method, url, allow_old_session=True, **kwargs):
         """Generic decorator to manage access to the URL via some method
@@ -166,7 +195,8 @@ class BaseDownloader(object, metaclass=ABCMeta):
             try:
                 # Try to lock since it might desire to ask for credentials, but still allow to time out at 5 minutes
                 # while providing informative message on what other process might be holding it.
-                with try_lock_informatively(interp_lock, purpose="establish download session", proceed_unlocked=False):
+                with self._session_lock, \
+                        try_lock_informatively(interp_lock, purpose="establish download session", proceed_unlocked=False):
                     used_old_session = self._establish_session(url, allow_old=allow_old_session)
                 if not allow_old_session:
                     assert(not used_old_session)
@@ -201,7 +231,7 @@ class BaseDownloader(object, metaclass=ABCMeta):
                 # in case of parallel downloaders, one would succeed to get the
                 # lock, ask user if necessary and other processes would just wait
                 # got it to return back
-                with try_lock(interp_lock) as got_lock:
+                with self._session_lock, try_lock(interp_lock) as got_lock:
                     if got_lock:
                         if isinstance(e, AccessPermissionExpiredError) \
                                 and not credential_was_refreshed \
@@ -454,23 +484,29 @@ class BaseDownloader(object, metaclass=ABCMeta):
 
         # FETCH CONTENT
         # TODO: pbar = ui.get_progressbar(size=response.headers['size'])
+        temp_filepath = self._get_temp_download_filename(filepath)
+        state_filepath = downloader_session.get_resume_state_filename(
+            temp_filepath)
+        # whether a partial download is kept to be resumed later on
+        keep_partial = False
         try:
-            temp_filepath = self._get_temp_download_filename(filepath)
-            if exists(temp_filepath):
-                # eventually we might want to continue the download
-                lgr.warning(
-                    "Temporary file %s from the previous download was found. "
-                    "It will be overridden" % temp_filepath)
-                # TODO.  also logic below would clean it up atm
-
-            with open(temp_filepath, 'wb') as fp:
-                # TODO: url might be a bit too long for the beast.
-                # Consider to improve to make it animated as well, or shorten here
-                pbar = ui.get_progressbar(label=url, fill_text=filepath, total=target_size)
-                t0 = time.time()
-                downloader_session.download(fp, pbar, size=size)
-                downloaded_time = time.time() - t0
-                pbar.finish()
+            # TODO: url might be a bit too long for the beast.
+            # Consider to improve to make it animated as well, or shorten here
+            pbar = ui.get_progressbar(label=url, fill_text=filepath, total=target_size)
+            t0 = time.time()
+            if downloader_session.resumable and size is None:
+                keep_partial = True
+                downloader_session.download_resumable(temp_filepath, pbar)
+                keep_partial = False
+            else:
+                if exists(temp_filepath):
+                    lgr.warning(
+                        "Temporary file %s from the previous download was found. "
+                        "It will be overridden" % temp_filepath)
+                with open(temp_filepath, 'wb') as fp:
+                    downloader_session.download(fp, pbar, size=size)
+            downloaded_time = time.time() - t0
+            pbar.finish()
             downloaded_size = os.stat(temp_filepath).st_size
 
             # (headers.get('Content-type', "") and headers.get('Content-Type')).startswith('text/html')
@@ -490,17 +526,26 @@ class BaseDownloader(object, metaclass=ABCMeta):
                 stats.overwritten += int(existed)
                 stats.downloaded_size += downloaded_size
                 stats.downloaded_time += downloaded_time
-        except (AccessDeniedError, IncompleteDownloadError) as e:
+        except AccessDeniedError:
+            keep_partial = False
+            raise
+        except IncompleteDownloadError:
             raise
         except Exception as e:
             ce = CapturedException(e)
             lgr.error("Failed to download %s into %s: %s", url, filepath, ce)
             raise DownloadError(ce) from e # for now
         finally:
-            if exists(temp_filepath):
-                # clean up
-                lgr.debug("Removing a temporary download %s", temp_filepath)
-                unlink(temp_filepath)
+            if keep_partial and exists(temp_filepath):
+                lgr.info(
+                    "Keeping partial download %s to be resumed later on",
+                    temp_filepath)
+            else:
+                for p in (temp_filepath, state_filepath):
+                    if exists(p):
+                        # clean up
+                        lgr.debug("Removing a temporary download %s", p)
+                        unlink(p)
 
         return filepath
 
@@ -12,16 +12,26 @@
 import re
 import requests
 import requests.auth
+from requests.adapters import HTTPAdapter
 from requests.utils import parse_dict_header
 
 # at some point was trying to be too specific about which exceptions to
 # catch for a retry of a download.
 # from urllib3.exceptions import MaxRetryError, NewConnectionError
 
+import contextvars
 import io
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from time import sleep
 
-from .. import __version__
+from .. import (
+    __version__,
+    cfg,
+)
 from ..utils import (
     ensure_list_from_str,
     ensure_dict_from_str,
@@ -41,6 +51,7 @@ from ..support.exceptions import (
     AccessFailedError,
     CapturedException,
     DownloadError,
+    IncompleteDownloadError,
     UnhandledRedirectError,
 )
 
@@ -85,6 +96,42 @@ if lgr.getEffectiveLevel() <= 1:
 __docformat__ = 'restructuredtext'
 
 
+class _PooledHTTPAdapter(HTTPAdapter):
+    """Adapter whose connection pools are shared by all sessions
+
+    Closing any of the sessions must not close the connections used by the
+    other ones.
+    """
+    def close(self):
+        pass
+
+
+_pooled_adapter = None
+_pooled_adapter_lock = threading.Lock()
+
+
+def get_pooled_adapter():
+    """Return the process-wide adapter to mount into `requests` sessions
+
+    All sessions with this adapter share a bounded pool of keep-alive
+    connections per host, so that connections (and TLS handshakes) are
+    reused across all downloaders, regardless of their credentials.
+    Authentication state (cookies, headers) remains specific to each
+    session.
+    """
+    global _pooled_adapter
+    with _pooled_adapter_lock:
+        if _pooled_adapter is None:
+            _pooled_adapter = _PooledHTTPAdapter(
+                pool_connections=cfg.obtain('datalad.download.pool-hosts'),
+                # concurrently downloaded segments must not exceed the pool
+                pool_maxsize=max(
+                    cfg.obtain('datalad.download.pool-maxsize'),
+                    cfg.obtain('datalad.download.segments')),
+            )
+        return _pooled_adapter
+
+
 def process_www_authenticate(v):
     if not v:
         return []
@@ -105,7 +152,8 @@ def process_www_authenticate(v):
 def check_response_status(response, err_prefix="", session=None):
     """Check if response's status_code signals problem with authentication etc
 
-    ATM succeeds only if response code was 200
+    ATM succeeds only if response code was 200, or 206 (partial content
+    in response to a range request)
     """
     if not err_prefix:
         err_prefix = "Access to %s has failed: " % response.url
@@ -122,7 +170,7 @@ def check_response_status(response, err_prefix="", session=None):
             err_msg,
             supported_types=process_www_authenticate(
                 response.headers.get('WWW-Authenticate')))
-    elif response.status_code in {200}:
+    elif response.status_code in {200, 206}:
         pass
     elif response.status_code in {301, 302, 307}:
         # TODO: apparently tests do not exercise this one yet
@@ -441,12 +489,55 @@ class HTTPAnonBearerTokenAuthenticator(HTTPBearerTokenAuthenticator):
 @auto_repr
 class HTTPDownloaderSession(DownloaderSession):
     def __init__(self, size=None, filename=None,  url=None, headers=None,
-                 response=None, chunk_size=1024 ** 2):
+                 response=None, chunk_size=1024 ** 2, session=None,
+                 request_headers=None, segments=1, min_segment_size=None):
+        """
+        Parameters
+        ----------
+        session: requests.Session, optional
+          Session to issue range requests with. Required for resumable
+          downloads.
+        request_headers: dict, optional
+          Headers the original request was made with.
+        segments: int, optional
+          Maximal number of byte ranges to download concurrently. Downloads
+          are resumable only if more than one segment is allowed, and the
+          server supports range requests.
+        min_segment_size: int, optional
+          Minimal size of a segment in bytes.
+        """
         super(HTTPDownloaderSession, self).__init__(
             size=size, filename=filename, url=url, headers=headers,
         )
         self.chunk_size = chunk_size
         self.response = response
+        self.session = session
+        self.request_headers = request_headers or {}
+        self.segments = segments
+        self.min_segment_size = min_segment_size or chunk_size
+
+    @property
+    def resumable(self):
+        headers = self.headers or {}
+        return bool(
+            self.segments > 1
+            and self.session is not None
+            and self.size
+            and self.url
+            and not self.url.startswith('ftp://')
+            and headers.get('Accept-Ranges', '').strip().lower() == 'bytes'
+            and headers.get('Content-Encoding', 'identity').strip().lower()
+            == 'identity'
+        )
+
+    @property
+    def _validator(self):
+        """Identifies the version of the remote content, if possible"""
+        headers = self.headers or {}
+        etag = headers.get('ETag')
+        if etag and not etag.startswith('W/'):
+            return etag
+        return headers.get('Last-Modified')
 
     def download(self, f=None, pbar=None, size=None):
         response = self.response
@@ -517,6 +608,155 @@ class HTTPDownloaderSession(DownloaderSession):
             out = f.getvalue()
             return out
 
+    def download_resumable(self, filepath, pbar=None):
+        # Content is downloaded as a number of byte ranges, each in its own
+        # thread writing at its offset into the preallocated file. The
+        # progress of each segment is recorded in a state file, which
+        # enables continuing from a partial download.
+        state_filepath = self.get_resume_state_filename(filepath)
+        segments = self._load_resume_state(filepath, state_filepath)
+        if segments is None:
+            nsegments = max(
+                1, min(self.segments, self.size // self.min_segment_size))
+            segment_size = -(-self.size // nsegments)
+            # [start, end, downloaded bytes]
+            segments = [
+                [start, min(start + segment_size, self.size), 0]
+                for start in range(0, self.size, segment_size)
+            ]
+            with open(filepath, 'wb') as f:
+                f.truncate(self.size)
+        else:
+            lgr.info("Resuming the download of %s into %s",
+                     self.url, filepath)
+
+        pending = [s for s in segments if s[2] < s[1] - s[0]]
+        if self.response is not None and not (
+                pending and pending[0][0] == 0 and pending[0][2] == 0):
+            # the initial response is only used for a segment starting at
+            # the beginning of the content
+            self.response.close()
+            self.response = None
+
+        lock = threading.Lock()
+        abort = threading.Event()
+        progress = dict(
+            total=sum(s[2] for s in segments),
+            saved=time.time(),
+        )
+
+        def save_state():
+            with open(state_filepath, 'w') as f:
+                json.dump(dict(size=self.size, validator=self._validator,
+                               segments=segments), f)
+
+        def update(segment, nbytes):
+            with lock:
+                segment[2] += nbytes
+                progress['total'] += nbytes
+                if pbar:
+                    try:
+                        pbar.update(progress['total'])
+                    except Exception as e:
+                        ce = CapturedException(e)
+                        lgr.warning("Failed to update progressbar: %s", ce)
+                    ui.out.flush()
+                if time.time() - progress['saved'] > 1:
+                    save_state()
+                    progress['saved'] = time.time()
+
+        save_state()
+        try:
+            if len(pending) == 1:
+                self._download_segment(filepath, pending[0], update, abort)
+            elif pending:
+                with ThreadPoolExecutor(len(pending)) as executor:
+                    # run in the context of the caller, e.g. to report
+                    # progress on behalf of a special remote job
+                    futures = [
+                        executor.submit(contextvars.copy_context().run,
+                                        self._download_segment,
+                                        filepath, s, update, abort)
+                        for s in pending
+                    ]
+                    try:
+                        for future in futures:
+                            future.result()
+                    finally:
+                        abort.set()
+        finally:
+            with lock:
+                save_state()
+
+        missing = sum(s[1] - s[0] - s[2] for s in segments)
+        if missing:
+            raise IncompleteDownloadError(
+                "Download of %s is missing %d out of %d bytes"
+                % (self.url, missing, self.size))
+        os.unlink(state_filepath)
+
+    def _download_segment(self, filepath, segment, update, abort):
+        start, end, done = segment
+        if start == 0 and not done and self.response is not None:
+            response = self.response
+            self.response = None
+        else:
+            headers = dict(self.request_headers)
+            headers['Range'] = 'bytes=%d-%d' % (start + done, end - 1)
+            response = self.session.get(self.url, stream=True,
+                                        headers=headers)
+            check_response_status(response, session=self.session)
+            if response.status_code != 206:
+                response.close()
+                raise DownloadError(
+                    "Server responded with status %s instead of partial "
+                    "content for a range request to %s"
+                    % (response.status_code, self.url))
+        try:
+            # unbuffered, the recorded progress must not exceed what was
+            # written to the file
+            with open(filepath, 'r+b', buffering=0) as f:
+                f.seek(start + done)
+                for chunk in response.raw.stream(self.chunk_size,
+                                                 decode_content=False):
+                    if abort.is_set():
+                        break
+                    chunk = chunk[:end - start - segment[2]]
+                    if not chunk:
+                        # keep-alive chunk, or more than requested
+                        if segment[2] >= end - start:
+                            break
+                        continue
+                    f.write(chunk)
+                    update(segment, len(chunk))
+        finally:
+            response.close()
+
+    def _load_resume_state(self, filepath, state_filepath):
+        """Return the segments of a previous partial download, if usable"""
+        if not os.path.exists(filepath):
+            return None
+        try:
+            with open(state_filepath) as f:
+                state = json.load(f)
+            segments = state['segments']
+            usable = (
+                state['size'] == self.size
+                and self._validator is not None
+                and state['validator'] == self._validator
+                and os.stat(filepath).st_size == self.size
+            )
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            lgr.debug("Cannot resume download into %s: %s",
+                      filepath, CapturedException(e))
+            usable = False
+        if not usable:
+            lgr.warning(
+                "Temporary file %s from the previous download was found. "
+                "It will be overridden" % filepath)
+            return None
+        return segments
+
 
 @auto_repr
 class HTTPDownloader(BaseDownloader):
@@ -561,7 +801,7 @@ class HTTPDownloader(BaseDownloader):
             elif url in cookies_db:
                 cookie_dict = cookies_db[url]
                 lgr.debug("http session: Creating new with old cookies %s", list(cookie_dict.keys()))
-                self._session = requests.Session()
+                self._session = self._get_new_session()
                 # not sure what happens if cookie is expired (need check to that or exception will prolly get thrown)
 
                 # TODO dict_to_cookiejar doesn't preserve all fields when reversed
@@ -572,13 +812,21 @@ class HTTPDownloader(BaseDownloader):
                 return True
 
         lgr.debug("http session: Creating brand new session")
-        self._session = requests.Session()
+        self._session = self._get_new_session()
         self._session.headers.update(self._headers)
         if self.authenticator:
             self.authenticator.authenticate(url, self.credential, self._session)
 
         return False
 
+    @staticmethod
+    def _get_new_session():
+        session = requests.Session()
+        adapter = get_pooled_adapter()
+        for prefix in ('http://', 'https://'):
+            session.mount(prefix, adapter)
+        return session
+
     def get_downloader_session(self, url,
                                allow_redirects=True,
                                use_redirected_url=True,
@@ -620,6 +868,7 @@ class HTTPDownloader(BaseDownloader):
                 sleep(2**retry)
 
         check_response_status(response, session=self._session)
+        request_headers = headers
         headers = response.headers
         lgr.debug("Establishing session for url %s, response headers: %s",
                   url, headers)
@@ -638,7 +887,11 @@ class HTTPDownloader(BaseDownloader):
             url=response.url,
             filename=url_filename,
             headers=headers,
-            response=response
+            response=response,
+            session=self._session,
+            request_headers=request_headers,
+            segments=cfg.obtain('datalad.download.segments'),
+            min_segment_size=cfg.obtain('datalad.download.segment-min-size'),
         )
 
     @classmethod
@@ -13,6 +13,7 @@ from glob import glob
 from logging import getLogger
 
 import re
+import threading
 from os.path import dirname, abspath, join as pathjoin
 from urllib.parse import urlparse
 from collections import OrderedDict
@@ -97,6 +98,7 @@ class Provider(object):
         self.credential = credential
         self.authenticator = authenticator
         self._downloader = downloader
+        self._downloader_lock = threading.Lock()
 
     @property
     def downloader(self):
@@ -132,19 +134,22 @@ class Provider(object):
         If one is known -- verifies its appropriateness for the given url.
         ATM we do not support multiple types of downloaders per single provider
         """
-        if self._downloader is None:
-            # we need to create a new one
-            Downloader = self._get_downloader_class(url)
-            # we might need to provide it with credentials and authenticator
-            # Let's do via kwargs so we could accommodate cases when downloader does not necessarily
-            # cares about those... duck typing or what it is in action
-            kwargs = kwargs.copy()
-            if self.credential:
-                kwargs['credential'] = self.credential
-            if self.authenticator:
-                kwargs['authenticator'] = self.authenticator
-            self._downloader = Downloader(**kwargs)
-        return self._downloader
+        # a downloader (and thereby its session) is shared by concurrent
+        # users of the provider, e.g. jobs of a special remote
+        with self._downloader_lock:
+            if self._downloader is None:
+                # we need to create a new one
+                Downloader = self._get_downloader_class(url)
+                # we might need to provide it with credentials and authenticator
+                # Let's do via kwargs so we could accommodate cases when downloader does not necessarily
+                # cares about those... duck typing or what it is in action
+                kwargs = kwargs.copy()
+                if self.credential:
+                    kwargs['credential'] = self.credential
+                if self.authenticator:
+                    kwargs['authenticator'] = self.authenticator
+                self._downloader = Downloader(**kwargs)
+            return self._downloader
 
 
 class Providers(object):
@@ -378,7 +383,9 @@ type = {credential_type}
         scheme = Provider.get_scheme_from_url(url)
         if scheme not in self._default_providers:
             lgr.debug("Initializing default provider for %s", scheme)
-            self._default_providers[scheme] = Provider(name="", url_res=["%s://.*" % scheme])
+            # concurrent callers must end up with the same provider
+            self._default_providers.setdefault(
+                scheme, Provider(name="", url_res=["%s://.*" % scheme]))
         provider = self._default_providers[scheme]
         lgr.debug("No dedicated provider, returning default one for %s: %s",
                   scheme, provider)
@@ -9,6 +9,7 @@
 """Tests for http downloader"""
 
 import builtins
+import logging
 import os
 import re
 import time
@@ -39,6 +40,7 @@ from ..http import (
     HTTPBaseAuthenticator,
     HTTPBearerTokenAuthenticator,
     HTTPDownloader,
+    get_pooled_adapter,
     process_www_authenticate,
 )
 
@@ -70,7 +72,9 @@ from ...tests.utils_pytest import (
     assert_not_in,
     assert_raises,
     known_failure_githubci_win,
+    ok_,
     ok_file_has_content,
+    patch_config,
     serve_path_via_http,
     skip_if,
     skip_if_no_network,
@@ -200,6 +204,24 @@ def test_HTTPDownloader_basic(toppath=None, topurl=None):
     # TODO: access denied detection
 
 
+@with_tree(tree=[('file.dat', 'abc')])
+@serve_path_via_http
+def test_HTTPDownloader_pooled_connections(toppath=None, topurl=None):
+    furl = "%sfile.dat" % topurl
+    downloaders = [HTTPDownloader(), HTTPDownloader(headers={'X-Test': '1'})]
+    for downloader in downloaders:
+        assert_equal(downloader.fetch(furl), 'abc')
+    adapter = get_pooled_adapter()
+    sessions = [d._session for d in downloaders]
+    assert_false(sessions[0] is sessions[1])
+    for session in sessions:
+        for prefix in ('http://', 'https://'):
+            ok_(session.get_adapter(prefix + 'example.com') is adapter)
+    # closing one session does not affect the connections of the other one
+    sessions[0].close()
+    assert_equal(downloaders[1].fetch(furl), 'abc')
+
+
 @with_tree(tree=[('file.dat', 'abc')])
 @serve_path_via_http
 @with_memory_keyring
@@ -843,3 +865,101 @@ def test_download_url(toppath=None, topurl=None):
     assert_raises(DownloadError, download_url, furl, tfpath)
     # works when forced
     download_url(furl, tfpath, overwrite=True)
+
+
+def _register_ranged_uri(url, content, requested_ranges, fail_ranges=()):
+    # serve content with support for range requests
+    def request_callback(request, uri, headers):
+        headers['Accept-Ranges'] = 'bytes'
+        headers['ETag'] = '"v1"'
+        range_ = request.headers.get('Range')
+        if not range_:
+            return (200, headers, content)
+        requested_ranges.append(range_)
+        if range_ in fail_ranges:
+            return (500, headers, b'')
+        start, end = map(int, range_[len('bytes='):].split('-'))
+        headers['Content-Range'] = 'bytes %d-%d/%d' % (start, end, len(content))
+        return (206, headers, content[start:end + 1])
+
+    httpretty.register_uri(httpretty.GET, url, body=request_callback)
+
+
+@skip_if(not httpretty, "no httpretty")
+@without_http_proxy
+@httpretty.activate
+@with_tempfile(mkdir=True)
+def test_HTTPDownloader_segmented(d=None):
+    url = "http://example.com/file.dat"
+    content = bytes(range(256)) * 100
+    fpath = opj(d, 'file.dat')
+    requested_ranges = []
+    _register_ranged_uri(url, content, requested_ranges)
+
+    # single stream by default
+    downloader = HTTPDownloader()
+    downloader.download(url, path=fpath)
+    assert_equal(read_file(fpath, decode=False), content)
+    assert_equal(requested_ranges, [])
+    os.unlink(fpath)
+
+    with patch_config({'datalad.download.segments': '4',
+                       'datalad.download.segment-min-size': '6000'}):
+        downloader = HTTPDownloader()
+        downloader.download(url, path=fpath)
+    assert_equal(read_file(fpath, decode=False), content)
+    # the initial request provides the first segment
+    assert_equal(sorted(requested_ranges),
+                 ['bytes=12800-19199', 'bytes=19200-25599',
+                  'bytes=6400-12799'])
+    assert_false(os.path.exists(fpath + '.datalad-download-temp'))
+
+
+@skip_if(not httpretty, "no httpretty")
+@without_http_proxy
+@httpretty.activate
+@with_tempfile(mkdir=True)
+def test_HTTPDownloader_resume(d=None):
+    url = "http://example.com/file.dat"
+    content = bytes(range(256)) * 100
+    fpath = opj(d, 'file.dat')
+    temp_fpath = HTTPDownloader._get_temp_download_filename(fpath)
+    state_fpath = temp_fpath + '-state'
+    requested_ranges = []
+    fail_ranges = ['bytes=12800-19199']
+    _register_ranged_uri(url, content, requested_ranges,
+                         fail_ranges=fail_ranges)
+
+    with patch_config({'datalad.download.segments': '4',
+                       'datalad.download.segment-min-size': '1000'}):
+        # a failing segment leaves the partial download behind
+        assert_raises(DownloadError, HTTPDownloader().download,
+                      url, path=fpath)
+        assert_false(os.path.exists(fpath))
+        assert_equal(os.stat(temp_fpath).st_size, len(content))
+        ok_(os.path.exists(state_fpath))
+
+        # which is resumed in the next attempt
+        del fail_ranges[:]
+        del requested_ranges[:]
+        HTTPDownloader().download(url, path=fpath)
+        assert_equal(read_file(fpath, decode=False), content)
+        assert_in('bytes=12800-19199', requested_ranges)
+        # the initial response is not used for a resumed download, but
+        # no segment is downloaded again in full
+        assert_not_in('bytes=0-6399', requested_ranges)
+        assert_false(os.path.exists(temp_fpath))
+        assert_false(os.path.exists(state_fpath))
+
+        # a partial download of different content is not resumed
+        with open(temp_fpath, 'wb') as f:
+            f.write(b'0' * len(content))
+        with open(state_fpath, 'w') as f:
+            f.write('{"size": %d, "validator": "\\"v0\\"", '
+                    '"segments": [[0, %d, %d]]}'
+                    % (len(content), len(content), len(content)))
+        os.unlink(fpath)
+        with swallow_logs(new_level=logging.WARNING) as cml:
+            HTTPDownloader().download(url, path=fpath)
+            cml.assert_logged("Temporary file .* will be overridden")
+        assert_equal(read_file(fpath, decode=False), content)
@@ -30,8 +30,6 @@ import warnings
 
 import datalad
 from datalad.interface.common_opts import eval_params
-from datalad.distribution.dataset import Dataset
-from datalad.distribution.dataset import resolve_path
 from datalad.support.exceptions import CapturedException
 
 
@@ -586,6 +584,10 @@ class Interface(ABC):
         # theoretically a dataset could come in as a relative path -> resolve
         if dataset is None:
             return dataset
+        from datalad.distribution.dataset import (
+            Dataset,
+            resolve_path,
+        )
         refds_path = dataset.path if isinstance(dataset, Dataset) \
             else Dataset(dataset).path
         if refds_path:
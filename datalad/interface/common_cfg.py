@@ -168,6 +168,13 @@ intermediate expressions match or not."""
 
 
 _definitions = {
+    'datalad.archives.cache-size': {
+        'ui': ('question', {
+               'title': 'Size budget of the persistent archives cache',
+               'text': 'Maximum total size (in bytes) of archives extracted into the persistent cache of the datalad-archives special remote. Whenever it is exceeded after an archive was extracted, the least recently used extracted archives are removed. Archives are not evicted at any other time, so the cache can remain above the budget, e.g. after lowering it. There is no limit if not set.'}),
+        'type': EnsureInt() | EnsureNone(),
+        'default': None,
+    },
     'datalad.clone.url-substitute.github': {
         'ui': ('question', {
                'title': 'GitHub URL substitution rule',
@@ -228,6 +235,34 @@ _definitions = {
         'type': bool,
         'default': False,
     },
+    'datalad.download.pool-hosts': {
+        'ui': ('question', {
+               'title': 'Number of hosts to keep HTTP connections for',
+               'text': 'HTTP(S) connections are kept open and reused by all downloads of a process. Connections are kept for at most this many hosts at a time.'}),
+        'type': EnsureInt(),
+        'default': 10,
+    },
+    'datalad.download.pool-maxsize': {
+        'ui': ('question', {
+               'title': 'Maximum number of HTTP connections to keep per host',
+               'text': 'HTTP(S) connections are kept open and reused by all downloads of a process. At most this many connections are kept per host (or as many as configured via datalad.download.segments, if that is larger).'}),
+        'type': EnsureInt(),
+        'default': 10,
+    },
+    'datalad.download.segments': {
+        'ui': ('question', {
+               'title': 'Number of concurrent segments for HTTP downloads',
+               'text': 'Large downloads from HTTP servers that support range requests are split into up to this many byte ranges that are downloaded concurrently. Any value larger than 1 also enables resuming interrupted downloads from their temporary file. With the default of 1, content is downloaded in a single stream.'}),
+        'type': EnsureInt(),
+        'default': 1,
+    },
+    'datalad.download.segment-min-size': {
+        'ui': ('question', {
+               'title': 'Minimum size (in bytes) of an HTTP download segment',
+               'text': 'Segmented downloads use fewer segments than configured via datalad.download.segments, if the segments would be smaller than this size.'}),
+        'type': EnsureInt(),
+        'default': 16 * 1024 ** 2,
+    },
     'datalad.extensions.load': {
         'ui': ('question', {
                'title': 'DataLad extension packages to load',
@@ -493,6 +528,13 @@ _definitions = {
         'default': False,
         'type': EnsureBool(),
     },
+    'datalad.addurls.key-query-processes': {
+        'ui': ('question', {
+            'title': 'Number of processes for key queries in addurls',
+            'text': 'When files are added from user-supplied keys, (read-only) queries for key information are distributed across this many batched git-annex processes'}),
+        'type': EnsureInt(),
+        'default': 1,
+    },
     'datalad.annex.retry': {
         'ui': ('question',
                {'title': 'Value for annex.retry to use for git-annex calls',
@@ -543,6 +585,13 @@ _definitions = {
         'type': EnsureBool(),
         'default': True,
     },
+    'datalad.metadata.aggregate-content-format': {
+        'ui': ('question', {
+               'title': 'Storage format of aggregated content metadata',
+               'text': "Format of content metadata objects written by aggregate-metadata. 'xz' is a compressed JSON stream that has to be decompressed entirely to query any file. 'blocks' is a block-compressed JSON stream with an index that is memory-mapped when queried, such that only the records of the queried files are decompressed. Objects in either format can be read regardless of this setting"}),
+        'type': EnsureChoice('xz', 'blocks'),
+        'default': 'xz',
+    },
     'datalad.search.default-mode': {
         'ui': ('question', {
                'title': 'Default search mode',
@@ -577,6 +626,13 @@ _definitions = {
         'type': EnsureInt(),
         'default': 20,
     },
+    'datalad.runtime.max-batched-requests': {
+        'ui': ('question', {
+            'title': 'Maximum number of requests in flight for a batched command',
+            'text': 'When a sequence of requests is sent to a batched command, up to this many requests are sent ahead without waiting for their responses. Larger values reduce the impact of the communication latency, at the cost of more buffered responses.'}),
+        'type': EnsureInt(),
+        'default': 100,
+    },
     'datalad.runtime.max-inactive-age': {
         'ui': ('question', {
             'title': 'Maximum time (in seconds) a batched command can be'
@@ -620,6 +676,20 @@ _definitions = {
         'type': EnsureChoice('wait', 'abandon'),
         'default': 'wait',
     },
+    'datalad.runtime.compact-content-info': {
+        'ui': ('yesno', {
+            'title': 'Compact content reports',
+            'text': 'If enabled, reports on repository content (e.g. for status, diff, or save) use a compact in-memory representation, which substantially reduces memory demands for repositories with many files, at a small performance cost'}),
+        'type': EnsureBool(),
+        'default': False,
+    },
+    'datalad.runtime.worktree-cache': {
+        'ui': ('yesno', {
+            'title': 'Cache worktree content reports',
+            'text': 'If enabled, reports on the content of a repository worktree are cached per process, and only the parts of a worktree that changed (as indicated by file system modification times) are listed again on subsequent queries'}),
+        'type': EnsureBool(),
+        'default': True,
+    },
     'datalad.search.indexercachesize': {
         'ui': ('question', {
                'title': 'Maximum cache size for search index (per process)',
@@ -627,6 +697,13 @@ _definitions = {
         'default': 256,
         'type': EnsureInt(),
     },
+    'datalad.search.indexerjobs': {
+        'ui': ('question', {
+               'title': 'Number of processes for building a search index',
+               'text': 'With more than one process, metadata of multiple datasets is loaded and indexed in parallel, if there are enough datasets'}),
+        'type': EnsureInt(),
+        'default': 1,
+    },
     'datalad.ui.progressbar': {
         'ui': ('question', {
             'title': 'UI progress bars',
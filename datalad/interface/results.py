@@ -33,7 +33,6 @@ from datalad.support.exceptions import (
     format_oneline_tb,
     CapturedException,
 )
-from datalad.distribution.dataset import Dataset
 
 
 lgr = logging.getLogger('datalad.interface.results')
@@ -165,6 +164,7 @@ class YieldDatasets(ResultXFM):
         if res.get('type', None) == 'dataset':
             if not self.success_only or \
                     res.get('status', None) in ('ok', 'notneeded'):
+                from datalad.distribution.dataset import Dataset
                 return Dataset(res['path'])
         else:
             lgr.debug('rejected by return value configuration: %s', res)
@@ -288,6 +288,7 @@ def is_result_matching_pathsource_argument(res, **kwargs):
     # we either have any non-zero number of "paths" (that could be anything), or
     # we have one path and one source
     # we don't do any error checking here, done by the command itself
+    from datalad.distribution.dataset import Dataset
     if res.get('action', None) not in ('install', 'get'):
         # this filter is only used in install, reject anything that comes
         # in that could not possibly be a 'install'-like result
@@ -17,6 +17,7 @@ import os
 import re
 import tempfile
 import warnings
+from collections import deque
 from os.path import (
     basename,
     curdir,
@@ -38,7 +39,10 @@ from datalad.interface.base import (
     Interface,
     build_doc,
 )
-from datalad.interface.common_opts import allow_dirty
+from datalad.interface.common_opts import (
+    allow_dirty,
+    jobs_opt,
+)
 from datalad.interface.results import get_status_dict
 from datalad.interface.utils import eval_results
 from datalad.log import (
@@ -46,6 +50,10 @@ from datalad.log import (
     logging,
 )
 from datalad.support.annexrepo import AnnexRepo
+from datalad.support.exceptions import (
+    AnnexBatchCommandError,
+    CommandError,
+)
 from datalad.support.constraints import (
     EnsureNone,
     EnsureStr,
@@ -74,6 +82,80 @@ _KEY_OPT_NOTE = "Note that it will be of no effect if %s is given" % _KEY_OPT
 # all but by default to print only the one associated with this given action
 
 
+class _AddurlPipeline(object):
+    """Add files from URLs with a batched `git annex addurl`, pipelined
+
+    Requests are sent without waiting for the responses to the previous
+    ones.  With more than one job, git-annex processes the requests
+    concurrently and responds in the order of completion, so responses are
+    matched to the requests by file name.
+    """
+
+    def __init__(self, annex, options=None, jobs=None):
+        self._annex = annex
+        options = list(options or []) + ['--with-files']
+        if jobs and jobs > 1:
+            options.append('--jobs=%d' % jobs)
+        self._bcmd = annex._batched.get(
+            'addurl-archive-content',
+            annex_cmd='addurl',
+            annex_options=options,
+            path=annex.path,
+            json=True)
+        # files (relative, POSIX) of all requests in flight
+        self._pending = set()
+        self._futures = deque()
+
+    def _get_file(self, path):
+        return Path(path).relative_to(self._annex.pathobj).as_posix()
+
+    def is_pending(self, path):
+        """Whether `path` was submitted, but is not yet added"""
+        return self._get_file(path) in self._pending
+
+    def submit(self, path, url):
+        """Submit a file to be added from `url`
+
+        Yields
+        ------
+        dict
+          annex JSON record for each file added meanwhile
+        """
+        file_ = self._get_file(path)
+        self._pending.add(file_)
+        self._futures.append(self._bcmd.submit((url, file_)))
+        yield from self._collect(wait=False)
+
+    def flush(self):
+        """Wait for all files in flight to be added
+
+        Yields
+        ------
+        dict
+          annex JSON record for each file added
+        """
+        yield from self._collect(wait=True)
+
+    def _collect(self, wait):
+        while self._futures and (wait or self._futures[0].done()):
+            try:
+                out_json = self._futures.popleft().result()
+            except CommandError as exc:
+                self._futures.clear()
+                self._pending.clear()
+                raise AnnexBatchCommandError(
+                    cmd="addurl",
+                    msg="Adding files failed") from exc
+            file_ = out_json.get('file')
+            if file_ not in self._pending or not out_json.get('success', False):
+                raise AnnexBatchCommandError(
+                    cmd="addurl",
+                    msg="Error, annex reported failure for addurl: %s"
+                    % str(out_json))
+            self._pending.remove(file_)
+            yield out_json
+
+
 @build_doc
 class AddArchiveContent(Interface):
     """Add content of an archive under git annex control.
@@ -210,6 +292,7 @@ class AddArchiveContent(Interface):
             delete afterwards. To be used to "index" files within annex without
             actually creating corresponding files under git. Note that
             `annex dropunused` would later remove that load"""),
+        jobs=jobs_opt,
 
         # TODO: interaction with archives cache whenever we make it persistent across runs
         archive=Parameter(
@@ -242,7 +325,8 @@ class AddArchiveContent(Interface):
             allow_dirty=False,
             stats=None,
             drop_after=False,
-            delete_after=False):
+            delete_after=False,
+            jobs='auto'):
 
         if exclude:
             exclude = ensure_tuple_or_list(exclude)
@@ -400,6 +484,8 @@ class AddArchiveContent(Interface):
                                                 persistent_cache=True)
         # We will move extracted content so it must not exist prior running
         annexarchive.cache.allow_existing = True
+        # make room for the archive, if the cache has a size budget
+        annexarchive.cache.evict()
         earchive = annexarchive.cache[key_rpath]
         # make sure there is an enabled datalad-archives special remote
         ensure_datalad_remote(ds.repo, remote=ARCHIVES_SPECIAL_REMOTE,
@@ -423,11 +509,42 @@ class AddArchiveContent(Interface):
         outside_stats = stats
         stats = ActivityStats()
 
+        # files are added by git-annex via the datalad-archives special
+        # remote. Requests are pipelined (and processed concurrently with
+        # multiple jobs), unless batch mode is disabled
+        addurl = None if annex.fake_dates_enabled else \
+            _AddurlPipeline(annex, options=annex_options,
+                            jobs=annex._get_n_jobs(jobs))
+
+        def record_added(out_json):
+            if 'key' in out_json and out_json['key'] is not None:
+                # annex.is_under_annex(target_file, batch=True):
+                # due to http://git-annex.branchable.com/bugs/annex_drop_is_not___34__in_effect__34___for_load_which_was___34__addurl_--batch__34__ed_but_not_yet_committed/?updated
+                # we need to maintain a list of those to be dropped files
+                if drop_after:
+                    # drop extracted files after adding to annex
+                    annex.drop_key(out_json['key'], batch=True)
+                    stats.dropped += 1
+                stats.add_annex += 1
+            else:
+                lgr.debug("File {} was added to git, not adding url".format(
+                    out_json.get('file')))
+                stats.add_git += 1
+
+        # until cleaned up, the extracted content must not get evicted from
+        # the cache by others
+        earchive.acquire_use()
         try:
             # keep track of extracted files for progress bar logging
             file_counter = 0
             # iterative over all files in the archive
             extracted_files = list(earchive.get_extracted_files())
+            if strip_leading_dirs:
+                leading_dir = earchive.get_leading_directory(
+                    depth=leading_dirs_depth, exclude=exclude,
+                    consider=leading_dirs_consider)
+                leading_dir_len = \
+                    len(leading_dir) + len(opsep) if leading_dir else 0
             for extracted_file in extracted_files:
                 file_counter += 1
                 log_progress(
@@ -471,11 +588,6 @@ class AddArchiveContent(Interface):
                         Path(extracted_file).parent / Path(archive).stem
 
                 if strip_leading_dirs:
-                    leading_dir = earchive.get_leading_directory(
-                        depth=leading_dirs_depth, exclude=exclude,
-                        consider=leading_dirs_consider)
-                    leading_dir_len = \
-                        len(leading_dir) + len(opsep) if leading_dir else 0
                     target_file = str(target_file)[leading_dir_len:]
 
                 if add_archive_leading_dir:
@@ -514,6 +626,12 @@ class AddArchiveContent(Interface):
                     if extract_rpath else target_file
                 target_file_path = annex.pathobj / target_file_path
 
+                if addurl is not None and addurl.is_pending(target_file_path):
+                    # the file is yet to be added, it must exist to be
+                    # handled as an existing file
+                    for out_json in addurl.flush():
+                        record_added(out_json)
+
                 # when the file already exists...
                 if lexists(target_file_path):
                     handle_existing = True
@@ -598,24 +716,14 @@ class AddArchiveContent(Interface):
                 lgr.debug("Adding %s to annex pointing to %s and with options "
                           "%r", target_file_path, url, annex_options)
 
-                out_json = annex.add_url_to_file(
-                    target_file_path,
-                    url, options=annex_options,
-                    batch=True)
-
-                if 'key' in out_json and out_json['key'] is not None:
-                    # annex.is_under_annex(target_file, batch=True):
-                    # due to http://git-annex.branchable.com/bugs/annex_drop_is_not___34__in_effect__34___for_load_which_was___34__addurl_--batch__34__ed_but_not_yet_committed/?updated
-                    # we need to maintain a list of those to be dropped files
-                    if drop_after:
-                        # drop extracted files after adding to annex
-                        annex.drop_key(out_json['key'], batch=True)
-                        stats.dropped += 1
-                    stats.add_annex += 1
+                if addurl is None:
+                    record_added(annex.add_url_to_file(
+                        target_file_path,
+                        url, options=annex_options,
+                        batch=True))
                 else:
-                    lgr.debug("File {} was added to git, not adding url".format(
-                        target_file_path))
-                    stats.add_git += 1
+                    for out_json in addurl.submit(target_file_path, url):
+                        record_added(out_json)
 
                 if delete_after:
                     # we count the removal here, but don't yet perform it
@@ -626,6 +734,10 @@ class AddArchiveContent(Interface):
                 # Done with target_file -- just to have clear end of the loop
                 del target_file
 
+            if addurl is not None:
+                for out_json in addurl.flush():
+                    record_added(out_json)
+
             if delete and archive and origin != 'key':
                 lgr.debug("Removing the original archive {}".format(archive))
                 # force=True since some times might still be staged and fail
@@ -689,6 +801,7 @@ class AddArchiveContent(Interface):
 
             annex.always_commit = old_always_commit
             # remove what is left and/or everything upon failure
+            earchive.release_use()
             earchive.clean(force=True)
             # remove tempfile directories (not cleaned up automatically):
             if prefix_dir is not None and lexists(prefix_dir):
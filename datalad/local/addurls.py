@@ -952,6 +952,17 @@ class RegisterUrl(object):
         else:
             yield res
 
+    def register_rows(self, rows):
+        """Register a sequence of rows
+
+        Yields
+        ------
+        tuple
+          A (row, list of results) tuple for each row, in order.
+        """
+        for row in rows:
+            yield row, list(self(row))
+
 
 # Note: If any other modules end up needing these batch operations, this should
 # find a new home.
@@ -959,11 +970,37 @@ class RegisterUrl(object):
 
 class BatchedRegisterUrl(RegisterUrl):
     """Like `RegisterUrl`, but use batched commands underneath.
+
+    When registering a sequence of rows with `register_rows()`, requests are
+    pipelined, i.e. many of them are in flight in a batched process at any
+    time. Read-only key queries are additionally distributed across
+    `processes` batched processes.
     """
 
-    def __init__(self, ds, repo=None):
+    def __init__(self, ds, repo=None, processes=1):
         super().__init__(ds, repo)
         self._batch_commands = {}
+        self._processes = max(processes, 1)
+
+    def _get_batch(self,
+                   command,
+                   output_proc=None,
+                   json=False,
+                   batch_options=None,
+                   index=0):
+        cache_key = (command, tuple(batch_options or ()), index)
+        bcmd = self._batch_commands.get(cache_key)
+        if not bcmd:
+            repo = self.repo
+            bcmd = repo._batched.get(
+                codename="{}-{}".format(command, index) if index else command,
+                annex_cmd=command,
+                path=repo.path,
+                json=json,
+                output_proc=output_proc,
+                annex_options=batch_options)
+            self._batch_commands[cache_key] = bcmd
+        return bcmd
 
     def _batch(self,
                command,
@@ -971,26 +1008,40 @@ class BatchedRegisterUrl(RegisterUrl):
                output_proc=None,
                json=False,
                batch_options=None):
+        return self._get_batch(
+            command, output_proc=output_proc, json=json,
+            batch_options=batch_options)(batch_input)
 
-        bcmd = self._batch_commands.get(command)
-        if not bcmd:
-            repo = self.repo
-            bcmd = repo._batched.get(
-                codename=command,
-                path=repo.path,
-                json=json,
-                output_proc=output_proc,
-                annex_options=batch_options)
-            self._batch_commands[command] = bcmd
-        return bcmd(batch_input)
+    def _batch_pipelined(self, command, batch_inputs, processes=1, **kwargs):
+        """Yield the responses to a list of `batch_inputs` in order
+
+        Inputs are distributed round-robin across (up to) `processes`
+        batched processes.
+        """
+        nprocs = max(min(processes, len(batch_inputs)), 1)
+        responses = [
+            self._get_batch(command, index=i, **kwargs).process_requests(
+                batch_inputs[i::nprocs])
+            for i in range(nprocs)
+        ]
+        try:
+            for i in range(len(batch_inputs)):
+                yield next(responses[i % nprocs])
+        finally:
+            for r in responses:
+                r.close()
+
+    @staticmethod
+    def _examinekey_options(parsed_key):
+        if "target_backend" in parsed_key:
+            return ["--migrate-to-backend=" + parsed_key["target_backend"]]
+        return None
 
     def examinekey(self, parsed_key, filename, migrate=False):
-        if migrate:
-            opts = ["--migrate-to-backend=" + parsed_key["target_backend"]]
-        else:
-            opts = None
         return self._batch("examinekey", (parsed_key["key"], filename),
-                           json=True, batch_options=opts)
+                           json=True,
+                           batch_options=self._examinekey_options(parsed_key)
+                           if migrate else None)
 
     def fromkey(self, key, filename):
         return self._batch("fromkey", (key, filename), json=True,
@@ -1006,6 +1057,105 @@ class BatchedRegisterUrl(RegisterUrl):
         self._batch("registerurl", (key, url),
                     output_proc=self._ignore, json=False)
 
+    def register_rows(self, rows):
+        """Register a sequence of rows with pipelined batch requests
+
+        Each stage (examinekey, registerurl, fromkey or pointer file
+        creation) is performed for all rows before the next stage begins.
+        This yields the same results as calling the instance for each row.
+
+        Yields
+        ------
+        tuple
+          A (row, list of results) tuple for each row, in order.
+        """
+        rows = list(rows)
+        # error result for any row that failed in a previous stage
+        errors = {}
+        ek_infos = {}
+        keys = {i: row["key"]["key"] for i, row in enumerate(rows)}
+
+        def run_stage(command, idx, batch_inputs, **kwargs):
+            if not idx:
+                return
+            responses = self._batch_pipelined(command, batch_inputs, **kwargs)
+            done = 0
+            try:
+                for i, response in zip(idx, responses):
+                    done += 1
+                    yield i, response
+            except CommandError as exc:
+                ce = CapturedException(exc)
+                # the responses for all remaining rows are lost
+                for i in idx[done:]:
+                    errors[i] = dict(self._err_res,
+                                     path=rows[i]["filename_abs"],
+                                     message=str(ce),
+                                     exception=ce)
+
+        # 1. examine keys, where needed. Group by the options, although
+        # all rows are expected to share the same key format
+        ek_idx = {}
+        for i, row in enumerate(rows):
+            migrate = "target_backend" in row["key"]
+            if self._avoid_fromkey or migrate:
+                opts = self._examinekey_options(row["key"]) if migrate \
+                    else None
+                ek_idx.setdefault(tuple(opts or ()), []).append(i)
+        for opts, idx in ek_idx.items():
+            for i, ek_info in run_stage(
+                    "examinekey", idx,
+                    [(rows[i]["key"]["key"], rows[i]["ds_filename"])
+                     for i in idx],
+                    processes=self._processes,
+                    json=True,
+                    batch_options=list(opts) or None):
+                if not ek_info:
+                    errors[i] = dict(
+                        self._err_res,
+                        path=rows[i]["filename_abs"],
+                        message=("Failed to get information for %s",
+                                 rows[i]["key"]))
+                    continue
+                ek_infos[i] = ek_info
+                keys[i] = ek_info["key"]
+
+        # 2. register URLs. The batched process does not report
+        # on individual requests, hence they are merely sent
+        idx = [i for i in range(len(rows)) if i not in errors]
+        for _ in run_stage(
+                "registerurl", idx,
+                [(keys[i], rows[i]["url"]) for i in idx],
+                output_proc=self._ignore):
+            pass
+
+        # 3. create the files
+        results = {}
+        idx = [i for i in range(len(rows)) if i not in errors]
+        if self._avoid_fromkey:
+            for i in idx:
+                results[i] = self._write_pointer(rows[i], ek_infos[i])
+        else:
+            for i, fk_info in run_stage(
+                    "fromkey", idx,
+                    [(keys[i], rows[i]["ds_filename"]) for i in idx],
+                    json=True,
+                    # --force is needed because the key (usually) does
+                    # not exist in the local repository.
+                    batch_options=["--force"]):
+                res = annexjson2result(fk_info, self.ds, type="file",
+                                       logger=lgr)
+                if not res.get("message"):
+                    res["message"] = "registered URL"
+                results[i] = res
+
+        for i, row in enumerate(rows):
+            yield row, [errors[i] if i in errors else results[i]]
+
+
+# maximum number of rows with a key to register in one go
+_KEY_ROWS_CHUNK_SIZE = 1000
+
 
 def _log_filter_addurls(res):
     return res.get('type') == 'file' and res.get('action') in ["addurl", "addurls"]
@@ -1024,12 +1174,35 @@ def _add_urls(rows, ds, repo, ifexists=None, options=None,
         if repo.fake_dates_enabled:
             register_url = RegisterUrl(ds, repo)
         else:
-            register_url = BatchedRegisterUrl(ds, repo)
+            register_url = BatchedRegisterUrl(
+                ds, repo,
+                processes=ds.config.obtain(
+                    "datalad.addurls.key-query-processes"))
     else:
-        def register_url(*args, **kwargs):
-            raise RuntimeError("bug: this should be impossible")
+        register_url = None
 
     add_metadata = {}
+
+    def process_results(row, results):
+        all_ok = True
+        for res in results:
+            if res["status"] != "ok":
+                all_ok = False
+            yield res
+        if all_ok and row.get("meta_args"):
+            add_metadata[row["ds_filename"]] = row["meta_args"]
+
+    # rows with a key are registered in chunks, to be able to pipeline
+    # the requests to the batched annex processes
+    key_rows = []
+
+    def register_key_rows():
+        if not key_rows:
+            return
+        for row, results in register_url.register_rows(key_rows):
+            yield from process_results(row, results)
+        key_rows.clear()
+
     for row in rows:
         filename_abs = row["filename_abs"]
         filename = row["ds_filename"]
@@ -1049,17 +1222,17 @@ def _add_urls(rows, ds, repo, ifexists=None, options=None,
             else:
                 lgr.debug("File %s already exists", filename_abs)
 
-        fn = register_url if row.get("key") else add_url
-        all_ok = True
-        for res in fn(row):
-            if res["status"] != "ok":
-                all_ok = False
-            yield res
-        if not all_ok:
+        if row.get("key"):
+            if register_url is None:
+                raise RuntimeError("bug: this should be impossible")
+            key_rows.append(row)
+            if len(key_rows) >= _KEY_ROWS_CHUNK_SIZE:
+                yield from register_key_rows()
             continue
-
-        if row.get("meta_args"):
-            add_metadata[filename] = row["meta_args"]
+        # keep the order of results in line with the order of rows
+        yield from register_key_rows()
+        yield from process_results(row, add_url(row))
+    yield from register_key_rows()
 
     if not add_metadata:
         return
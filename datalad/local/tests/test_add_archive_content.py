@@ -36,10 +36,13 @@ from datalad.consts import (
     ARCHIVES_SPECIAL_REMOTE,
     DATALAD_SPECIAL_REMOTES_UUIDS,
 )
+from datalad.local.add_archive_content import _AddurlPipeline
 from datalad.support.exceptions import (
+    AnnexBatchCommandError,
     CommandError,
     NoDatasetFound,
 )
+from datalad.support.network import get_local_file_url
 from datalad.tests.utils_pytest import (
     assert_cwd_unchanged,
     assert_equal,
@@ -336,7 +339,8 @@ def test_add_archive_content(path_orig=None, url=None, repo_path=None):
     # tested in custom remote tests, but I guess not sufficiently well enough
     repo.drop(opj('1', '1 f.txt'))  # should be all kosher
     repo.get(opj('1', '1 f.txt'))
-    ok_archives_caches(repo.path, 1, persistent=True)
+    # the file is read directly from the tarball, nothing gets extracted
+    ok_archives_caches(repo.path, 0, persistent=True)
     ok_archives_caches(repo.path, 0, persistent=False)
 
     repo.drop(opj('1', '1 f.txt'))  # should be all kosher
@@ -490,6 +494,32 @@ def test_add_archive_single_file(repo_path=None):
             ok_file_has_content(archive_name, archive_content)
 
 
+@with_tree(tree={'f%d.dat' % i: 'content %d' % i for i in range(5)})
+@with_tempfile(mkdir=True)
+def test_addurl_pipeline(src=None, path=None):
+    repo = Dataset(path).create().repo
+    pipeline = _AddurlPipeline(repo, jobs=2)
+    targets = [repo.pathobj / 'sub' / ('f%d.dat' % i) for i in range(5)]
+    added = []
+    for i, target in enumerate(targets):
+        added.extend(pipeline.submit(
+            target, get_local_file_url(opj(src, 'f%d.dat' % i))))
+        ok_(pipeline.is_pending(target))
+    added.extend(pipeline.flush())
+    assert_false(any(pipeline.is_pending(t) for t in targets))
+    # responses might come in any order with multiple jobs
+    eq_(sorted(r['file'] for r in added),
+        ['sub/f%d.dat' % i for i in range(5)])
+    for i, target in enumerate(targets):
+        ok_file_has_content(target, 'content %d' % i)
+
+    with assert_raises(AnnexBatchCommandError):
+        list(pipeline.submit(repo.pathobj / 'missing',
+                             get_local_file_url(opj(src, 'missing'))))
+        list(pipeline.flush())
+    repo.precommit()
+
+
 class TestAddArchiveOptions():
     # few tests bundled with a common setup/teardown to minimize boiler plate
     # nothing here works on windows, no even teardown(), prevent failure at the
@@ -941,6 +941,72 @@ class TestAddurls(object):
             testfunc(arg1, arg2, False)
             testfunc(arg1, arg2, True)
 
+    @skip_key_tests
+    @with_tempfile(mkdir=True)
+    def test_addurls_from_key_pipelined(self=None, path=None):
+        data = deepcopy(self.data) + [
+            {"url": self.url + "udir/d.dat",
+             "name": "d",
+             "subdir": "bar",
+             "md5sum": "abd128618bcc8b6054c77b892b286e6b",
+             "size": "9"}]
+
+        def addurls(name, pipelined):
+            ds = Dataset(op.join(path, name)).create()
+            if OLD_EXAMINEKEY and ds.repo.is_managed_branch():
+                raise SkipTest("Adjusted branch functionality requires "
+                               "more recent `git annex examinekey`")
+            ds.config.set("datalad.addurls.key-query-processes", "2",
+                          scope="local")
+            # registration of this file fails, a directory is in the way
+            create_tree(ds.path, {"d": {"sub": {"f": "in the way"}}})
+            get_batch = au.BatchedRegisterUrl._get_batch
+            with patch("sys.stdin", new=StringIO(json.dumps(data))), \
+                    patch.object(au, "_KEY_ROWS_CHUNK_SIZE", 2), \
+                    patch.object(
+                        au.BatchedRegisterUrl, "register_rows",
+                        au.BatchedRegisterUrl.register_rows if pipelined
+                        # register one row after the other
+                        else au.RegisterUrl.register_rows), \
+                    patch.object(au.BatchedRegisterUrl, "_get_batch",
+                                 autospec=True,
+                                 side_effect=get_batch) as get_batch_:
+                res = ds.addurls("-", "{url}", "{name}",
+                                 exclude_autometa="*",
+                                 key="et:MD5-s{size}--{md5sum}",
+                                 on_failure="ignore",
+                                 result_renderer='disabled')
+            # batched processes used to examine keys
+            ek_procs = {c[1].get("index", 0)
+                        for c in get_batch_.call_args_list
+                        if c[0][1] == "examinekey"}
+            results = [
+                dict({k: r[k] for k in ("action", "status", "annexkey",
+                                        "message", "error_message")
+                      if k in r},
+                     path=op.relpath(r["path"], ds.path))
+                # not interested in the results of saving
+                for r in res if r["action"] in ("addurl", "fromkey")]
+            annexinfo = {
+                str(p.relative_to(ds.pathobj)): (
+                    r["key"], ds.repo.get_urls(str(p)))
+                for p, r in ds.repo.get_content_annexinfo(init=None).items()}
+            return ek_procs, results, annexinfo
+
+        serial = addurls("serial", False)
+        pipelined = addurls("pipelined", True)
+        eq_(serial[0], {0})
+        # key queries were distributed across two processes
+        eq_(pipelined[0], {0, 1})
+        eq_(pipelined[1:], serial[1:])
+        results, annexinfo = pipelined[1:]
+        # b has no key and is downloaded
+        assert_result_count(results, 2, action="fromkey", status="ok")
+        assert_result_count(results, 1, action="fromkey", status="error",
+                            path="d")
+        eq_(sorted(annexinfo), ["a", "b", "c", op.join("d", "sub", "f")])
+        eq_(annexinfo["c"][1], [self.url + "udir/c.dat"])
+
     @with_tempfile(mkdir=True)
     def test_addurls_row_missing_key_fields(self=None, path=None):
         ds = Dataset(path).create(force=True)
@@ -12,8 +12,11 @@
 __docformat__ = 'restructuredtext'
 
 import logging
+import multiprocessing
 import os
+import threading
 
+from concurrent.futures import ProcessPoolExecutor
 from os import makedirs
 from os import listdir
 import os.path as op
@@ -35,6 +38,7 @@ from datalad.interface.utils import (
 from datalad.core.local.save import Save
 from datalad.interface.base import build_doc
 from datalad.interface.common_opts import (
+    jobs_opt,
     recursion_limit,
     recursion_flag,
     nosave_opt,
@@ -51,6 +55,7 @@ from datalad.metadata.metadata import (
     _get_metadata,
     _get_metadatarelevant_paths,
     _get_containingds_from_agginfo,
+    _iter_content_metadata,
     location_keys,
 )
 from datalad.distribution.dataset import (
@@ -69,6 +74,7 @@ from datalad.support.gitrepo import GitRepo
 from datalad.support.annexrepo import AnnexRepo
 from datalad.support.exceptions import CapturedException
 from datalad.support import json_py
+from datalad.support.parallel import ProducerConsumer
 from datalad.support.path import split_ext
 from datalad.utils import (
     path_is_subpath,
@@ -79,6 +85,40 @@ from datalad.core.local.status import get_paths_by_ds
 
 lgr = logging.getLogger('datalad.metadata.aggregate')
 
+# serializes modifications of the repository of the dataset that metadata
+# objects are placed into, when datasets are aggregated concurrently
+_agginto_lock = threading.Lock()
+
+
+class _ContentMetadataPool(ProcessPoolExecutor):
+    """Process pool that keeps track of not yet completed submissions
+
+    Such that they can be cancelled before shutting down the pool
+    (``shutdown(cancel_futures=True)`` requires Python 3.9).
+    """
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._submitted = set()
+        self._submitted_lock = threading.Lock()
+
+    def submit(self, *args, **kwargs):
+        future = super().submit(*args, **kwargs)
+        with self._submitted_lock:
+            self._submitted.add(future)
+        future.add_done_callback(self._discard)
+        return future
+
+    def _discard(self, future):
+        with self._submitted_lock:
+            self._submitted.discard(future)
+
+    def cancel_pending(self):
+        with self._submitted_lock:
+            futures = list(self._submitted)
+        # outside the lock, cancellation runs the done callbacks
+        for future in futures:
+            future.cancel()
+
 
 def _get_dsinfo_from_aggmetadata(ds_path, path, recursive, db):
     """Grab info on aggregated metadata for a path from a given dataset.
@@ -233,7 +273,8 @@ def _the_same_across_datasets(relpath, *dss):
     return False
 
 
-def _dump_extracted_metadata(agginto_ds, aggfrom_ds, db, to_save, force_extraction, agg_base_path):
+def _dump_extracted_metadata(agginto_ds, aggfrom_ds, db, to_save, force_extraction, agg_base_path,
+                             pool=None):
     """Dump metadata from a dataset into object in the metadata store of another
 
     Info on the metadata objects is placed into a DB dict under the
@@ -244,6 +285,8 @@ def _dump_extracted_metadata(agginto_ds, aggfrom_ds, db, to_save, force_extracti
     agginto_ds : Dataset
     aggfrom_ds : Dataset
     db : dict
+    pool : Executor or None
+      Passed on to `_get_metadata()`.
     """
     subds_relpaths = aggfrom_ds.subdatasets(result_xfm='relpaths', return_type='list')
     # figure out a "state" of the dataset wrt its metadata that we are describing
@@ -315,7 +358,10 @@ def _dump_extracted_metadata(agginto_ds, aggfrom_ds, db, to_save, force_extracti
             metasources['cn'] = {
                 'type': 'content',
                 'targetds': agginto_ds,
-                'dumper': json_py.dump2xzstream}
+                'dumper': json_py.dump2blockstream
+                if agginto_ds.config.obtain(
+                    'datalad.metadata.aggregate-content-format') == 'blocks'
+                else json_py.dump2xzstream}
 
     # check if we have the extracted metadata for this state already
     # either in the source or in the destination dataset
@@ -378,7 +424,9 @@ def _dump_extracted_metadata(agginto_ds, aggfrom_ds, db, to_save, force_extracti
             metasources,
             refcommit,
             subds_relpaths,
-            agg_base_path)
+            agg_base_path,
+            prev_agginfo=None if force_extraction else old_agginfo,
+            pool=pool)
 
     # we did not actually run an extraction, so we need to
     # assemble an aggregation record from the existing pieces
@@ -408,8 +456,7 @@ def _dump_extracted_metadata(agginto_ds, aggfrom_ds, db, to_save, force_extracti
         for objrelpath in objrelpaths.values():
             objpath = op.join(agginto_ds.path, objrelpath)
             objdir = op.dirname(objpath)
-            if not op.exists(objdir):
-                makedirs(objdir)
+            makedirs(objdir, exist_ok=True)
             if op.lexists(objpath):
                 os.unlink(objpath)  # remove previous version first
                 # was a wild thought as a workaround for 
@@ -433,8 +480,49 @@ def _dump_extracted_metadata(agginto_ds, aggfrom_ds, db, to_save, force_extracti
         return False
 
 
+def _get_reusable_content_metadata(ds, prev_agginfo, refcommit, nativetypes):
+    """Return previously aggregated content metadata of unchanged files
+
+    Files are considered unchanged when their Git blob (for annexed files,
+    this represents the annex key) is the same in the previously aggregated
+    and the current state of the dataset. Nothing is reused when the set of
+    extractors, the DataLad version, or the dataset configuration changed.
+
+    Returns
+    -------
+    dict
+      Content metadata records keyed on the path of the file, relative to
+      the dataset.
+    """
+    prev_refcommit = prev_agginfo.get('refcommit')
+    objpath = prev_agginfo.get('content_info')
+    if not prev_refcommit or not refcommit or prev_refcommit == refcommit \
+            or not objpath or not op.exists(objpath) \
+            or prev_agginfo.get('extractors') != nativetypes \
+            or prev_agginfo.get('datalad_version') != datalad.__version__:
+        return {}
+    try:
+        prev_state, state = [
+            {str(p.relative_to(ds.pathobj)): props.get('gitshasum')
+             for p, props in ds.repo.get_content_info(ref=ref).items()}
+            for ref in (prev_refcommit, refcommit)]
+    except Exception as e:
+        # e.g. previously aggregated from a state that is not available
+        lgr.debug('Cannot determine unchanged files in %s: %s',
+                  ds, CapturedException(e))
+        return {}
+    if prev_state.get(DATASET_CONFIG_FILE) != state.get(DATASET_CONFIG_FILE):
+        return {}
+    return {
+        p: meta
+        for p, meta in _iter_content_metadata(objpath, op.curdir)
+        if p in state and state[p] == prev_state.get(p)
+    }
+
+
 def _extract_metadata(agginto_ds, aggfrom_ds, db, to_save, objid, metasources,
-                      refcommit, subds_relpaths, agg_base_path):
+                      refcommit, subds_relpaths, agg_base_path,
+                      prev_agginfo=None, pool=None):
     lgr.debug('Performing metadata extraction from %s', aggfrom_ds)
     # we will replace any conflicting info on this dataset with fresh stuff
     agginfo = db.get(aggfrom_ds.path, {})
@@ -454,7 +542,11 @@ def _extract_metadata(agginto_ds, aggfrom_ds, db, to_save, objid, metasources,
         # on by default
         global_meta=None,
         content_meta=None,
-        paths=relevant_paths)
+        paths=relevant_paths,
+        reuse=_get_reusable_content_metadata(
+            aggfrom_ds, prev_agginfo, refcommit, nativetypes)
+        if prev_agginfo else None,
+        pool=pool)
 
     meta = {
         'ds': dsmeta,
@@ -481,12 +573,14 @@ def _extract_metadata(agginto_ds, aggfrom_ds, db, to_save, objid, metasources,
         objpath = op.join(dest.path, agg_base_path, objrelpath)
 
         # write obj files
-        if op.exists(objpath):
-            dest.unlock(objpath)
-        elif op.lexists(objpath):
-            # if it gets here, we have a symlink that is pointing nowhere
-            # kill it, to be replaced with the newly aggregated content
-            dest.repo.remove(objpath)
+        with _agginto_lock:
+            if op.exists(objpath):
+                dest.unlock(objpath)
+            elif op.lexists(objpath):
+                # if it gets here, we have a symlink that is pointing nowhere
+                # kill it, to be replaced with the newly aggregated content
+                dest.repo.remove(objpath)
+        makedirs(op.dirname(objpath), exist_ok=True)
         # TODO actually dump a compressed file when annexing is possible
         # to speed up on-demand access
         props['dumper'](meta[label], objpath)
@@ -579,6 +673,8 @@ def _get_obj_location(hash_str, ref_type, dumper):
 
     if dumper is json_py.dump2xzstream:
         objrelpath += '.xz'
+    elif dumper is json_py.dump2blockstream:
+        objrelpath += '.jsonblk'
 
     return objrelpath
 
@@ -810,6 +906,14 @@ class AggregateMetaData(Interface):
     for subdatasets that are not available locally. In this case, pre-aggregated
     metadata from the closest available superdataset will be considered instead.
 
+    With --jobs, metadata of multiple datasets is extracted concurrently, and
+    extractors that need file content process chunks of files in parallel
+    processes (when calling from a Python script, the usual precautions for
+    multiprocessing apply, such as an ``if __name__ == '__main__':`` guard).
+    Unless extraction is forced, content metadata reported by such
+    extractors in a previous aggregation is reused for files whose content
+    did not change since.
+
     Depending on the versatility of the present metadata and the number of dataset
     or files, aggregated metadata can grow prohibitively large. A number of
     configuration switches are provided to mitigate such issues.
@@ -893,6 +997,7 @@ class AggregateMetaData(Interface):
             whether change detection indicates that metadata has already been
             extracted for a given dataset state."""),
         save=nosave_opt,
+        jobs=jobs_opt,
     )
 
     @staticmethod
@@ -907,7 +1012,8 @@ class AggregateMetaData(Interface):
             update_mode='target',
             incremental=False,
             force_extraction=False,
-            save=True):
+            save=True,
+            jobs=None):
         refds_path = require_dataset(dataset)
 
         # it really doesn't work without a dataset
@@ -928,6 +1034,8 @@ class AggregateMetaData(Interface):
 
         to_save = []
         to_aggregate = set()
+        # present datasets to extract metadata from, in order of discovery
+        to_extract = []
         paths_by_ds, errors = get_paths_by_ds(
             require_dataset(dataset),
             dataset,
@@ -989,25 +1097,47 @@ class AggregateMetaData(Interface):
                     continue
                 # cue for aggregation
                 to_aggregate.update(res)
-            else:
-                # actually aggregate metadata for this dataset, immediately place
-                # generated objects into the aggregated or reference dataset,
-                # and put info into DB to get the distributed to all datasets
-                # that need to be updated
-                errored = _dump_extracted_metadata(
-                    ds,
-                    Dataset(aggsrc),
-                    agginfo_db,
-                    to_save,
-                    force_extraction,
-                    agg_base_path)
-                if errored:
-                    yield get_status_dict(
-                        status='error',
-                        message='Metadata extraction failed (see previous error message, set datalad.runtime.raiseonerror=yes to fail immediately)',
-                        action='aggregate_metadata',
-                        path=aggsrc,
-                        logger=lgr)
+            elif aggsrc not in to_extract:
+                to_extract.append(aggsrc)
+
+        # actually aggregate metadata for these datasets, immediately place
+        # generated objects into the aggregated or reference dataset,
+        # and put info into DB to get the distributed to all datasets
+        # that need to be updated
+        jobs = ProducerConsumer.get_effective_jobs(jobs) if jobs else 0
+        # datasets are processed in threads, any extraction of content
+        # metadata that needs file content is done by a shared pool of
+        # processes. Processes are spawned, not forked, as other threads
+        # are running at this point
+        pool = _ContentMetadataPool(
+            jobs, mp_context=multiprocessing.get_context('spawn')) \
+            if jobs > 1 else None
+
+        def extract_ds(aggsrc):
+            errored = _dump_extracted_metadata(
+                ds,
+                Dataset(aggsrc),
+                agginfo_db,
+                to_save,
+                force_extraction,
+                agg_base_path,
+                pool=pool)
+            # no result to report on success
+            return get_status_dict(
+                status='error',
+                message='Metadata extraction failed (see previous error message, set datalad.runtime.raiseonerror=yes to fail immediately)',
+                action='aggregate_metadata',
+                path=aggsrc,
+                logger=lgr) if errored else None
+
+        try:
+            for res in ProducerConsumer(to_extract, extract_ds, jobs=jobs):
+                if res:
+                    yield res
+        finally:
+            if pool is not None:
+                pool.cancel_pending()
+                pool.shutdown()
 
         # at this point we have dumped all aggregated metadata into object files
         # somewhere, we know what needs saving, but having saved anything, and
@@ -19,6 +19,7 @@ import os.path as op
 from collections import (
     OrderedDict,
 )
+from itertools import chain
 
 from datalad import cfg
 from datalad.interface.annotate_paths import _minimal_annotate_paths
@@ -42,6 +43,8 @@ from datalad.support.exceptions import CapturedException
 from datalad.support.param import Parameter
 import datalad.support.ansi_colors as ac
 from datalad.support.json_py import (
+    BlockStreamReader,
+    is_blockstream,
     load as jsonload,
     load_xzstream,
 )
@@ -129,6 +132,38 @@ def _load_xz_json_stream(fpath, cache=None):
     return obj
 
 
+def _iter_content_metadata(fpath, rpath, cache=None):
+    """Yield (path, metadata) for content metadata records at or underneath
+    a path
+
+    Objects in the block stream format are read on demand, and only the
+    blocks holding records for the requested path(s) are decompressed.
+    Any other object is loaded entirely (see `_load_xz_json_stream()`).
+    """
+    if cache is None:
+        cache = {}
+    if not op.lexists(fpath):
+        return
+    if fpath not in cache and is_blockstream(fpath):
+        cache[fpath] = BlockStreamReader(fpath)
+    obj = cache.get(fpath, None)
+    if isinstance(obj, BlockStreamReader):
+        # records are sorted by path, all records of interest are in the
+        # range of `rpath` itself, up to the path following any `rpath/...`
+        for rec in obj.iter_range(*(
+                (None, None) if rpath == op.curdir
+                else (rpath, rpath + chr(ord(op.sep) + 1)))):
+            p = rec.pop('path')
+            if rpath == op.curdir or path_startswith(p, rpath):
+                yield p, rec
+        return
+    contentmeta = _load_xz_json_stream(fpath, cache=cache)
+    for p in [f for f in contentmeta.keys()
+              if rpath == op.curdir or
+              path_startswith(f, rpath)]:
+        yield p, contentmeta.get(p, {})
+
+
 def _get_metadatarelevant_paths(ds, subds_relpaths):
     return (f for f in ds.repo.get_files()
             if not any(path_startswith(f, ex)
@@ -356,15 +391,13 @@ def _query_aggregated_metadata_singlepath(
     rparentpath = op.relpath(rpath, start=containing_ds)
 
     # so we have some files to query, and we also have some content metadata
-    contentmeta = _load_xz_json_stream(
+    contentmeta = _iter_content_metadata(
         op.join(agg_base_path, contentinfo_objloc),
-        cache=cache['objcache']) if contentinfo_objloc else {}
+        rparentpath,
+        cache=cache['objcache']) if contentinfo_objloc else []
 
-    for fpath in [f for f in contentmeta.keys()
-                  if rparentpath == op.curdir or
-                  path_startswith(f, rparentpath)]:
+    for fpath, metadata in contentmeta:
         # we might be onto something here, prepare result
-        metadata = contentmeta.get(fpath, {})
 
         # we have to pull out the context for each extractor from the dataset
         # metadata
@@ -429,13 +462,51 @@ def _ok_metadata(meta, mtype, ds, loc):
     return False
 
 
-def _get_metadata(ds, types, global_meta=None, content_meta=None, paths=None):
+# number of files to pass to a single content metadata extraction job
+_content_chunk_size = 100
+
+
+def _get_content_metadata_chunk(dspath, mtype, paths):
+    """Extract content metadata for some files, in an extraction job"""
+    from datalad.support.entrypoints import iter_entrypoints
+    extractor_cls = next(
+        eload for ename, _, eload in iter_entrypoints(
+            'datalad.metadata.extractors')
+        if ename == mtype)()
+    _, contentmeta = extractor_cls(
+        Dataset(dspath), paths=paths).get_metadata(dataset=False, content=True)
+    return list(contentmeta or [])
+
+
+def _iter_content_metadata_chunks(pool, ds, mtype, paths):
+    futures = [
+        pool.submit(_get_content_metadata_chunk, ds.path, mtype,
+                    paths[i:i + _content_chunk_size])
+        for i in range(0, len(paths), _content_chunk_size)]
+    try:
+        for f in futures:
+            yield from f.result()
+    finally:
+        for f in futures:
+            f.cancel()
+
+
+def _get_metadata(ds, types, global_meta=None, content_meta=None, paths=None,
+                  reuse=None, pool=None):
     """Make a direct query of a dataset to extract its metadata.
 
     Parameters
     ----------
     ds : Dataset
     types : list
+    reuse : dict or None
+      Previously extracted content metadata for files whose content did not
+      change since, keyed on path. For any extractor that needs file content
+      (and therefore only depends on the content), these records are used
+      instead of running the extractor on these files again.
+    pool : Executor or None
+      If given, content metadata of extractors that need file content is
+      extracted by jobs for chunks of files that are run by this executor.
     """
     errored = False
     dsmeta = dict()
@@ -509,9 +580,19 @@ def _get_metadata(ds, types, global_meta=None, content_meta=None, paths=None):
             increment=True)
         try:
             extractor_cls = extractors[mtype_key]()
-            extractor = extractor_cls(
-                ds,
-                paths=paths if extractor_cls.NEEDS_CONTENT else fullpathlist)
+            extractor_paths = \
+                paths if extractor_cls.NEEDS_CONTENT else fullpathlist
+            reused = []
+            if extractor_cls.NEEDS_CONTENT and reuse:
+                reused = [(p, reuse[p][mtype_key]) for p in extractor_paths
+                          if mtype_key in reuse.get(p, {})]
+                if reused:
+                    lgr.debug('Reusing %s metadata of %i unchanged files',
+                              mtype_key, len(reused))
+                    reused_paths = set(p for p, _ in reused)
+                    extractor_paths = [p for p in extractor_paths
+                                       if p not in reused_paths]
+            extractor = extractor_cls(ds, paths=extractor_paths)
         except Exception as e:
             log_progress(
                 lgr.error,
@@ -522,16 +603,22 @@ def _get_metadata(ds, types, global_meta=None, content_meta=None, paths=None):
                 "Failed to load metadata extractor for '%s', "
                 "broken dataset configuration (%s)?" %
                 (mtype, ds)) from e
+        want_content = content_meta if content_meta is not None else ds.config.obtain(
+            'datalad.metadata.aggregate-content-{}'.format(mtype.replace('_', '-')),
+            default=True,
+            valtype=EnsureBool())
+        # content metadata extraction is split up into jobs, or not needed
+        # at all when all files have been reused
+        extract_chunks = want_content and extractor_cls.NEEDS_CONTENT and \
+            pool is not None and bool(extractor_paths)
         try:
             dsmeta_t, contentmeta_t = extractor.get_metadata(
                 dataset=global_meta if global_meta is not None else ds.config.obtain(
                     'datalad.metadata.aggregate-dataset-{}'.format(mtype.replace('_', '-')),
                     default=True,
                     valtype=EnsureBool()),
-                content=content_meta if content_meta is not None else ds.config.obtain(
-                    'datalad.metadata.aggregate-content-{}'.format(mtype.replace('_', '-')),
-                    default=True,
-                    valtype=EnsureBool()))
+                content=want_content and not extract_chunks and
+                not (reused and not extractor_paths))
         except Exception as e:
             lgr.error('Failed to get dataset metadata (%s): %s',
                       mtype, CapturedException(e))
@@ -556,6 +643,12 @@ def _get_metadata(ds, types, global_meta=None, content_meta=None, paths=None):
             else:
                 errored = True
 
+        if extract_chunks:
+            contentmeta_t = _iter_content_metadata_chunks(
+                pool, ds, mtype_key, extractor_paths)
+        if want_content and reused:
+            contentmeta_t = chain(reused, contentmeta_t or [])
+
         unique_cm = {}
         extractor_unique_exclude = getattr(extractor_cls, "_unique_exclude", set())
         # TODO: ATM neuroimaging extractors all provide their own internal
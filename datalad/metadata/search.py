@@ -12,14 +12,20 @@
 __docformat__ = 'restructuredtext'
 
 import collections
+import json
 import logging
+import multiprocessing
+import sqlite3
+import zlib
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from datalad.log import log_progress
 lgr = logging.getLogger('datalad.metadata.search')
 
 import os
 import re
 from functools import partial
-from os.path import join as opj, exists
+from os.path import join as opj, exists, dirname
 from os.path import relpath
 from os.path import normpath
 import sys
@@ -39,6 +45,7 @@ from datalad.support.constraints import EnsureInt
 
 from datalad.consts import SEARCH_INDEX_DOTGITDIR
 from datalad.utils import (
+    Path,
     as_unicode,
     ensure_list,
     ensure_unicode,
@@ -48,8 +55,10 @@ from datalad.utils import (
 )
 from datalad.support.exceptions import (
     CapturedException,
+    CommandError,
     NoDatasetFound,
 )
+from datalad.support.json_py import loads as json_loads
 from datalad.ui import ui
 from datalad.dochelpers import single_or_plural
 from datalad.metadata.metadata import query_aggregated_metadata
@@ -308,6 +317,21 @@ def _search_from_virgin_install(dataset, query):
         raise  # this function is called within exception handling block
 
 
+# search backend instance that generates index documents in the processes
+# of a pool, set up once per process
+_index_worker_searcher = None
+
+
+def _init_index_worker(searcher):
+    global _index_worker_searcher
+    _index_worker_searcher = searcher
+
+
+def _run_index_worker(method, aps):
+    # results must be materialized to be sent back to the parent process
+    return list(getattr(_index_worker_searcher, method)(aps))
+
+
 class _Search(object):
     def __init__(self, ds, **kwargs):
         self.ds = ds
@@ -354,6 +378,21 @@ class _WhooshSearch(_Search):
         self.index_dir = opj(str(self.ds.repo.dot_git), SEARCH_INDEX_DOTGITDIR)
         self._mk_search_index(force_reindex)
 
+    # number of datasets to generate index documents for in one go, when
+    # using multiple processes
+    _index_chunk_size = 100
+
+    def __getstate__(self):
+        # only what is needed to generate index documents in another process
+        return dict(
+            ds=self.ds.path,
+            documenttype=self.documenttype,
+            schema=getattr(self, 'schema', None),
+        )
+
+    def __setstate__(self, state):
+        self.__dict__.update(state, ds=Dataset(state['ds']), idx_obj=None)
+
     def show_keys(self, mode, regexes=None):
         """
 
@@ -392,6 +431,63 @@ class _WhooshSearch(_Search):
     def _mk_parser(self):
         raise NotImplementedError
 
+    def _extend_schema(self, writer, aps):
+        """Add any fields needed for the documents of the given datasets
+
+        Only used when an existing index is updated. No-op by default.
+        """
+        pass
+
+    def _get_index_aps(self):
+        """Return annotated paths of all datasets with aggregated metadata
+
+        In the order in which a recursive query would report on them.
+        """
+        from .metadata import load_ds_aggregate_db
+        agginfos, _ = load_ds_aggregate_db(self.ds, warn_absent=False)
+        return [dict(path=self.ds.path, type='dataset')] + [
+            dict(path=normpath(opj(self.ds.path, p)), type='dataset')
+            for p in sorted(agginfos) if p != os.curdir]
+
+    def _get_index_jobs(self, n):
+        """Return the number of processes to use for indexing `n` datasets"""
+        jobs = cfg.obtain('datalad.search.indexerjobs')
+        # no point in processes without enough datasets to keep them busy
+        return max(1, min(jobs, -(-n // self._index_chunk_size)))
+
+    def _map_index_chunks(self, method, aps):
+        """Call a generator method on chunks of datasets, in a process pool if useful
+
+        Iterables of results are yielded in the order of `aps`. Only a
+        limited number of chunks is processed ahead of the consumption of the
+        results, to not hold the documents for all datasets in memory.
+        Without a pool, the method is called once for all datasets and its
+        results are streamed.
+        """
+        jobs = self._get_index_jobs(len(aps))
+        if jobs < 2:
+            yield getattr(self, method)(aps)
+            return
+        chunks = [aps[i:i + self._index_chunk_size]
+                  for i in range(0, len(aps), self._index_chunk_size)]
+        lgr.debug('Processing %i chunks of datasets with %i processes',
+                  len(chunks), jobs)
+        # processes are spawned, not forked, to not inherit the state of
+        # any threads or open repositories of this process
+        with ProcessPoolExecutor(
+                jobs,
+                mp_context=multiprocessing.get_context('spawn'),
+                initializer=_init_index_worker,
+                initargs=(self,)) as executor:
+            pending = deque()
+            for chunk in chunks:
+                pending.append(
+                    executor.submit(_run_index_worker, method, chunk))
+                if len(pending) >= 2 * jobs:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+
     def _mk_search_index(self, force_reindex):
         """Generic entrypoint to index generation
 
@@ -405,25 +501,21 @@ class _WhooshSearch(_Search):
         dbloc, db_base_path = get_ds_aggregate_db_locations(self.ds)
         # what is the latest state of aggregated metadata
         metadata_state = self.ds.repo.get_last_commit_hexsha(relpath(dbloc, start=self.ds.path))
-        # use location common to all index types, they would all invalidate
-        # simultaneously
-        stamp_fname = opj(self.index_dir, 'datalad_metadata_state')
         index_dir = opj(self.index_dir, self._mode_label)
+        # each index type records the state it was built from, as they
+        # may be updated independently
+        stamp_fname = opj(
+            self.index_dir,
+            'datalad_metadata_state_{}'.format(self._mode_label))
 
+        idx_obj = None
         if (not force_reindex) and \
                 exists(index_dir) and \
-                exists(stamp_fname) and \
-                open(stamp_fname).read() == metadata_state:
+                exists(stamp_fname):
             try:
                 # TODO check that the index schema is the same
                 # as the one we would have used for reindexing
-                # TODO support incremental re-indexing, whoosh can do it
-                idx = widx.open_dir(index_dir)
-                lgr.debug(
-                    'Search index contains %i documents',
-                    idx.doc_count())
-                self.idx_obj = idx
-                return
+                idx_obj = widx.open_dir(index_dir)
             except widx.LockError as e:
                 raise e
             except widx.IndexError as e:
@@ -460,6 +552,22 @@ class _WhooshSearch(_Search):
                 else:
                     raise
 
+        if idx_obj is not None:
+            with open(stamp_fname) as f:
+                indexed_state = f.read()
+            if indexed_state == metadata_state or (
+                    metadata_state and
+                    self._update_search_index(
+                        idx_obj, indexed_state, dbloc)):
+                if indexed_state != metadata_state:
+                    with open(stamp_fname, 'w') as f:
+                        f.write(metadata_state)
+                lgr.debug(
+                    'Search index contains %i documents',
+                    idx_obj.doc_count())
+                self.idx_obj = idx_obj
+                return
+
         lgr.info('{} search index'.format(
             'Rebuilding' if exists(index_dir) else 'Building'))
 
@@ -474,20 +582,106 @@ class _WhooshSearch(_Search):
 
         self._mk_schema(dsinfo)
 
+        # load metadata of the base dataset and what it knows about all its subdatasets
+        # (recursively)
+        aps = self._get_index_aps()
+        jobs = self._get_index_jobs(len(aps))
         idx_obj = widx.create_in(index_dir, self.schema)
         idx = idx_obj.writer(
             # cache size per process
             limitmb=cfg.obtain('datalad.search.indexercachesize'),
-            # disable parallel indexing for now till #1927 is resolved
-            ## number of processes for indexing
-            #procs=multiprocessing.cpu_count(),
-            ## write separate index segments in each process for speed
-            ## asks for writer.commit(optimize=True)
-            #multisegment=True,
+            # parallel indexing was disabled till #1927 is resolved, it is
+            # only enabled on request (datalad.search.indexerjobs)
+            **(dict(
+                # number of processes for indexing
+                procs=jobs,
+                # write separate index segments in each process for speed,
+                # they are merged by the optimizing commit below
+                multisegment=True,
+            ) if jobs > 1 else {})
         )
+        idx_size = self._add_documents(idx, aps, total=len(dsinfo))
 
-        # load metadata of the base dataset and what it knows about all its subdatasets
-        # (recursively)
+        lgr.debug("Committing index")
+        idx.commit(optimize=True)
+
+        # "timestamp" the search index to allow for automatic invalidation
+        with open(stamp_fname, 'w') as f:
+            f.write(metadata_state)
+
+        lgr.info('Search index contains %i documents', idx_size)
+        self.idx_obj = idx_obj
+
+    def _update_search_index(self, idx_obj, indexed_state, dbloc):
+        """Update an existing index to the current aggregated metadata
+
+        Only documents of datasets whose record in the aggregated metadata
+        DB differs from the one at the indexed state are replaced.
+
+        Returns
+        -------
+        bool
+          False, if the index could not be updated, and needs to be rebuilt.
+        """
+        from whoosh.query import (
+            And,
+            Or,
+            Term,
+        )
+        from .metadata import load_ds_aggregate_db
+        try:
+            prev_agginfos = json_loads(self.ds.repo.call_git(
+                ['show', '{}:{}'.format(
+                    indexed_state,
+                    Path(relpath(dbloc, start=self.ds.path)).as_posix())],
+                read_only=True))
+        except (CommandError, ValueError) as e:
+            lgr.debug(
+                'Cannot determine indexed metadata state, will rebuild: %s',
+                CapturedException(e))
+            return False
+        agginfos, _ = load_ds_aggregate_db(self.ds, warn_absent=False)
+        # the records point to metadata objects with content-based names,
+        # any change to the metadata of a dataset changes its record
+        changed = sorted(
+            p for p in set(prev_agginfos).union(agginfos)
+            if prev_agginfos.get(p) != agginfos.get(p))
+        lgr.info('Updating search index for %s',
+                 single_or_plural('dataset', 'datasets', len(changed),
+                                  include_count=True))
+        if not changed:
+            return True
+
+        writer = idx_obj.writer(
+            limitmb=cfg.obtain('datalad.search.indexercachesize'))
+        try:
+            for rpath in changed:
+                # the dataset document and all file documents of it
+                writer.delete_by_query(Or([
+                    And([Term('type', 'dataset'), Term('path', rpath)]),
+                    Term('parentds', rpath),
+                ]))
+            aps = [dict(path=normpath(opj(self.ds.path, p)), type='dataset')
+                   for p in changed if p in agginfos]
+            if aps:
+                self._extend_schema(writer, aps)
+                self._add_documents(writer, aps, total=len(aps))
+        except BaseException:
+            writer.cancel()
+            raise
+        lgr.debug("Committing index")
+        # no optimization, to not rewrite the entire index
+        writer.commit()
+        return True
+
+    def _add_documents(self, idx, aps, total):
+        """Add the documents for the given datasets to the index
+
+        Returns
+        -------
+        int
+          Number of documents added.
+        """
         old_idx_size = 0
         old_ds_rpath = ''
         idx_size = 0
@@ -495,50 +689,34 @@ class _WhooshSearch(_Search):
             lgr.info,
             'autofieldidxbuild',
             'Start building search index',
-            total=len(dsinfo),
+            total=total,
             label='Building search index',
             unit=' Datasets',
         )
-        for res in query_aggregated_metadata(
-                reporton=self.documenttype,
-                ds=self.ds,
-                aps=[dict(path=self.ds.path, type='dataset')],
-                # MIH: I cannot see a case when we would not want recursion (within
-                # the metadata)
-                recursive=True):
-            # this assumes that files are reported after each dataset report,
-            # and after a subsequent dataset report no files for the previous
-            # dataset will be reported again
-            meta = res.get('metadata', {})
-            doc = self._meta2doc(meta)
-            admin = {
-                'type': res['type'],
-                'path': relpath(res['path'], start=self.ds.path),
-            }
-            if 'parentds' in res:
-                admin['parentds'] = relpath(res['parentds'], start=self.ds.path)
-            if admin['type'] == 'dataset':
-                if old_ds_rpath:
-                    lgr.debug(
-                        'Added %s on dataset %s',
-                        single_or_plural(
-                            'document',
-                            'documents',
-                            idx_size - old_idx_size,
-                            include_count=True),
-                        old_ds_rpath)
-                log_progress(lgr.info, 'autofieldidxbuild',
-                             'Indexed dataset at %s', old_ds_rpath,
-                             update=1, increment=True)
-                old_idx_size = idx_size
-                old_ds_rpath = admin['path']
-                admin['id'] = res.get('dsid', None)
-
-            doc.update({k: ensure_unicode(v) for k, v in admin.items()})
-            lgr.debug("Adding document to search index: {}".format(doc))
-            # inject into index
-            idx.add_document(**doc)
-            idx_size += 1
+        for docs in self._map_index_chunks('_iter_documents', aps):
+            for doc in docs:
+                # files are reported after each dataset report, and after a
+                # subsequent dataset report no files for the previous dataset
+                # will be reported again
+                if doc['type'] == 'dataset':
+                    if old_ds_rpath:
+                        lgr.debug(
+                            'Added %s on dataset %s',
+                            single_or_plural(
+                                'document',
+                                'documents',
+                                idx_size - old_idx_size,
+                                include_count=True),
+                            old_ds_rpath)
+                    log_progress(lgr.info, 'autofieldidxbuild',
+                                 'Indexed dataset at %s', old_ds_rpath,
+                                 update=1, increment=True)
+                    old_idx_size = idx_size
+                    old_ds_rpath = doc['path']
+                lgr.debug("Adding document to search index: {}".format(doc))
+                # inject into index
+                idx.add_document(**doc)
+                idx_size += 1
 
         if old_ds_rpath:
             lgr.debug(
@@ -550,17 +728,29 @@ class _WhooshSearch(_Search):
                     include_count=True),
                 old_ds_rpath)
 
-        lgr.debug("Committing index")
-        idx.commit(optimize=True)
         log_progress(
             lgr.info, 'autofieldidxbuild', 'Done building search index')
+        return idx_size
 
-        # "timestamp" the search index to allow for automatic invalidation
-        with open(stamp_fname, 'w') as f:
-            f.write(metadata_state)
-
-        lgr.info('Search index contains %i documents', idx_size)
-        self.idx_obj = idx_obj
+    def _iter_documents(self, aps):
+        """Yield the index documents for the given datasets"""
+        for res in query_aggregated_metadata(
+                reporton=self.documenttype,
+                ds=self.ds,
+                aps=aps,
+                recursive=False):
+            meta = res.get('metadata', {})
+            doc = self._meta2doc(meta)
+            admin = {
+                'type': res['type'],
+                'path': relpath(res['path'], start=self.ds.path),
+            }
+            if 'parentds' in res:
+                admin['parentds'] = relpath(res['parentds'], start=self.ds.path)
+            if admin['type'] == 'dataset':
+                admin['id'] = res.get('dsid', None)
+            doc.update({k: ensure_unicode(v) for k, v in admin.items()})
+            yield doc
 
     def __call__(self, query, max_nresults=None, force_reindex=False, full_record=False):
         if max_nresults is None:
@@ -722,28 +912,54 @@ class _AutofieldSearch(_WhooshSearch):
             label='Building search schema',
             unit=' Datasets',
         )
+        for keys in self._map_index_chunks(
+                '_iter_schema_keys', self._get_index_aps()):
+            for path, idxd in keys:
+                for k in idxd:
+                    schema_fields[k] = wf.TEXT(stored=False,
+                                               analyzer=SimpleAnalyzer())
+                log_progress(lgr.info, 'idxschemabuild',
+                             'Scanned dataset at %s', path,
+                             update=1, increment=True)
+        log_progress(
+            lgr.info, 'idxschemabuild', 'Done building search schema')
+
+        self.schema = wf.Schema(**schema_fields)
+
+    def _extend_schema(self, writer, aps):
+        from whoosh import fields as wf
+        from whoosh.analysis import SimpleAnalyzer
+
+        known = set(writer.schema.names())
+        for _, idxd in self._iter_schema_keys(aps):
+            for k in idxd:
+                if k not in known:
+                    writer.add_field(
+                        k, wf.TEXT(stored=False, analyzer=SimpleAnalyzer()))
+                    known.add(k)
+        self.schema = writer.schema
+
+    def _iter_schema_keys(self, aps):
+        """Yield the metadata keys of the given datasets
+
+        Yields
+        ------
+        tuple
+          (path, keys) for each dataset.
+        """
         for res in query_aggregated_metadata(
                 # XXX TODO After #2156 datasets may not necessarily carry all
                 # keys in the "unique" summary
                 reporton='datasets',
                 ds=self.ds,
-                aps=[dict(path=self.ds.path, type='dataset')],
-                recursive=True):
-            meta = res.get('metadata', {})
-            # no stringification of values for speed, we do not need/use the
-            # actual values at this point, only the keys
-            idxd = _meta2autofield_dict(meta, val2str=False)
-
-            for k in idxd:
-                schema_fields[k] = wf.TEXT(stored=False,
-                                           analyzer=SimpleAnalyzer())
-            log_progress(lgr.info, 'idxschemabuild',
-                         'Scanned dataset at %s', res['path'],
-                         update=1, increment=True)
-        log_progress(
-            lgr.info, 'idxschemabuild', 'Done building search schema')
-
-        self.schema = wf.Schema(**schema_fields)
+                aps=aps,
+                recursive=False):
+            yield (
+                res['path'],
+                # no stringification of values for speed, we do not need/use
+                # the actual values at this point, only the keys
+                list(_meta2autofield_dict(res.get('metadata', {}),
+                                          val2str=False)))
 
     def _mk_parser(self):
         from whoosh import qparser as qparse
@@ -761,13 +977,202 @@ class _AutofieldSearch(_WhooshSearch):
         self.parser = parser
 
 
+class _FlatMetadataStore(object):
+    """Persistent store of flattened metadata records for egrep-style search
+
+    Records are kept in an SQLite database that is built once for a given
+    state of the aggregated metadata. Keys are interned, and all key/value
+    items of all records are kept in a single table. A query expression is
+    evaluated in a single scan over the values of the keys it can match.
+    """
+    _version = 1
+
+    # characters that a case-insensitive Python regex matches in place of an
+    # ASCII letter, in addition to its upper and lower case variant
+    _ci_equivalents = {u'\u0130': 'i', u'\u0131': 'i', u'\u212a': 'k',
+                       u'\u017f': 's'}
+
+    def __init__(self, path, state):
+        self.path = path
+        self.state = state
+        self._db = None
+
+    def _get_info(self):
+        return {'version': str(self._version), 'state': self.state}
+
+    def open(self):
+        """Open an existing store
+
+        Returns
+        -------
+        bool
+          False, if there is no store matching the state.
+        """
+        if not exists(self.path):
+            return False
+        try:
+            db = sqlite3.connect(self.path)
+            info = dict(db.execute('SELECT name, value FROM info'))
+        except sqlite3.Error as e:
+            lgr.debug('Cannot use search store %s: %s',
+                      self.path, CapturedException(e))
+            return False
+        if info != self._get_info():
+            db.close()
+            return False
+        self._db = db
+        return True
+
+    def build(self, records):
+        """Build the store from scratch
+
+        Parameters
+        ----------
+        records : iterable
+          (record, items) tuples. `record` is the JSON-serializable result
+          to report for a hit, `items` the dict of flattened key/value items
+          to search.
+        """
+        os.makedirs(dirname(self.path), exist_ok=True)
+        # build aside, and replace atomically, concurrent searches could
+        # still use a previous version
+        tmp_path = '{}.{}.tmp'.format(self.path, os.getpid())
+        if exists(tmp_path):
+            os.unlink(tmp_path)
+        db = sqlite3.connect(tmp_path)
+        try:
+            db.executescript("""
+                CREATE TABLE info (name TEXT PRIMARY KEY, value TEXT);
+                CREATE TABLE keys (id INTEGER PRIMARY KEY, name TEXT);
+                CREATE TABLE records (id INTEGER PRIMARY KEY, record BLOB);
+                CREATE TABLE items (record INTEGER, key INTEGER, value);
+            """)
+            key_ids = {}
+            for i, (record, items) in enumerate(records):
+                db.execute(
+                    'INSERT INTO records VALUES (?, ?)',
+                    (i, zlib.compress(json.dumps(record).encode())))
+                db.executemany(
+                    'INSERT INTO items VALUES (?, ?, ?)',
+                    ((i, key_ids.setdefault(k, len(key_ids)), v)
+                     for k, v in items.items()))
+            db.executemany(
+                'INSERT INTO keys VALUES (?, ?)',
+                ((i, k) for k, i in key_ids.items()))
+            db.execute('CREATE INDEX items_key ON items (key)')
+            db.executemany(
+                'INSERT INTO info VALUES (?, ?)', self._get_info().items())
+            db.commit()
+        except BaseException:
+            db.close()
+            os.unlink(tmp_path)
+            raise
+        db.close()
+        os.replace(tmp_path, self.path)
+        self._db = sqlite3.connect(self.path)
+
+    def close(self):
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+
+    def search(self, query):
+        """Find records matching all query expressions
+
+        Parameters
+        ----------
+        query : list
+          Compiled expressions as produced by `_EGrepCSSearch.get_query()`.
+
+        Yields
+        ------
+        tuple
+          (record, matched) in the order in which records were stored.
+          `matched` maps keys to the matching part of their value.
+        """
+        keys = dict(self._db.execute('SELECT name, id FROM keys'))
+        key_names = {i: k for k, i in keys.items()}
+        hits = None
+        for q in query:
+            if isinstance(q, dict):
+                key_ids = [i for k, i in keys.items() if q['field'].match(k)]
+                if not key_ids:
+                    return
+                q = q['query']
+            else:
+                key_ids = None
+            matches = self._match(q, key_ids)
+            # AND behavior across query expressions
+            hits = matches if hits is None else {
+                r: hits[r] + m for r, m in matches.items() if r in hits}
+            if not hits:
+                return
+        for rid in sorted(hits):
+            record, = self._db.execute(
+                'SELECT record FROM records WHERE id = ?', (rid,)).fetchone()
+            yield (json.loads(zlib.decompress(record).decode()),
+                   {key_names[k]: m for k, m in hits[rid]})
+
+    def _match(self, regex, key_ids):
+        """Return {record: [(key, match)]} for items matching a regex"""
+        def search(value):
+            m = regex.search(value) if isinstance(value, str) else None
+            return m.group() if m else None
+
+        self._db.create_function(
+            'dl_search', 1, search,
+            # allows SQLite to optimize calls of the function
+            # (keyword only available since Python 3.8)
+            **(dict(deterministic=True) if sys.version_info >= (3, 8)
+               else {}))
+        conds = []
+        params = []
+        if key_ids is not None:
+            conds.append('key IN ({})'.format(','.join('?' * len(key_ids))))
+            params.extend(key_ids)
+        prefilter = self._get_prefilter(regex)
+        if prefilter:
+            conds.append(prefilter[0])
+            params.append(prefilter[1])
+        matches = {}
+        for rid, key, m in self._db.execute(
+                'SELECT * FROM (SELECT record, key, dl_search(value) AS m '
+                'FROM items{}) WHERE m IS NOT NULL'.format(
+                    ' WHERE ' + ' AND '.join(conds) if conds else ''),
+                params):
+            matches.setdefault(rid, []).append((key, m))
+        return matches
+
+    def _get_prefilter(self, regex):
+        """Return an SQL condition and its parameter for literal expressions
+
+        The condition selects a superset of the items the expression matches,
+        and can be evaluated without calling back into Python.
+        """
+        pattern = regex.pattern
+        ci = pattern.startswith('(?i)')
+        if ci:
+            pattern = pattern[4:]
+        if not pattern or any(c in pattern for c in '.^$*+?{}[]\\|()'):
+            return None
+        if not ci:
+            return 'instr(value, ?)', pattern
+        if not pattern.isascii():
+            return None
+        value = 'value'
+        for c, ascii_c in self._ci_equivalents.items():
+            value = "replace({}, '{}', '{}')".format(value, c, ascii_c)
+        return 'instr(lower({}), ?)'.format(value), pattern.lower()
+
+
 class _EGrepCSSearch(_Search):
     _mode_label = 'egrepcs'
     _default_documenttype = 'datasets'
 
-    def __init__(self, ds, **kwargs):
+    def __init__(self, ds, force_reindex=False, **kwargs):
         super(_EGrepCSSearch, self).__init__(ds, **kwargs)
         self._queried_keys = None  # to be memoized by get_query
+        self._force_reindex = force_reindex
 
     # If there were custom "per-search engine" options, we could expose
     # --consider_ucn - search through unique content properties of the dataset
@@ -778,25 +1183,91 @@ class _EGrepCSSearch(_Search):
             max_nresults = 0
         query = self.get_query(query)
 
+        store = None if consider_ucn else self._get_store()
+        if store is None:
+            hits = self._iter_hits(query, consider_ucn)
+        else:
+            lgr.log(7, "Querying %s", query)
+            t0 = time()
+            hits = store.search(query)
         nhits = 0
-        for res in query_aggregated_metadata(
-                reporton=self.documenttype,
-                ds=self.ds,
-                aps=[dict(path=self.ds.path, type='dataset')],
-                # MIH: I cannot see a case when we would not want recursion (within
-                # the metadata)
-                recursive=True):
+        try:
+            for res, matched in hits:
+                hit = dict(
+                    res,
+                    action='search',
+                    query_matched=matched,
+                )
+                yield hit
+                nhits += 1
+                if max_nresults and nhits == max_nresults:
+                    # report query stats
+                    topstr = '{} top {}'.format(
+                        max_nresults,
+                        single_or_plural('match', 'matches', max_nresults)
+                    )
+                    lgr.info(
+                        "Reached the limit of {}, there could be more which "
+                        "were not reported.".format(topstr)
+                    )
+                    break
+        finally:
+            if store is not None:
+                lgr.log(7, "Finished querying in %f sec", time() - t0)
+                store.close()
+
+    def _get_store(self):
+        """Return a store of flattened metadata for the current metadata
+
+        The store is built if needed. None is returned if there is no
+        aggregated metadata to build a store from.
+        """
+        from .metadata import get_ds_aggregate_db_locations
+        dbloc, _ = get_ds_aggregate_db_locations(self.ds, warn_absent=False)
+        metadata_state = self.ds.repo.get_last_commit_hexsha(
+            relpath(dbloc, start=self.ds.path))
+        if not metadata_state:
+            return None
+        store = _FlatMetadataStore(
+            opj(str(self.ds.repo.dot_git), SEARCH_INDEX_DOTGITDIR, 'egrep',
+                '{}.sqlite'.format(self.documenttype)),
+            # absolute paths are stored
+            '{}:{}'.format(metadata_state, self.ds.path))
+        if self._force_reindex or not store.open():
+            lgr.info('Building metadata store for search')
+            store.build(
+                (res, self._meta2items(res, consider_ucn=False))
+                for res in self._query_metadata())
+        return store
+
+    def _query_metadata(self):
+        return query_aggregated_metadata(
+            reporton=self.documenttype,
+            ds=self.ds,
+            aps=[dict(path=self.ds.path, type='dataset')],
+            # MIH: I cannot see a case when we would not want recursion (within
+            # the metadata)
+            recursive=True)
+
+    @staticmethod
+    def _meta2items(res, consider_ucn):
+        meta = res.get('metadata', {})
+        # produce a flattened metadata dict to search through
+        doc = _meta2autofield_dict(meta, val2str=True, consider_ucn=consider_ucn)
+        # inject a few basic properties into the dict
+        # analog to what the other modes do in their index
+        doc.update({
+            k: res[k] for k in ('@id', 'type', 'path', 'parentds')
+            if k in res})
+        return doc
+
+    def _iter_hits(self, query, consider_ucn):
+        """Match the query against all metadata records, one by one"""
+        for res in self._query_metadata():
             # this assumes that files are reported after each dataset report,
             # and after a subsequent dataset report no files for the previous
             # dataset will be reported again
-            meta = res.get('metadata', {})
-            # produce a flattened metadata dict to search through
-            doc = _meta2autofield_dict(meta, val2str=True, consider_ucn=consider_ucn)
-            # inject a few basic properties into the dict
-            # analog to what the other modes do in their index
-            doc.update({
-                k: res[k] for k in ('@id', 'type', 'path', 'parentds')
-                if k in res})
+            doc = self._meta2items(res, consider_ucn)
             # use search instead of match to not just get hits at the start of the string
             # this will be slower, but avoids having to use actual regex syntax at the user
             # side even for simple queries
@@ -818,24 +1289,7 @@ class _EGrepCSSearch(_Search):
             # for multiple queries, this makes it consistent with a query that
             # has no field specification
             if matched and len(query) == len(set(k[0] for k in matches if matches[k])):
-                hit = dict(
-                    res,
-                    action='search',
-                    query_matched=matched,
-                )
-                yield hit
-                nhits += 1
-                if max_nresults and nhits == max_nresults:
-                    # report query stats
-                    topstr = '{} top {}'.format(
-                        max_nresults,
-                        single_or_plural('match', 'matches', max_nresults)
-                    )
-                    lgr.info(
-                        "Reached the limit of {}, there could be more which "
-                        "were not reported.".format(topstr)
-                    )
-                    break
+                yield res, matched
 
     def show_keys(self, mode=None, regexes=None):
         """
@@ -1086,12 +1540,12 @@ class Search(Interface):
     simply perform matching of a search pattern against a flat
     string-representation of metadata. This is advantageous when the query is
     simple and the metadata structure is irrelevant, or precisely known.
-    Moreover, it does not require a search index, hence results can be reported
-    without an initial latency for building a search index when the underlying
-    metadata has changed (e.g. due to a dataset update). By default, these
-    search modes only consider datasets and do not investigate records for
-    individual files for speed reasons. Search results are reported in the
-    order in which they were discovered.
+    Flattened metadata is kept in a lightweight store that is built in a single
+    pass whenever the underlying metadata has changed (e.g. due to a dataset
+    update), with much less initial latency than building a full search index.
+    By default, these search modes only consider datasets and do not
+    investigate records for individual files for speed reasons. Search results
+    are reported in the order in which they were discovered.
 
     Queries can make use of Python regular expression syntax
     (https://docs.python.org/3/library/re.html). In `egrep` mode, matching is
@@ -11,13 +11,22 @@
 
 
 import os.path as op
+from concurrent.futures import ThreadPoolExecutor
 from os.path import join as opj
+from unittest.mock import patch
 
 from datalad.api import metadata
 from datalad.distribution.dataset import Dataset
+from datalad.metadata.aggregate import _get_reusable_content_metadata
+from datalad.metadata.extractors.base import BaseMetadataExtractor
+from datalad.metadata.metadata import (
+    _get_metadata,
+    load_ds_aggregate_db,
+)
 from datalad.tests.utils_pytest import (
     assert_dict_equal,
     assert_false,
+    assert_in,
     assert_not_in,
     assert_repo_status,
     assert_result_count,
@@ -418,3 +427,137 @@ def test_partial_aggregation(path=None):
     #res = ds.metadata(get_aggregates=True)
     #assert_result_count(res, 3)
     #assert_result_count(res, 1, path=sub2.path)
+
+
+@known_failure_githubci_win
+@with_tree({
+    'top': 'file',
+    'dir': {'one': '1', 'two': '2'},
+    'dir.txt': 'next to dir',
+    'dirt': {'three': '3'}})
+def test_aggregate_blockstream_content(path=None):
+    ds = Dataset(path).create(force=True)
+    ds.save()
+    ds.aggregate_metadata()
+    queries = ('top', 'dir', opj('dir', 'two'), 'dir.txt', 'nothing')
+    target = {
+        q: [(r['path'], r['metadata'])
+            for r in ds.metadata(q, reporton='files', on_failure='ignore')
+            if r['status'] == 'ok']
+        for q in queries}
+    assert_result_count(
+        ds.metadata(reporton='files'), 5, type='file')
+    eq_(len(target['dir']), 2)
+    eq_(len(target[opj('dir', 'two')]), 1)
+
+    ds.config.set('datalad.metadata.aggregate-content-format', 'blocks',
+                  scope='local')
+    ds.aggregate_metadata(force_extraction=True)
+    cnobjs = [o for o in _get_referenced_objs(ds)
+              if op.basename(o).startswith('cn-')]
+    eq_(len(cnobjs), 1)
+    assert_true(cnobjs[0].endswith('.jsonblk'))
+    eq_(target,
+        {q: [(r['path'], r['metadata'])
+             for r in ds.metadata(q, reporton='files', on_failure='ignore')
+             if r['status'] == 'ok']
+         for q in queries})
+
+
+class _CountingExtractor(BaseMetadataExtractor):
+    # paths content metadata was extracted for
+    extracted = []
+
+    def _get_dataset_metadata(self):
+        return {'name': 'counted'}
+
+    def _get_content_metadata(self):
+        for p in self.paths:
+            self.extracted.append(p)
+            with open(opj(self.ds.path, p)) as f:
+                yield p, {'content': f.read()}
+
+
+@with_tree({'one': '1', 'two': '2', 'three': '3'})
+def test_get_metadata_reuse_and_pool(path=None):
+    ds = Dataset(path).create(force=True)
+    ds.save()
+    paths = ['one', 'three', 'two']
+    with patch('datalad.support.entrypoints.iter_entrypoints',
+               lambda group: [('counting', __name__,
+                               lambda: _CountingExtractor)]), \
+            patch.object(_CountingExtractor, 'extracted', []) as extracted:
+        dsmeta, contentmeta, errored = _get_metadata(
+            ds, ['counting'], paths=paths)
+        assert_false(errored)
+        eq_(sorted(extracted), paths)
+        eq_(contentmeta['one'], {'counting': {'content': '1'}})
+        eq_(dsmeta['datalad_unique_content_properties']['counting'],
+            {'content': ['1', '2', '3']})
+
+        # stale records of unchanged files are reused, nothing else
+        del extracted[:]
+        res = _get_metadata(
+            ds, ['counting'], paths=paths,
+            reuse={'one': {'counting': {'content': 'old'}},
+                   'two': {'annex': {'key': 'some'}}})
+        eq_(sorted(extracted), ['three', 'two'])
+        eq_(res[1]['one'], {'counting': {'content': 'old'}})
+        eq_(res[0]['datalad_unique_content_properties']['counting'],
+            {'content': ['2', '3', 'old']})
+
+        # identical results with extraction jobs for chunks of files
+        del extracted[:]
+        with ThreadPoolExecutor(2) as pool, \
+                patch('datalad.metadata.metadata._content_chunk_size', 1):
+            eq_(_get_metadata(ds, ['counting'], paths=paths, pool=pool),
+                (dsmeta, contentmeta, errored))
+        eq_(sorted(extracted), paths)
+
+
+@with_tree({'one': '1', 'two': '2'})
+def test_get_reusable_content_metadata(path=None):
+    ds = Dataset(path).create(force=True)
+    ds.save()
+    ds.aggregate_metadata()
+    agginfo = load_ds_aggregate_db(ds, abspath=True)[ds.path]
+    extractors = agginfo['extractors']
+    # nothing to reuse for the same state
+    eq_(_get_reusable_content_metadata(
+        ds, agginfo, agginfo['refcommit'], extractors), {})
+
+    ds.unlock('two')
+    (ds.pathobj / 'two').write_text('changed')
+    ds.save()
+    refcommit = ds.repo.get_hexsha()
+    reuse = _get_reusable_content_metadata(
+        ds, agginfo, refcommit, extractors)
+    eq_(list(reuse), ['one'])
+    assert_in('annex', reuse['one'])
+    # no reuse across changes of the extractor setup
+    eq_(_get_reusable_content_metadata(
+        ds, agginfo, refcommit, extractors + ['datalad_rfc822']), {})
+    # or when the previous state is unknown
+    eq_(_get_reusable_content_metadata(
+        ds, dict(agginfo, refcommit='0' * 40), refcommit, extractors), {})
+
+
+@known_failure_githubci_win
+@with_tree(tree=_dataset_hierarchy_template)
+def test_aggregate_jobs(path=None):
+    base = Dataset(opj(path, 'origin')).create(force=True)
+    base.create('sub', force=True)
+    base.create(opj('sub', 'subsub'), force=True)
+    for d in (base.path, opj(base.path, 'sub')):
+        Dataset(d).config.add('datalad.metadata.nativetype',
+                              'datalad_rfc822', scope='branch')
+    base.save(recursive=True)
+    base.aggregate_metadata(recursive=True)
+    target = base.metadata(recursive=True, reporton='all',
+                           return_type='list')
+    assert_result_count(target, 3, type='dataset')
+    res = base.aggregate_metadata(recursive=True, force_extraction=True,
+                                  jobs=2)
+    assert_status(('ok', 'notneeded'), res)
+    eq_(base.metadata(recursive=True, reporton='all', return_type='list'),
+        target)
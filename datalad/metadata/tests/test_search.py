@@ -33,6 +33,7 @@ from datalad.tests.utils_pytest import (
     assert_equal,
     assert_in,
     assert_is_generator,
+    assert_not_in,
     assert_raises,
     assert_re_in,
     assert_repo_status,
@@ -52,6 +53,9 @@ from datalad.utils import (
 
 from ..indexers.base import MetadataIndexer
 from ..search import (
+    _BlobSearch,
+    _EGrepCSSearch,
+    _WhooshSearch,
     _listdict2dictlist,
     _meta2autofield_dict,
 )
@@ -483,3 +487,138 @@ def test_multiple_entry_points():
             'extr1.prop1': 'value'
         }
     )
+
+
+@with_tempfile(mkdir=True)
+def test_incremental_index_update(path=None):
+    def set_meta(ds, name):
+        metafile = ds.pathobj / '.datalad' / 'meta.rfc822'
+        if metafile.exists():
+            metafile.unlink()
+        metafile.write_text(name)
+
+    ds = Dataset(path).create()
+    subs = []
+    for name in ('sub1', 'sub2'):
+        sub = ds.create(name)
+        sub.config.add('datalad.metadata.nativetype', 'datalad_rfc822',
+                       scope='branch')
+        set_meta(sub, 'Name: apple{}\n'.format(name))
+        sub.save()
+        subs.append(sub)
+    ds.save()
+    ds.aggregate_metadata(recursive=True)
+    for mode in ('textblob', 'autofield'):
+        assert_result_count(
+            ds.search('applesub1', mode=mode), 1, path=subs[0].path)
+
+    # new metadata for a single subdataset, with a previously unknown key
+    set_meta(subs[0], 'Name: banana\nVersion: 2\n')
+    (subs[0].pathobj / 'file').write_text('content')
+    subs[0].save()
+    ds.save()
+    ds.aggregate_metadata(recursive=True)
+    for mode in ('textblob', 'autofield'):
+        with swallow_logs(new_level=logging.INFO) as cml:
+            assert_result_count(
+                ds.search('banana', mode=mode), 1, path=subs[0].path)
+            assert_in('Updating search index for 1 dataset', cml.out)
+            assert_not_in('Rebuilding search index', cml.out)
+        # outdated documents are gone, unaffected ones kept
+        assert_result_count(ds.search('applesub1', mode=mode), 0)
+        assert_result_count(
+            ds.search('applesub2', mode=mode), 1, path=subs[1].path)
+    assert_result_count(
+        ds.search('datalad_rfc822.version:2', mode='autofield'),
+        1, path=subs[0].path)
+    # nothing to be done when nothing changed
+    with swallow_logs(new_level=logging.DEBUG) as cml:
+        ds.search('banana', mode='autofield')
+        assert_not_in('Updating search index', cml.out)
+
+
+@with_tempfile(mkdir=True)
+def test_parallel_index_build(path=None):
+    ds = Dataset(path).create()
+    for i in range(3):
+        sub = ds.create('sub{}'.format(i))
+        sub.config.add('datalad.metadata.nativetype', 'datalad_rfc822',
+                       scope='branch')
+        (sub.pathobj / '.datalad' / 'meta.rfc822').write_text(
+            'Name: fruit{}\nVersion: {}\n'.format(i, i))
+        sub.save()
+    ds.save()
+    ds.aggregate_metadata(recursive=True)
+    queries = ('fruit*', 'fruit1', 'datalad_rfc822.version:2')
+    for mode in ('textblob', 'autofield'):
+        with patch_config({'datalad.search.indexerjobs': '1'}):
+            target = [ds.search(q, mode=mode, force_reindex=not i)
+                      for i, q in enumerate(queries)]
+        assert_result_count(target[0], 3)
+        # one dataset per process
+        with patch_config({'datalad.search.indexerjobs': '2'}), \
+                patch.object(_WhooshSearch, '_index_chunk_size', 1), \
+                swallow_logs(new_level=logging.DEBUG) as cml:
+            res = [ds.search(q, mode=mode, force_reindex=not i)
+                   for i, q in enumerate(queries)]
+            assert_in('Processing 4 chunks of datasets with 2 processes',
+                      cml.out)
+        eq_(res, target)
+    # without a pool, documents are streamed into the index
+    with patch_config({'datalad.search.indexerjobs': '1'}):
+        searcher = _BlobSearch(ds)
+        docs = list(searcher._map_index_chunks(
+            '_iter_documents', searcher._get_index_aps()))
+    eq_(len(docs), 1)
+    assert_is_generator(docs[0])
+
+
+@with_tempfile(mkdir=True)
+def test_egrep_metadata_store(path=None):
+    ds = Dataset(path).create()
+    subs = []
+    for i, name in enumerate(('Apple', 'apple pie', 'Kiwi')):
+        sub = ds.create('sub{}'.format(i))
+        sub.config.add('datalad.metadata.nativetype', 'datalad_rfc822',
+                       scope='branch')
+        (sub.pathobj / '.datalad' / 'meta.rfc822').write_text(
+            'Name: {}\nVersion: {}\n'.format(name, i))
+        sub.save()
+        subs.append(sub)
+    ds.save()
+    ds.aggregate_metadata(recursive=True)
+    queries = (['apple'], ['Apple'], ['apple', 'pie'], ['name:kiwi'],
+               ['version:1'], ['app.e'], ['(?i)APPLE'], ['nothing'])
+
+    def search_all(mode, **kwargs):
+        return {
+            tuple(q): [(r['path'], r['query_matched'])
+                       for r in ds.search(q, mode=mode, **kwargs)]
+            for q in queries}
+
+    for mode in ('egrep', 'egrepcs'):
+        with swallow_logs(new_level=logging.INFO) as cml:
+            res = search_all(mode)
+            # built once, reused by all further queries, and the other mode
+            eq_(cml.out.count('Building metadata store'),
+                int(mode == 'egrep'))
+        # the same results as a scan of all records
+        with patch.object(_EGrepCSSearch, '_get_store', lambda self: None):
+            eq_(res, search_all(mode))
+    eq_(res[('Apple',)], [(subs[0].path, {'datalad_rfc822.name': 'Apple'})])
+    assert_result_count(
+        ds.search('apple', mode='egrep', max_nresults=1), 1)
+
+    # new aggregated metadata causes a rebuild
+    (subs[2].pathobj / '.datalad' / 'meta.rfc822').unlink()
+    (subs[2].pathobj / '.datalad' / 'meta.rfc822').write_text(
+        'Name: banana\n')
+    (subs[2].pathobj / 'file').write_text('content')
+    subs[2].save()
+    ds.save()
+    ds.aggregate_metadata(recursive=True)
+    with swallow_logs(new_level=logging.INFO) as cml:
+        assert_result_count(
+            ds.search('banana', mode='egrep'), 1, path=subs[2].path)
+        assert_result_count(ds.search('kiwi', mode='egrep'), 0)
+        eq_(cml.out.count('Building metadata store'), 1)
@@ -7,11 +7,14 @@
 #
 # ## ### ### ### ### ### ### ### ### ### ### ### ### ### ### ### ### ### ### ##
 """
-Thread based subprocess execution with stdout and stderr passed to protocol objects
+Thread based, or selector based, subprocess execution with stdout and stderr
+passed to protocol objects
 """
 
 import enum
 import logging
+import os
+import selectors
 import subprocess
 import time
 from collections import deque
@@ -381,6 +384,15 @@ class ThreadedRunner:
             ) if f is not None
         }
 
+        self._start_io()
+
+        if issubclass(self.protocol_class, GeneratorMixIn):
+            return _ResultGenerator(self, self.protocol.result_queue)
+
+        return self.process_loop()
+
+    def _start_io(self):
+        """Start the threads that handle the pipes and the process exit"""
         current_time = time.time()
         if self.timeout:
             self.last_touched[None] = current_time
@@ -429,11 +441,6 @@ class ThreadedRunner:
             self.process)
         self.process_waiting_thread.start()
 
-        if issubclass(self.protocol_class, GeneratorMixIn):
-            return _ResultGenerator(self, self.protocol.result_queue)
-
-        return self.process_loop()
-
     def process_loop(self) -> Any:
         # Process internal messages until no more active file descriptors
         # are present. This works because active file numbers are only
@@ -635,6 +642,223 @@ class ThreadedRunner:
                 thread.request_exit()
 
 
+class SelectorRunner(ThreadedRunner):
+    """
+    A variant of `ThreadedRunner` that handles all pipes of the subprocess
+    in the calling thread.
+
+    Instead of a thread per pipe and a thread that waits for the process
+    to exit, the pipes are multiplexed with a `selectors.DefaultSelector`
+    and are read and written with `os.read()` and `os.write()`. This
+    saves the thread creation and the thread switches for every
+    subprocess, which dominate the runtime of short commands, like most
+    `git` calls. Protocols are called with the same arguments as by
+    `ThreadedRunner`, and the results are identical.
+
+    Data that is put into a stdin-queue is written when the results of the
+    subprocess are processed, i.e. when the caller waits for results. If
+    the queue is fed from another thread, it is checked every
+    `stdin_poll_interval` seconds.
+
+    This runner is not available on Windows, where pipes cannot be used
+    with `selectors`.
+    """
+    # Maximum number of bytes that are read from a pipe at once
+    read_size = 65536
+
+    stdin_poll_interval = 0.05
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.selector = None
+        # data from the stdin-queue that is not yet written
+        self.stdin_buffer = None
+        # file descriptor that becomes readable when the process exits,
+        # if supported by the platform
+        self.process_fileno = None
+
+    def _start_io(self):
+        """Register the pipes with the selector"""
+        self.selector = selectors.DefaultSelector()
+        current_time = time.time()
+        if self.timeout:
+            self.last_touched[None] = current_time
+
+        for catch, file_number in ((self.catch_stderr,
+                                    self.process_stderr_fileno),
+                                   (self.catch_stdout,
+                                    self.process_stdout_fileno)):
+            if catch:
+                self.active_file_numbers.add(file_number)
+                self.last_touched[file_number] = current_time
+                self.selector.register(file_number, selectors.EVENT_READ)
+
+        if self.write_stdin:
+            # No timeouts for stdin
+            self.active_file_numbers.add(self.process_stdin_fileno)
+            os.set_blocking(self.process_stdin_fileno, False)
+
+        if hasattr(os, 'pidfd_open'):
+            try:
+                self.process_fileno = os.pidfd_open(self.process.pid)
+            except OSError:
+                # not supported by the kernel
+                pass
+            else:
+                self.selector.register(
+                    self.process_fileno, selectors.EVENT_READ)
+
+    def process_queue(self):
+        """
+        Handle the events of a single selector call, i.e. read from or write
+        to the pipes, or check for a process exit and handle timeouts.
+        """
+        stdin_waiting = self._feed_stdin()
+        selector_map = self.selector.get_map()
+        timeout = (
+            min(self.timeout_resolution, self.stdin_poll_interval)
+            if stdin_waiting else self.timeout_resolution)
+        if selector_map:
+            events = self.selector.select(timeout)
+        else:
+            events = []
+            if None in self.active_file_numbers:
+                if self.timeout is None and not stdin_waiting:
+                    # nothing else to wait for
+                    self.process.wait()
+                else:
+                    try:
+                        self.process.wait(timeout)
+                    except subprocess.TimeoutExpired:
+                        pass
+
+        for key, _ in events:
+            file_number = key.fd
+            if file_number == self.process_fileno:
+                self._close_process_fileno()
+                continue
+            if file_number == self.process_stdin_fileno:
+                self._feed_stdin()
+                continue
+            try:
+                data = os.read(file_number, self.read_size)
+            except OSError:
+                data = b""
+            if data:
+                self.last_touched[file_number] = time.time()
+                self.protocol.pipe_data_received(
+                    self.fileno_mapping[file_number],
+                    data)
+            else:
+                # Received an EOF for stdout or stderr.
+                self.remove_file_number(file_number)
+
+        if None in self.active_file_numbers \
+                and self.process.poll() is not None:
+            self.remove_process()
+
+        if not events:
+            self.process_timeouts()
+
+    def _feed_stdin(self) -> bool:
+        """
+        Write data from the stdin-queue to the subprocess until the queue is
+        empty, or the pipe is full.
+
+        Returns
+        -------
+        bool
+          True if the queue is empty, and stdin was not yet closed.
+        """
+        file_number = self.process_stdin_fileno
+        if not self.write_stdin or file_number not in self.active_file_numbers:
+            return False
+        while True:
+            if self.stdin_buffer is None:
+                try:
+                    data = self.stdin_queue.get_nowait()
+                except Empty:
+                    self._set_stdin_events(0)
+                    return True
+                if data is None:
+                    # no more data will be sent to stdin
+                    self.stdin_buffer = None
+                    self.remove_file_number(file_number)
+                    return False
+                if isinstance(data, str):
+                    data = data.encode()
+                self.stdin_buffer = memoryview(data)
+            try:
+                written = os.write(file_number, self.stdin_buffer)
+            except BlockingIOError:
+                # wait until the subprocess reads from the pipe
+                self._set_stdin_events(selectors.EVENT_WRITE)
+                return False
+            except (BrokenPipeError, OSError, ValueError):
+                # The destination was most likely closed
+                self.stdin_buffer = None
+                self.remove_file_number(file_number)
+                return False
+            self.stdin_buffer = self.stdin_buffer[written:] or None
+
+    def _set_stdin_events(self, events: int):
+        file_number = self.process_stdin_fileno
+        registered = file_number in self.selector.get_map()
+        if events and not registered:
+            self.selector.register(file_number, events)
+        elif not events and registered:
+            self.selector.unregister(file_number)
+
+    def _unregister(self, file_number: int):
+        if self.selector is not None \
+                and file_number in self.selector.get_map():
+            self.selector.unregister(file_number)
+
+    def remove_file_number(self, file_number: int):
+        self._unregister(file_number)
+        super().remove_file_number(file_number)
+
+    def _ensure_closed(self, file_objects):
+        for file_object in file_objects:
+            if file_object is not None:
+                file_number = self.file_to_fileno.get(file_object, None)
+                if file_number is not None:
+                    self._unregister(file_number)
+        super()._ensure_closed(file_objects)
+
+    def is_stalled(self) -> bool:
+        # no threads involved, the selector reports all events
+        return False
+
+    def _close_process_fileno(self):
+        if self.process_fileno is not None:
+            self._unregister(self.process_fileno)
+            os.close(self.process_fileno)
+            self.process_fileno = None
+
+    def wait_for_threads(self):
+        self._close_process_fileno()
+        if self.selector is not None:
+            self.selector.close()
+
+
+def get_runner_class() -> Type[ThreadedRunner]:
+    """Return the runner class that is used to execute subprocesses
+
+    The environment variable DATALAD_RUNNER_BACKEND selects between the
+    thread-based 'threads' (default) and the single-thread 'selector'
+    backend. The latter is not available on Windows.
+    """
+    # with all the nesting of config and runner, cannot use our cfg here,
+    # hence an environment variable
+    backend = os.environ.get('DATALAD_RUNNER_BACKEND', 'threads')
+    if backend == 'selector' and not on_windows:
+        return SelectorRunner
+    if backend not in ('threads', 'selector'):
+        lgr.warning("Unknown runner backend %r, using 'threads'", backend)
+    return ThreadedRunner
+
+
 def run_command(cmd: Union[str, List],
                 protocol: Type[WitlessProtocol],
                 stdin: Any,
@@ -646,11 +870,12 @@ def run_command(cmd: Union[str, List],
     Run a command in a subprocess
 
     this function delegates the execution to an instance of
-    `ThreadedRunner`, please see `ThreadedRunner.__init__()` for a
-    documentation of the parameters, and `ThreadedRunner.run()` for a
-    documentation of the return values.
+    `ThreadedRunner` (or `SelectorRunner`, see `get_runner_class()`),
+    please see `ThreadedRunner.__init__()` for a documentation of the
+    parameters, and `ThreadedRunner.run()` for a documentation of the
+    return values.
     """
-    runner = ThreadedRunner(
+    runner = get_runner_class()(
         cmd=cmd,
         protocol_class=protocol,
         stdin=stdin,
@@ -13,7 +13,7 @@ import logging
 
 from .coreprotocols import NoCapture
 from .exception import CommandError
-from .nonasyncrunner import ThreadedRunner
+from .nonasyncrunner import get_runner_class
 from .protocol import GeneratorMixIn
 
 
@@ -170,7 +170,7 @@ class WitlessRunner(object):
 
         lgr.debug('Run %r (cwd=%s)', cmd, cwd)
 
-        self.threaded_runner = ThreadedRunner(
+        self.threaded_runner = get_runner_class()(
             cmd=cmd,
             protocol_class=protocol,
             stdin=stdin,
@@ -32,6 +32,7 @@ from datalad.tests.utils_pytest import (
     eq_,
     known_failure_osx,
     known_failure_windows,
+    skip_if_on_windows,
     with_tempfile,
 )
 from datalad.utils import on_windows
@@ -45,7 +46,9 @@ from .. import (
 )
 from ..nonasyncrunner import (
     IOState,
+    SelectorRunner,
     ThreadedRunner,
+    get_runner_class,
     run_command,
 )
 from ..protocol import GeneratorMixIn
@@ -591,3 +594,100 @@ def test_stalling_detection_2():
         runner.process_queue()
     eq_(logger.method_calls[0][0], "warning")
     eq_(logger.method_calls[0][1][0], "ThreadedRunner.process_queue(): stall detected")
+
+
+def test_get_runner_class():
+    with patch.dict(os.environ, {"DATALAD_RUNNER_BACKEND": "threads"}):
+        eq_(get_runner_class(), ThreadedRunner)
+    with patch.dict(os.environ, {"DATALAD_RUNNER_BACKEND": "selector"}):
+        eq_(get_runner_class(),
+            ThreadedRunner if on_windows else SelectorRunner)
+    with patch.dict(os.environ, {"DATALAD_RUNNER_BACKEND": "unknown"}), \
+            patch("datalad.runner.nonasyncrunner.lgr") as logger:
+        eq_(get_runner_class(), ThreadedRunner)
+    eq_(logger.method_calls[0][0], "warning")
+
+
+@skip_if_on_windows
+def test_selector_runner_output():
+    # large outputs on stdout and stderr must not block the single thread
+    rt = SelectorRunner(
+        cmd=py2cmd(
+            "import sys\n"
+            "for i in range(1000):\n"
+            "    sys.stdout.write('o' * 1000 + '\\n')\n"
+            "    sys.stderr.write('e' * 1000 + '\\n')\n"
+            "sys.exit(3)"),
+        protocol_class=StdOutErrCapture,
+        stdin=None)
+    result = rt.run()
+    eq_(result["code"], 3)
+    eq_(result["stdout"].splitlines(), ["o" * 1000] * 1000)
+    eq_(result["stderr"].splitlines(), ["e" * 1000] * 1000)
+
+
+@skip_if_on_windows
+def test_selector_runner_stdin():
+    # data that exceeds the pipe buffer is written without blocking
+    stdin_queue = queue.Queue()
+    for i in range(100):
+        stdin_queue.put(b"x" * 4095 + b"\n")
+    stdin_queue.put(None)
+    rt = SelectorRunner(
+        cmd=py2cmd("import sys; print(len(sys.stdin.read()))"),
+        protocol_class=StdOutCapture,
+        stdin=stdin_queue)
+    result = rt.run()
+    eq_(result["code"], 0)
+    eq_(result["stdout"].strip(), str(100 * 4096))
+
+
+@skip_if_on_windows
+def test_selector_runner_generator():
+
+    class GenStdoutLines(GeneratorMixIn, StdOutCapture):
+        def __init__(self, done_future=None, encoding=None):
+            StdOutCapture.__init__(self, done_future, encoding)
+            GeneratorMixIn.__init__(self)
+
+        def pipe_data_received(self, fd: int, data: bytes):
+            for line in data.decode().splitlines():
+                self.send_result(line)
+
+    stdin_queue = queue.Queue()
+    rt = SelectorRunner(
+        cmd=py2cmd(
+            "import sys\n"
+            "for line in sys.stdin:\n"
+            "    sys.stdout.write(line.upper())\n"
+            "    sys.stdout.flush()"),
+        protocol_class=GenStdoutLines,
+        stdin=stdin_queue)
+    responses = []
+    stdin_queue.put(b"a\n")
+    for line in rt.run():
+        responses.append(line)
+        if len(responses) < 3:
+            stdin_queue.put(b"bcd"[len(responses) - 1:len(responses)] + b"\n")
+        else:
+            stdin_queue.put(None)
+    eq_(responses, ["A", "B", "C"])
+    assert_true(rt.process.poll() is not None)
+
+
+@skip_if_on_windows
+def test_selector_runner_timeout():
+    timeouts = []
+
+    class TestProtocol(StdOutErrCapture):
+        def timeout(self, fd: Optional[int]) -> bool:
+            timeouts.append(fd)
+            return False
+
+    SelectorRunner(
+        cmd=["sleep", "1"],
+        protocol_class=TestProtocol,
+        stdin=None,
+        timeout=.1).run()
+    assert_true(len(timeouts) > 0)
+    assert_true(all(fd in (1, 2, None) for fd in timeouts))
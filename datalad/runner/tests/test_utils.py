@@ -15,6 +15,7 @@ from datalad.tests.utils_pytest import (
 
 from ..utils import (
     AssemblingDecoderMixIn,
+    BytesLineSplitter,
     LineSplitter,
 )
 
@@ -109,6 +110,64 @@ def test_line_splitter_corner_cases():
     assert_equal(lines, ["  a   ", " "])
 
 
+def test_line_splitter_long_line():
+    # a line that is delivered in many parts
+    line_splitter = LineSplitter("XY")
+    for i in range(1000):
+        assert_equal(line_splitter.process("a"), [])
+    assert_equal(line_splitter.process("X"), [])
+    assert_equal(line_splitter.remaining_data, "a" * 1000 + "X")
+    # the separator spans the two parts
+    assert_equal(line_splitter.process("Yb"), ["a" * 1000])
+    assert_equal(line_splitter.finish_processing(), "b")
+
+
+def test_bytes_line_splitter_basic():
+    line_splitter = BytesLineSplitter()
+    lines = line_splitter.process(
+        b"first line\n"
+        b"second line\r\n"
+        b"third line\r\n"
+        b"\n"
+        b"fourth "
+    )
+    assert_equal(
+        lines,
+        [b"first line", b"second line", b"third line", b""])
+    assert_equal(line_splitter.process(b""), [])
+    # multi-byte characters are not split
+    assert_equal(line_splitter.process("l\u00e4".encode()[:-1]), [])
+    assert_equal(
+        line_splitter.process("l\u00e4".encode()[-1:] + b"ne\n"),
+        ["fourth l\u00e4ne".encode()])
+    assert_is_none(line_splitter.finish_processing())
+
+    line_splitter = BytesLineSplitter(keep_ends=True)
+    assert_equal(
+        line_splitter.process(b"progress\rdone\nrest"),
+        [b"progress\r", b"done\n"])
+    assert_equal(line_splitter.finish_processing(), b"rest")
+    assert_is_none(line_splitter.finish_processing())
+
+
+def test_bytes_line_splitter_separator():
+    line_splitter = BytesLineSplitter(b"\0")
+    assert_equal(
+        line_splitter.process(memoryview(b"a\nb\0c\r\0\0d")),
+        [b"a\nb", b"c\r", b""])
+    for i in range(1000):
+        assert_equal(line_splitter.process(b"d"), [])
+    assert_equal(line_splitter.process(b"\0"), [b"d" * 1001])
+    assert_is_none(line_splitter.finish_processing())
+
+    # separator spans chunks
+    line_splitter = BytesLineSplitter(b"XY", keep_ends=True)
+    assert_equal(line_splitter.process(b"aX"), [])
+    assert_equal(line_splitter.process(b"YbX"), [b"aXY"])
+    assert_equal(line_splitter.process(b"Y"), [b"bXY"])
+    assert_is_none(line_splitter.finish_processing())
+
+
 def test_assembling_decoder_mix_in_basic():
 
     encoding = "utf-8"
@@ -16,6 +16,7 @@ from collections import defaultdict
 from typing import (
     List,
     Optional,
+    Union,
 )
 
 
@@ -26,6 +27,10 @@ class LineSplitter:
     """
     A line splitter that handles 'streamed content' and is based
     on python's built-in splitlines().
+
+    Only newly received data is split, and unterminated content is
+    collected in parts, hence the runtime is linear in the size of the
+    processed content, even for very long lines.
     """
     def __init__(self, separator: Optional[str] = None):
         """
@@ -35,7 +40,18 @@ class LineSplitter:
         currently known line endings are "\n", and "\r\n".
         """
         self.separator = separator
-        self.remaining_data = None
+        # parts of the unterminated line
+        self._remaining_parts = []
+        # the end of the unterminated line, a separator might start in it
+        self._tail = ""
+
+    @property
+    def remaining_data(self) -> Optional[str]:
+        if not self._remaining_parts:
+            return None
+        if len(self._remaining_parts) > 1:
+            self._remaining_parts = ["".join(self._remaining_parts)]
+        return self._remaining_parts[0]
 
     def process(self, data: str) -> List[str]:
 
@@ -47,52 +63,129 @@ class LineSplitter:
         if data == "":
             return []
 
-        # Update remaining data before attempting to split lines.
-        if self.remaining_data is None:
-            self.remaining_data = ""
-        self.remaining_data += data
-
         if self.separator is None:
             # If no separator was specified, use python's built in
             # line split wisdom to split on any known line ending.
-            lines_with_ends = self.remaining_data.splitlines(keepends=True)
-            detected_lines = self.remaining_data.splitlines()
+            # Remaining data never ends with a line ending, therefore
+            # line endings do not span the boundary to the new data.
+            lines_with_ends = data.splitlines(keepends=True)
+            detected_lines = data.splitlines()
+            tail = ""
 
             # If the last line is identical in lines with ends and
-            # lines without ends, it was unterminated, remove it
-            # from the list of detected lines and keep it for the
+            # lines without ends, it was unterminated, keep it for the
             # next round
-            if lines_with_ends[-1] == detected_lines[-1]:
-                self.remaining_data = detected_lines[-1]
+            unterminated = \
+                detected_lines[-1] \
+                if lines_with_ends[-1] == detected_lines[-1] \
+                else ""
+            if unterminated:
                 del detected_lines[-1]
-            else:
-                self.remaining_data = None
-
         else:
-            # Split lines on separator. This will create additional
-            # empty lines if `remaining_data` end with the separator.
-            detected_lines = self.remaining_data.split(self.separator)
-
-            # If replaced data did not end with the separator, it contains an
-            # unterminated line. We save that for the next round. Otherwise,
-            # we mark that we do not have remaining data.
-            if not data.endswith(self.separator):
-                self.remaining_data = detected_lines[-1]
-            else:
-                self.remaining_data = None
-
-            # If replaced data ended with the canonical line ending, we
-            # have an extra empty line in detected_lines. If it did not
-            # end with canonical line ending, we have to remove the
-            # unterminated line.
-            del detected_lines[-1]
+            # Split lines on separator. A separator might start in the
+            # end of the remaining data, therefore it is split as well.
+            # This will create an additional empty line if the data ends
+            # with the separator.
+            tail = self._tail
+            detected_lines = (tail + data).split(self.separator)
+            # The last element is the unterminated line, or an empty line
+            unterminated = detected_lines.pop()
+
+        if not detected_lines:
+            # no line was completed, store the data for the next round
+            self._remaining_parts.append(data)
+            self._update_tail(data)
+            return []
 
+        if self._remaining_parts:
+            # complete the first line with the remaining data
+            remaining = "".join(self._remaining_parts)
+            detected_lines[0] = \
+                remaining[:len(remaining) - len(tail)] + detected_lines[0]
+        self._remaining_parts = [unterminated] if unterminated else []
+        self._tail = ""
+        self._update_tail(unterminated)
         return detected_lines
 
+    def _update_tail(self, data: str):
+        if self.separator is None or len(self.separator) == 1:
+            return
+        self._tail = (self._tail + data)[1 - len(self.separator):]
+
     def finish_processing(self) -> Optional[str]:
         return self.remaining_data
 
 
+class BytesLineSplitter:
+    """
+    A line splitter for streamed `bytes` content
+
+    Received data is collected in a buffer, and only the part of the buffer
+    that was not searched before is scanned for line separators. Hence, the
+    runtime is linear in the size of the processed content, even for very
+    long lines. Lines are returned as `bytes`, decoding them is left to the
+    caller. With ASCII-compatible encodings, like UTF-8, lines can be decoded
+    individually, because a separator is never part of a multi-byte
+    character.
+    """
+    def __init__(self,
+                 separator: Optional[bytes] = None,
+                 keep_ends: bool = False):
+        """
+        Create a line splitter that will split lines either on a
+        given separator, if 'separator' is not None, or on one of
+        the line endings known to `bytes.splitlines()`, i.e. b"\n",
+        b"\r\n", and b"\r", if 'separator' is None. If 'keep_ends' is
+        True, the line endings are part of the returned lines.
+        """
+        self.separator = separator
+        self.keep_ends = keep_ends
+        self._buffer = bytearray()
+        # position in the buffer from which on to search for separators
+        self._search_start = 0
+
+    def process(self, data: Union[bytes, bytearray, memoryview]) -> List[bytes]:
+        if not data:
+            return []
+
+        buffer = self._buffer
+        buffer += data
+        if self.separator is None:
+            end = max(
+                buffer.rfind(b"\n", self._search_start),
+                buffer.rfind(b"\r", self._search_start)) + 1
+        else:
+            end = buffer.rfind(self.separator, self._search_start)
+            end = end + len(self.separator) if end >= 0 else 0
+
+        if end:
+            with memoryview(buffer) as view:
+                complete = bytes(view[:end])
+            del buffer[:end]
+        self._search_start = len(buffer) if self.separator is None \
+            else max(len(buffer) - len(self.separator) + 1, 0)
+        if not end:
+            return []
+
+        if self.separator is None:
+            return complete.splitlines(keepends=self.keep_ends)
+        lines = complete.split(self.separator)
+        # remove the empty line after the last separator
+        del lines[-1]
+        if self.keep_ends:
+            lines = [line + self.separator for line in lines]
+        return lines
+
+    def finish_processing(self) -> Optional[bytes]:
+        """Return the unterminated content, if there is any, and reset"""
+        if not self._buffer:
+            return None
+        remaining = bytes(self._buffer)
+        self._buffer = bytearray()
+        self._search_start = 0
+        return remaining
+
+
 class AssemblingDecoderMixIn:
     """ Mix in to safely decode data that is delivered in parts
 
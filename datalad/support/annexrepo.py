@@ -12,7 +12,6 @@ For further information on git-annex see https://git-annex.branchable.com/.
 
 """
 
-from collections import OrderedDict
 import json
 import logging
 import os
@@ -52,6 +51,7 @@ from datalad.log import log_progress
 from datalad.runner.protocol import GeneratorMixIn
 from datalad.runner.utils import (
     AssemblingDecoderMixIn,
+    BytesLineSplitter,
     LineSplitter,
 )
 # must not be loads, because this one would log, and we need to log ourselves
@@ -825,6 +825,27 @@ class AnnexRepo(GitRepo, RepoInterface):
             srs[sr_id] = sr_info
         return srs
 
+    def _get_n_jobs(self, jobs):
+        """Return the number of git-annex jobs to use
+
+        Parameters
+        ----------
+        jobs : int or 'auto' or None
+          If 'auto', the number of jobs will be determined automatically,
+          informed by the configuration setting
+          'datalad.runtime.max-annex-jobs'.
+        """
+        if jobs == 'auto':
+            # Limit to # of CPUs (but at least 3 to start with)
+            # and also an additional config constraint (by default 1
+            # due to https://github.com/datalad/datalad/issues/4404)
+            jobs = self._n_auto_jobs or min(
+                self.config.obtain('datalad.runtime.max-annex-jobs'),
+                max(3, cpu_count()))
+            # cache result to avoid repeated calls to cpu_count()
+            self._n_auto_jobs = jobs
+        return jobs
+
     def _call_annex(self, args, files=None, jobs=None, protocol=StdOutErrCapture,
                     git_options=None, stdin=None, merge_annex_branches=True,
                     **kwargs):
@@ -909,15 +930,7 @@ class AnnexRepo(GitRepo, RepoInterface):
         if self._annex_common_options:
             cmd += self._annex_common_options
 
-        if jobs == 'auto':
-            # Limit to # of CPUs (but at least 3 to start with)
-            # and also an additional config constraint (by default 1
-            # due to https://github.com/datalad/datalad/issues/4404)
-            jobs = self._n_auto_jobs or min(
-                self.config.obtain('datalad.runtime.max-annex-jobs'),
-                max(3, cpu_count()))
-            # cache result to avoid repeated calls to cpu_count()
-            self._n_auto_jobs = jobs
+        jobs = self._get_n_jobs(jobs)
         if jobs and jobs != 1:
             cmd.append('-J%d' % jobs)
 
@@ -1208,7 +1221,8 @@ class AnnexRepo(GitRepo, RepoInterface):
             # while there was a 'fatal:...' in stderr, which should be a
             # failure/exception
             # Or if we had empty stdout but there was stderr
-            if json_objects_received is False and e.stderr:
+            if json_objects_received is False and e.stderr \
+                    and not not_existing:
                 raise e
 
         # In contrast to _call_annex_records, this method does not warn about
@@ -2418,7 +2432,11 @@ class AnnexRepo(GitRepo, RepoInterface):
                 bkw = {}
             bcmd = self._batched.get('whereis', annex_options=options,
                                      json=True, path=self.path, **bkw)
-            json_objects = bcmd(files)
+            json_objects = []
+            try:
+                json_objects.extend(bcmd.process_requests(files))
+            except CommandError as e:
+                lgr.error("%s: command error: %s", bcmd, e)
         else:
             cmd = ['whereis'] + options
 
@@ -2714,14 +2732,16 @@ class AnnexRepo(GitRepo, RepoInterface):
 
         Parameters
         ----------
-        key: str
-            key
+        key: str or list of str
+            key, or a list of keys if `batch` is True
         batch: bool, optional
-            initiate or continue with a batched run of annex contentlocation
+            initiate or continue with a batched run of annex contentlocation.
+            Queries for a list of keys are sent without waiting for the answer
+            to the previous one.
 
         Returns
         -------
-        str
+        str or list of str
             path relative to the top directory of the repository. If no content
             is present, empty string is returned
         """
@@ -2731,11 +2751,13 @@ class AnnexRepo(GitRepo, RepoInterface):
                 return next(self.call_annex_items_(['contentlocation', key]))
             except CommandError:
                 return ''
-        else:
-            return self._batched.get('contentlocation', path=self.path)(key)
+        bcmd = self._batched.get('contentlocation', path=self.path)
+        if isinstance(key, list):
+            return list(bcmd.process_requests(key))
+        return bcmd(key)
 
-    @normalize_paths(serialize=True)
-    def is_available(self, file_, remote=None, key=False, batch=False):
+    @normalize_paths
+    def is_available(self, files, remote=None, key=False, batch=False):
         """Check if file or key is available (from a remote)
 
         In case if key or remote is misspecified, it wouldn't fail but just keep
@@ -2743,61 +2765,77 @@ class AnnexRepo(GitRepo, RepoInterface):
 
         Parameters
         ----------
-        file_: str
-            Filename or a key
+        files: str or list of str
+            Filename(s) or key(s)
         remote: str, optional
             Remote which to check.  If None, possibly multiple remotes are checked
             before positive result is reported
         key: bool, optional
             Whether provided files are actually annex keys
         batch: bool, optional
-            Initiate or continue with a batched run of annex checkpresentkey
+            Initiate or continue with a batched run of annex checkpresentkey.
+            Queries for multiple files are sent without waiting for the
+            answer to the previous one.
 
         Returns
         -------
-        bool
+        bool or list of bool
             with True indicating that file/key is available from (the) remote
         """
 
         if key:
-            key_ = file_
+            keys = files
         else:
             # TODO with eval_availability=True, the following call
             # would already provide the answer to is_available? for
             # the local annex
-            key_ = self.get_file_annexinfo(file_)['key']  # ?, batch=batch
-
-        annex_input = [key_,] if not remote else [key_, remote]
+            keys = [self.get_file_annexinfo(f)['key'] for f in files]
 
         if not batch:
+            available = []
+            for key_ in keys:
+                annex_input = [key_,] if not remote else [key_, remote]
+                try:
+                    out = self.call_annex(['checkpresentkey'] + annex_input)
+                    assert(not out)
+                    available.append(True)
+                except CommandError:
+                    available.append(False)
+            return available
+
+        annex_cmd = ["checkpresentkey"] + ([remote] if remote else [])
+        bcmd = self._batched.get(':'.join(annex_cmd), annex_cmd, path=self.path)
+        outs = []
+        while len(outs) < len(keys):
             try:
-                out = self.call_annex(['checkpresentkey'] + annex_input)
-                assert(not out)
-                return True
-            except CommandError:
-                return False
-        else:
-            annex_cmd = ["checkpresentkey"] + ([remote] if remote else [])
-            out = self._batched.get(
-                ':'.join(annex_cmd), annex_cmd,
-                path=self.path)(key_)
-            try:
-                return {
-                    # happens on travis in direct/heavy-debug mode, that process
-                    # exits and closes stdout (upon unknown key) before we could
-                    # read it, so we get None as the stdout.
-                    # see https://github.com/datalad/datalad/issues/2330
-                    # but it is associated with an unknown key, and for consistency
-                    # we report False there too, as to ''
-                    None: False,
-                    '': False,  # when remote is misspecified ... stderr carries the msg
-                    '0': False,
-                    '1': True,
-                }[out]
-            except KeyError:
-                raise ValueError(
-                    "Received output %r from annex, whenever expect 0 or 1" % out
-                )
+                outs.extend(bcmd.process_requests(keys[len(outs):]))
+            except CommandError as e:
+                # annex exits on an invalid key, which is then reported as
+                # not available. The queries that were sent after it are
+                # repeated with a new process.
+                lgr.debug("%s exited while checking for keys: %s", bcmd, e)
+                outs.append(None)
+        return [self._parse_checkpresentkey_output(out) for out in outs]
+
+    @staticmethod
+    def _parse_checkpresentkey_output(out):
+        try:
+            return {
+                # happens on travis in direct/heavy-debug mode, that process
+                # exits and closes stdout (upon unknown key) before we could
+                # read it, so we get None as the stdout.
+                # see https://github.com/datalad/datalad/issues/2330
+                # but it is associated with an unknown key, and for consistency
+                # we report False there too, as to ''
+                None: False,
+                '': False,  # when remote is misspecified ... stderr carries the msg
+                '0': False,
+                '1': True,
+            }[out]
+        except KeyError:
+            raise ValueError(
+                "Received output %r from annex, whenever expect 0 or 1" % out
+            )
 
     @normalize_paths
     def migrate_backend(self, files, backend=None):
@@ -3229,39 +3267,46 @@ class AnnexRepo(GitRepo, RepoInterface):
 
 
     def _mark_content_availability(self, info):
-        objectstore = self.pathobj.joinpath(
-            self.path, GitRepo.get_git_dir(self), 'annex', 'objects')
+        objectstore = self._get_objectstore_path()
         for f, r in info.items():
-            if 'key' not in r or 'has_content' in r:
-                # not annexed or already processed
-                continue
-            # test hashdirmixed first, as it is used in non-bare repos
-            # which be a more frequent target
-            # TODO optimize order based on some check that reveals
-            # what scheme is used in a given annex
-            r['has_content'] = False
-            # some keys like URL-s700145--https://arxiv.org/pdf/0904.3664v1.pdf
-            # require sanitization to be able to mark content availability
-            # correctly. Can't limit to URL backend only; custom key backends
-            # may need it, too
-            key = _sanitize_key(r['key'])
-            for testpath in (
-                    # ATM git-annex reports hashdir in native path
-                    # conventions and the actual file path `f` in
-                    # POSIX, weird...
-                    # we need to test for the actual key file, not
-                    # just the containing dir, as on windows the latter
-                    # may not always get cleaned up on `drop`
-                    objectstore.joinpath(
-                        ut.Path(r['hashdirmixed']), key, key),
-                    objectstore.joinpath(
-                        ut.Path(r['hashdirlower']), key, key)):
-                if testpath.exists():
-                    r.pop('hashdirlower', None)
-                    r.pop('hashdirmixed', None)
-                    r['objloc'] = str(testpath)
-                    r['has_content'] = True
-                    break
+            self._mark_record_availability(objectstore, r)
+
+    def _get_objectstore_path(self):
+        return self.pathobj.joinpath(
+            self.path, GitRepo.get_git_dir(self), 'annex', 'objects')
+
+    @staticmethod
+    def _mark_record_availability(objectstore, r):
+        if 'key' not in r or 'has_content' in r:
+            # not annexed or already processed
+            return
+        # test hashdirmixed first, as it is used in non-bare repos
+        # which be a more frequent target
+        # TODO optimize order based on some check that reveals
+        # what scheme is used in a given annex
+        r['has_content'] = False
+        # some keys like URL-s700145--https://arxiv.org/pdf/0904.3664v1.pdf
+        # require sanitization to be able to mark content availability
+        # correctly. Can't limit to URL backend only; custom key backends
+        # may need it, too
+        key = _sanitize_key(r['key'])
+        for testpath in (
+                # ATM git-annex reports hashdir in native path
+                # conventions and the actual file path `f` in
+                # POSIX, weird...
+                # we need to test for the actual key file, not
+                # just the containing dir, as on windows the latter
+                # may not always get cleaned up on `drop`
+                objectstore.joinpath(
+                    ut.Path(r['hashdirmixed']), key, key),
+                objectstore.joinpath(
+                    ut.Path(r['hashdirlower']), key, key)):
+            if testpath.exists():
+                r.pop('hashdirlower', None)
+                r.pop('hashdirmixed', None)
+                r['objloc'] = str(testpath)
+                r['has_content'] = True
+                break
 
     def get_file_annexinfo(self, path, ref=None, eval_availability=False,
                            key_prefix=''):
@@ -3365,17 +3410,153 @@ class AnnexRepo(GitRepo, RepoInterface):
             pathlib.Path of the content object in the local annex, if one
             is available (with `eval_availability`)
         """
-        if init is None:
-            info = OrderedDict()
-        elif init == 'git':
-            info = super(AnnexRepo, self).get_content_info(
-                paths=paths, ref=ref, **kwargs)
-        else:
-            info = init
+        info = self._new_content_info() if init is None or init == 'git' \
+            else init
+        for path, rec in self.iter_content_annexinfo(
+                paths=paths, init=init, ref=ref,
+                eval_availability=eval_availability,
+                key_prefix=key_prefix, **kwargs):
+            info[path] = rec
+        if eval_availability and info is init:
+            # also records that git-annex did not report on now, but
+            # previously (e.g. for another `ref`)
+            self._mark_content_availability(info)
+        return info
+
+    def iter_content_annexinfo(
+            self, paths=None, init='git', ref=None, eval_availability=False,
+            key_prefix='', **kwargs):
+        """Yield annex properties of repository content
+
+        This is the streaming counterpart of `get_content_annexinfo()`, for
+        reports on large repositories that need not be held in memory at
+        once.
+
+        With `init='git'`, the (sorted) report of `GitRepo.iter_content_info()`
+        is joined with the git-annex report on the same content, and a record
+        is yielded as soon as both reports have passed its path. Records of
+        paths that git-annex reports an error for, but Git does not know
+        about, are yielded last. With explicit `paths` in the worktree, the
+        git-annex report is not guaranteed to be sorted, and is collected
+        before the Git report is processed.
+
+        With a dict-like `init`, its records are amended with the git-annex
+        report on the same content, while that report is read, and yielded.
+
+        Parameters
+        ----------
+        init : 'git' or dict-like or None
+          If `None`, only the git-annex report is considered. A dict-like
+          object limits the report to the paths it contains (plus any that
+          git-annex reports an error for), and its records are amended
+          in-place.
+
+        All other arguments have identical names and semantics as their
+        `get_content_annexinfo()` counterparts.
+
+        Yields
+        ------
+        tuple
+          A `Path` instance with the absolute path of a content item, and a
+          dictionary with its properties (see `get_content_annexinfo()`).
+        """
+        if paths is not None:
+            # both queries need them
+            paths = list(paths)
+            if not paths:
+                return
 
-        if not paths and paths is not None:
-            return info
+        objectstore = self._get_objectstore_path() \
+            if eval_availability else None
+
+        def _amend(rec, j):
+            if j is not None:
+                rec = self._amend_annexinfo_record(rec, j, key_prefix)
+            if objectstore is not None:
+                self._mark_record_availability(objectstore, rec)
+            return rec
+
+        cmd, files = self._get_annexinfo_query(paths, ref)
+        annex_records = self._call_annex_records_items_(cmd, files=files)
+
+        if init != 'git':
+            for j in annex_records:
+                path = self.pathobj.joinpath(ut.PurePosixPath(j['file']))
+                rec = None if init is None else init.get(path, None)
+                if rec is None:
+                    if j.get('success', None) is False:
+                        # Annex reports error on that file. Create an error
+                        # entry, as we can't currently yield a prepared
+                        # error result from within here.
+                        rec = {'status': 'error', 'state': 'unknown'}
+                    elif init is None:
+                        rec = {}
+                    else:
+                        # init constraint knows nothing about this path
+                        continue
+                yield path, _amend(rec, j)
+            return
 
+        # annex records that have been read, but not been matched with a
+        # Git record yet
+        pending = {}
+        if files:
+            # git-annex reports on individual paths in the order of the
+            # arguments, not in the order Git reports them
+            for j in annex_records:
+                pending[j['file']] = j
+            annex_records = None
+        # sort key of the last annex record read, Git reports in byte order
+        last = None
+        # records with annex errors on paths that Git did not report
+        errors = []
+
+        for path, rec in super(AnnexRepo, self).iter_content_info(
+                paths=paths, ref=ref, **kwargs):
+            relpath = path.relative_to(self.pathobj).as_posix()
+            if annex_records is not None and rec.get('gitshasum'):
+                sortkey = relpath.encode('utf-8', 'surrogateescape')
+                # catch up with the Git report
+                while relpath not in pending and (
+                        last is None or last < sortkey):
+                    j = next(annex_records, None)
+                    if j is None:
+                        annex_records = None
+                        break
+                    last = j['file'].encode('utf-8', 'surrogateescape')
+                    pending[j['file']] = j
+                # anything left behind is unknown to Git
+                for p in [p for p in pending
+                          if p != relpath
+                          and p.encode('utf-8', 'surrogateescape') < sortkey]:
+                    errors.extend(self._get_annexinfo_error(
+                        pending.pop(p), _amend))
+            yield path, _amend(rec, pending.pop(relpath, None))
+
+        yield from errors
+        for j in chain(pending.values(), annex_records or []):
+            yield from self._get_annexinfo_error(j, _amend)
+
+    def _get_annexinfo_error(self, j, amend):
+        """Internal helper of iter_content_annexinfo() for unmatched records
+
+        Yields an error record, if git-annex reported an error.
+        """
+        if j.get('success', None) is False:
+            # Annex reports error on that file. Create an error entry,
+            # as we can't currently yield a prepared error result from
+            # within here.
+            yield (self.pathobj.joinpath(ut.PurePosixPath(j['file'])),
+                   amend({'status': 'error', 'state': 'unknown'}, j))
+
+    def _get_annexinfo_query(self, paths, ref):
+        """Internal helper of get_content_annexinfo() to compose the query
+
+        Returns
+        -------
+        list, list or None
+          The git-annex command, and the paths to pass on to it.
+        """
         # use this funny-looking option with both find and findref
         # it takes care of git-annex reporting on any known key, regardless
         # of whether or not it actually (did) exist in the local annex
@@ -3391,58 +3572,50 @@ class AnnexRepo(GitRepo, RepoInterface):
                 files = [str(p) for p in paths]
             else:
                 cmd += ['--include', '*']
+        return cmd, files
 
-        for j in self.call_annex_records(cmd, files=files):
-            path = self.pathobj.joinpath(ut.PurePosixPath(j['file']))
-            rec = info.get(path, None)
-            if rec is None:
-                # git didn't report on this path
-                if j.get('success', None) is False:
-                    # Annex reports error on that file. Create an error entry,
-                    # as we can't currently yield a prepared error result from
-                    # within here.
-                    rec = {'status': 'error', 'state': 'unknown'}
-                elif init is not None:
-                    # init constraint knows nothing about this path -> skip
-                    continue
-                else:
-                    rec = {}
-            rec.update({'{}{}'.format(key_prefix, k): j[k]
-                       for k in j if k != 'file' and k != 'error-messages'})
-            # change annex' `error-messages` into singular to match result
-            # records:
-            if j.get('error-messages', None):
-                rec['error_message'] = '\n'.join(m.strip() for m in j['error-messages'])
-            if 'bytesize' in rec:
-                # it makes sense to make this an int that one can calculate with
-                # with
-                try:
-                    rec['bytesize'] = int(rec['bytesize'])
-                except ValueError:
-                    # this would only ever happen, if the recorded key itself
-                    # has no size info. Even for a URL key, this would mean
-                    # that the server would have to not report size info at all
-                    # but it does actually happen, e.g.
-                    # URL--http&c%%ciml.info%dl%v0_9%ciml-v0_9-all.pdf
-                    # from github.com/datalad-datasets/machinelearning-books
-                    lgr.debug('Failed to convert "%s" to integer bytesize',
-                              rec['bytesize'])
-                    # remove the field completely to avoid ambiguous semantics
-                    # of None/NaN etc.
-                    del rec['bytesize']
-            if rec.get('type') == 'symlink' and rec.get('key') is not None:
-                # we have a tracked symlink with an associated annex key
-                # this is only a symlink for technical reasons, but actually
-                # a file from the user perspective.
-                # homogenization of this kind makes the report more robust
-                # across different representations of a repo
-                # (think adjusted branches ...)
-                rec['type'] = 'file'
-            info[path] = rec
-        # TODO make annex availability checks optional and move in here
-        if eval_availability:
-            self._mark_content_availability(info)
-        return info
+    @staticmethod
+    def _amend_annexinfo_record(rec, j, key_prefix):
+        """Internal helper of get_content_annexinfo() to amend a record
+
+        Returns
+        -------
+        dict
+          The record `rec`, amended with the properties in the git-annex
+          report `j`.
+        """
+        rec.update({'{}{}'.format(key_prefix, k): j[k]
+                   for k in j if k != 'file' and k != 'error-messages'})
+        # change annex' `error-messages` into singular to match result
+        # records:
+        if j.get('error-messages', None):
+            rec['error_message'] = '\n'.join(m.strip() for m in j['error-messages'])
+        if 'bytesize' in rec:
+            # it makes sense to make this an int that one can calculate with
+            # with
+            try:
+                rec['bytesize'] = int(rec['bytesize'])
+            except ValueError:
+                # this would only ever happen, if the recorded key itself
+                # has no size info. Even for a URL key, this would mean
+                # that the server would have to not report size info at all
+                # but it does actually happen, e.g.
+                # URL--http&c%%ciml.info%dl%v0_9%ciml-v0_9-all.pdf
+                # from github.com/datalad-datasets/machinelearning-books
+                lgr.debug('Failed to convert "%s" to integer bytesize',
+                          rec['bytesize'])
+                # remove the field completely to avoid ambiguous semantics
+                # of None/NaN etc.
+                del rec['bytesize']
+        if rec.get('type') == 'symlink' and rec.get('key') is not None:
+            # we have a tracked symlink with an associated annex key
+            # this is only a symlink for technical reasons, but actually
+            # a file from the user perspective.
+            # homogenization of this kind makes the report more robust
+            # across different representations of a repo
+            # (think adjusted branches ...)
+            rec['type'] = 'file'
+        return rec
 
     def annexstatus(self, paths=None, untracked='all'):
         """
@@ -3661,7 +3834,7 @@ class AnnexJsonProtocol(WitlessProtocol):
         self.json_out = []
         self._global_pbar_id = 'annexprogress-{}'.format(id(self))
         self.total_nbytes = total_nbytes
-        self._unprocessed = None
+        self._line_splitter = BytesLineSplitter()
 
     def add_to_output(self, json_object):
         self.json_out.append(json_object)
@@ -3690,36 +3863,35 @@ class AnnexJsonProtocol(WitlessProtocol):
             # let the base class decide what to do with it
             super().pipe_data_received(fd, data)
             return
-        if self._unprocessed:
-            data = self._unprocessed + data
-            self._unprocessed = None
-        # this is where the JSON records come in
-        # json_loads() is already logging any error, which is OK, because
-        # under no circumstances we would expect broken JSON
-        lines = data.splitlines()
-        data_ends_with_eol = data.endswith(os.linesep.encode())
-        del data
-        for iline, line in enumerate(lines):
+        # this is where the JSON records come in, one per line
+        for line in self._line_splitter.process(data):
+            self._proc_json_line(line)
+        if data.endswith(b'}'):
+            # the unterminated last line might already be a complete
+            # record, e.g. when talking to a process in batch mode
+            line = self._line_splitter.finish_processing()
             try:
                 j = json_loads(line)
-            except Exception as exc:
-                if line.strip():
-                    # do not complain on empty lines
-                    if iline == len(lines) - 1 and not data_ends_with_eol:
-                        lgr.debug("Caught %s while trying to parse JSON line %s which might "
-                                  "be not yet a full line", exc, line)
-                        # it is the last line and fails to parse -- it can/likely
-                        # to happen that it was not a complete line and that buffer
-                        # got filled up/provided before the end of line.
-                        # Store it so that it can be prepended to data in the next call.
-                        self._unprocessed = line
-                        break
-                    # TODO turn this into an error result, or put the exception
-                    # onto the result future -- needs more thought
-                    lgr.error('Received undecodable JSON output: %s', line)
-                continue
+            except Exception:
+                # not yet a full line, keep it for the next round
+                self._line_splitter.process(line)
+                return
             self._proc_json_record(j)
 
+    def _proc_json_line(self, line):
+        # json_loads() is already logging any error, which is OK, because
+        # under no circumstances we would expect broken JSON
+        try:
+            j = json_loads(line)
+        except Exception:
+            if line.strip():
+                # do not complain on empty lines
+                # TODO turn this into an error result, or put the exception
+                # onto the result future -- needs more thought
+                lgr.error('Received undecodable JSON output: %s', line)
+            return
+        self._proc_json_record(j)
+
     def _get_pbar_id(self, record):
         # NOTE: Look at the "action" field for byte-progress records and the
         # top-level `record` for the final record. The action record as a whole
@@ -3853,11 +4025,10 @@ class AnnexJsonProtocol(WitlessProtocol):
                 'Finished',
                 noninteractive_level=5,
             )
-        if self._unprocessed:
-            lgr.error(
-                "%d bytes of received undecodable JSON output remain: %s",
-                len(self._unprocessed), self._unprocessed
-            )
+        # an unterminated last line might still hold a complete record
+        line = self._line_splitter.finish_processing()
+        if line is not None:
+            self._proc_json_line(line)
         super().process_exited()
 
 
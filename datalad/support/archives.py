@@ -10,12 +10,23 @@
 
 """
 
+import glob
 import hashlib
+import json
 import os
+import posixpath
+import tarfile
 import tempfile
 import string
 import random
 import logging
+import threading
+import time
+import zipfile
+from contextlib import (
+    ExitStack,
+    contextmanager,
+)
 
 from datalad.support.path import (
     join as opj,
@@ -29,7 +40,11 @@ from datalad.support.path import (
     sep as opsep,
 )
 
-from datalad.support.locking import lock_if_check_fails
+from datalad.support.locking import (
+    lock_if_check_fails,
+    lock_shared,
+    try_lock_exclusive,
+)
 from datalad.support.external_versions import external_versions
 from datalad.consts import ARCHIVES_TEMP_DIR
 from datalad.utils import (
@@ -119,6 +134,137 @@ def _get_random_id(size=6, chars=string.ascii_uppercase + string.digits):
     return ''.join(random.choice(chars) for _ in range(size))
 
 
+def _normalize_member_name(name):
+    """Normalize the name of an archive member for lookups in an index"""
+    if os.sep != '/':
+        name = name.replace(os.sep, '/')
+    return posixpath.normpath(name).lstrip('/')
+
+
+def _copy_bytes(src, dst, size, blocksize=1 << 20):
+    remaining = size
+    while remaining:
+        block = src.read(min(blocksize, remaining))
+        if not block:
+            raise IOError(
+                "Archive ended %d bytes before the end of the member"
+                % remaining)
+        dst.write(block)
+        remaining -= len(block)
+
+
+def _index_archive(archive):
+    """Scan an archive for members which could be read directly
+
+    Returns
+    -------
+    dict
+      With 'format' and 'members' as described in
+      `ExtractedArchive.get_member_index()`.
+    """
+    members = {}
+    if zipfile.is_zipfile(archive):
+        lgr.debug("Indexing zip archive %s", archive)
+        with zipfile.ZipFile(archive) as zf:
+            for zi in zf.infolist():
+                if not zi.is_dir():
+                    members[_normalize_member_name(zi.filename)] = \
+                        (zi.header_offset, zi.file_size, zi.filename)
+        return dict(format='zip', members=members)
+
+    try:
+        tf = tarfile.open(archive, 'r:')
+    except (tarfile.TarError, OSError):
+        try:
+            with tarfile.open(archive):
+                pass
+        except (tarfile.TarError, OSError) as e:
+            lgr.debug("%s is neither a zip nor a tar archive: %s", archive, e)
+            return dict(format=None, members=members)
+        # members of compressed tarballs cannot be seeked to, any read has
+        # to decompress everything before it. No point in recording offsets
+        lgr.debug("Not indexing compressed tar archive %s", archive)
+        return dict(format='compressed-tar', members=members)
+    lgr.debug("Indexing tar archive %s", archive)
+    links = {}
+    with tf:
+        while True:
+            ti = tf.next()
+            if ti is None:
+                break
+            # do not accumulate all TarInfo's of huge archives in memory
+            tf.members = []
+            name = _normalize_member_name(ti.name)
+            if ti.isreg() and not ti.sparse:
+                members[name] = (ti.offset_data, ti.size)
+            elif ti.islnk():
+                links[name] = _normalize_member_name(ti.linkname)
+    # hard links point to content stored earlier in the archive
+    for name, target in links.items():
+        if target in members:
+            members[name] = members[target]
+    return dict(format='tar', members=members)
+
+
+def _get_tree_size(path):
+    """Return the total size of files under `path`"""
+    size = 0
+    for root, dirs, files in os.walk(path):
+        for f in files:
+            try:
+                size += os.lstat(opj(root, f)).st_size
+            except OSError:
+                pass
+    return size
+
+
+def _read_stamp(stamp_path):
+    """Return the record stored in the stamp of an extracted archive"""
+    # the access time of the stamp tracks the use of the extracted archive,
+    # reading the stamp must not touch it
+    flags = os.O_RDONLY | getattr(os, 'O_NOATIME', 0)
+    try:
+        fd = os.open(stamp_path, flags)
+    except PermissionError:
+        # O_NOATIME is only permitted to the owner of the file
+        fd = os.open(stamp_path, os.O_RDONLY)
+    with open(fd, 'rb') as f:
+        content = f.read()
+    try:
+        return json.loads(content.decode())
+    except ValueError:
+        # older versions stored the path of the archive only
+        return dict(archive=ensure_unicode(content))
+
+
+def _evict_extracted(path):
+    """Remove an extracted archive from the cache unless it is in use
+
+    Returns
+    -------
+    bool
+      Whether it was removed.
+    """
+    with try_lock_exclusive(path + ExtractedArchive.USE_LOCK_SUFFIX) \
+            as acquired:
+        if not acquired:
+            lgr.debug("Not evicting %s which is in use", path)
+            return False
+        lgr.debug("Evicting %s from the archives cache", path)
+        # remove the stamp first so it is not considered extracted any
+        # longer
+        for p in (path + ExtractedArchive.STAMP_SUFFIX,
+                  path,
+                  path + ExtractedArchive.INDEX_SUFFIX):
+            if os.path.lexists(p):
+                (rmtree if isdir(p) else unlink)(p)
+        # the lock file must stay: others might already wait for it in
+        # lock_shared() and would otherwise hold a lock on a removed file,
+        # not protecting the content they extract anew.  It is removed by
+        # clean() only
+    return True
+
+
 class ArchivesCache(object):
     """Cache to maintain extracted archives
 
@@ -129,12 +275,15 @@ class ArchivesCache(object):
       If not provided -- random tempdir is used
     persistent : bool, optional
       Passed over into generated ExtractedArchives
+    max_size : int, optional
+      Budget (in bytes) for the total size of extracted archives.  If
+      exceeded, `evict()` removes the least recently used ones.
     """
-    # TODO: make caching persistent across sessions/runs, with cleanup
     # IDEA: extract under .git/annex/tmp so later on annex unused could clean it
     #       all up
-    def __init__(self, toppath=None, persistent=False):
+    def __init__(self, toppath=None, persistent=False, max_size=None):
         self._toppath = toppath
+        self.max_size = max_size
         if toppath:
             path = opj(toppath, ARCHIVES_TEMP_DIR)
             if not persistent:
@@ -172,6 +321,8 @@ class ArchivesCache(object):
         #if exists(path):
         #    self._clean_cache()
         self._archives = {}
+        # archives can be requested from multiple threads
+        self._archives_lock = threading.Lock()
 
         # TODO: begging for a race condition
         if not exists(path):
@@ -221,16 +372,104 @@ class ArchivesCache(object):
             return out
         return archive
 
+    def _get_entries(self):
+        """Return records on all archives extracted into the cache
+
+        Returns
+        -------
+        list of tuple
+          (time of last access (ns), size, path), sorted by the time of
+          last access
+        """
+        entries = []
+        for stamp_path in glob.glob(
+                opj(glob.escape(self.path), '*' + ExtractedArchive.STAMP_SUFFIX)):
+            path = stamp_path[:-len(ExtractedArchive.STAMP_SUFFIX)]
+            try:
+                last_access = os.stat(stamp_path).st_atime_ns
+                size = _read_stamp(stamp_path).get('size')
+                if size is None:
+                    # extracted by an older version
+                    size = _get_tree_size(path)
+            except OSError:
+                # vanished, e.g. evicted by another process
+                continue
+            entries.append((last_access, size, path))
+        return sorted(entries)
+
+    def get_stats(self):
+        """Return statistics on the archives extracted into the cache
+
+        Returns
+        -------
+        dict
+          With 'path' of the cache, number of extracted 'archives', their
+          total 'size' (in bytes), and the 'max_size' budget.
+        """
+        entries = self._get_entries()
+        return dict(
+            path=self.path,
+            archives=len(entries),
+            size=sum(e[1] for e in entries),
+            max_size=self.max_size,
+        )
+
+    def evict(self, max_size=None):
+        """Remove least recently used extracted archives to fit a size budget
+
+        Archives which are in use (by this or any other process) are skipped.
+        The most recently used archive is never removed, even if it alone
+        exceeds the budget.
+
+        Parameters
+        ----------
+        max_size : int, optional
+          Budget (in bytes), `max_size` of the cache if not provided.  If
+          neither is defined, nothing is removed.
+
+        Returns
+        -------
+        list of str
+          Paths of the removed extracted archives.
+        """
+        if max_size is None:
+            max_size = self.max_size
+        if max_size is None:
+            return []
+        entries = self._get_entries()
+        total = sum(e[1] for e in entries)
+        evicted = []
+        # no new archives could be put in use by this process meanwhile
+        with self._archives_lock:
+            earchives = {a.path: a for a in self._archives.values()}
+            for _, size, path in entries[:-1]:
+                if total <= max_size:
+                    break
+                earchive = earchives.get(path)
+                if earchive is None:
+                    removed = _evict_extracted(path)
+                else:
+                    with earchive._users_lock:
+                        removed = not earchive._users \
+                            and _evict_extracted(path)
+                if removed:
+                    total -= size
+                    evicted.append(path)
+        lgr.debug("Evicted %d archives from cache %s, %d bytes remain "
+                  "(budget: %d)", len(evicted), self.path, total, max_size)
+        return evicted
+
     def get_archive(self, archive):
         archive = self._get_normalized_archive_path(archive)
 
-        if archive not in self._archives:
-            self._archives[archive] = \
-                ExtractedArchive(archive,
-                                 opj(self.path, _get_cached_filename(archive)),
-                                 persistent=self.persistent)
+        with self._archives_lock:
+            if archive not in self._archives:
+                self._archives[archive] = \
+                    ExtractedArchive(archive,
+                                     opj(self.path, _get_cached_filename(archive)),
+                                     persistent=self.persistent)
 
-        return self._archives[archive]
+            return self._archives[archive]
 
     def __getitem__(self, archive):
         return self.get_archive(archive)
@@ -255,6 +494,12 @@ class ExtractedArchive(object):
 
     # suffix to use for a stamp so we could guarantee that extracted archive is
     STAMP_SUFFIX = '.stamp'
+    # suffix to use for the index of members which could be read directly
+    # from the archive
+    INDEX_SUFFIX = '.index'
+    INDEX_VERSION = 2
+    # suffix of the lock held (shared) while extracted content is in use
+    USE_LOCK_SUFFIX = '.use-lck'
 
     def __init__(self, archive, path=None, persistent=False):
         self._archive = archive
@@ -267,6 +512,14 @@ class ExtractedArchive(object):
                                "persist" % path)
         self._persistent = persistent
         self._path = path
+        self._index = None
+        self._index_lock = threading.Lock()
+        # whether a file was read directly from a compressed tarball already
+        self._compressed_read = False
+        # users of the extracted content within this process
+        self._users = 0
+        self._users_lock = threading.Lock()
+        self._use_stack = None
 
     def __repr__(self):
         return "%s(%r, path=%r)" % (self.__class__.__name__, self._archive, self.path)
@@ -280,7 +533,9 @@ class ExtractedArchive(object):
 
         for path, name in [
             (self._path, 'cache'),
-            (self.stamp_path, 'stamp file')
+            (self.stamp_path, 'stamp file'),
+            (self.index_path, 'member index'),
+            (self.use_lock_path, 'lock file'),
         ]:
             if exists(path):
                 if (not self._persistent) or force:
@@ -299,6 +554,53 @@ class ExtractedArchive(object):
     def stamp_path(self):
         return self._path + self.STAMP_SUFFIX
 
+    @property
+    def index_path(self):
+        return self._path + self.INDEX_SUFFIX
+
+    @property
+    def use_lock_path(self):
+        return self._path + self.USE_LOCK_SUFFIX
+
+    def acquire_use(self):
+        """Protect the extracted content from eviction from the cache
+
+        Must be paired with `release_use()`, see `use()` for a context
+        manager.
+        """
+        with self._users_lock:
+            if not self._users:
+                stack = ExitStack()
+                stack.enter_context(lock_shared(self.use_lock_path))
+                self._use_stack = stack
+            self._users += 1
+
+    def release_use(self):
+        with self._users_lock:
+            self._users -= 1
+            if not self._users:
+                self._use_stack.close()
+                self._use_stack = None
+
+    @contextmanager
+    def use(self):
+        """Context manager to protect the extracted content from eviction
+        """
+        self.acquire_use()
+        try:
+            yield self
+        finally:
+            self.release_use()
+
+    def _touch(self):
+        """Record an access to the extracted content"""
+        try:
+            st = os.stat(self.stamp_path)
+            # mtime must be kept for `is_extracted`
+            os.utime(self.stamp_path, ns=(time.time_ns(), st.st_mtime_ns))
+        except OSError as e:
+            lgr.debug("Failed to record access to %s: %s", self.path, e)
+
     @property
     def is_extracted(self):
         return exists(self.path) and exists(self.stamp_path) \
@@ -341,9 +643,11 @@ class ExtractedArchive(object):
         # lgr.debug("Adjusting permissions to R/O for the extracted content")
         # rotree(path)
         assert (exists(path))
-        # create a stamp
-        with open(self.stamp_path, 'wb') as f:
-            f.write(ensure_bytes(self._archive))
+        # create a stamp, also recording the size for the cache budget
+        with open(self.stamp_path, 'w') as f:
+            json.dump(dict(archive=ensure_unicode(self._archive),
+                           size=_get_tree_size(path)),
+                      f)
         # assert that stamp mtime is not older than archive's directory
         assert (self.is_extracted)
 
@@ -422,12 +726,144 @@ class ExtractedArchive(object):
         # We could somehow adjust them while extracting and here channel back
         # "fixed" up names since they are only to point to the load
         self.assure_extracted()
+        self._touch()
         path = self.get_extracted_filename(afile)
         # TODO: make robust
         lgr.log(2, "Verifying that %s exists", abspath(path))
         assert exists(path), "%s must exist" % path
         return path
 
+    def get_member_index(self):
+        """Return the index of members which could be read from the archive
+
+        Only uncompressed tar and zip archives are indexed.  The index is
+        built with a single pass through the archive and stored next to the
+        extraction cache, so subsequent calls (also from other processes) do
+        not need to scan the archive again as long as it did not change.
+
+        Returns
+        -------
+        dict
+          Keys are 'format' ('tar', 'zip', 'compressed-tar', or None if
+          members cannot be read directly) and 'members', a dict mapping
+          member names (with '/' as separator) to the offset of the member
+          within the archive and its size.  For zip archives the original
+          member name follows.  There are no members recorded for
+          compressed tarballs.
+        """
+        with self._index_lock:
+            stat = os.stat(self._archive)
+            signature = dict(
+                version=self.INDEX_VERSION,
+                size=stat.st_size,
+                mtime_ns=stat.st_mtime_ns,
+            )
+            index = self._index
+            if index is None and exists(self.index_path):
+                try:
+                    with open(self.index_path) as f:
+                        index = json.load(f)
+                except (OSError, ValueError) as e:
+                    lgr.debug("Ignoring unreadable index %s: %s",
+                              self.index_path, e)
+            if index is None or index.get('signature') != signature:
+                index = dict(signature=signature, **_index_archive(self._archive))
+                self._save_index(index)
+            self._index = index
+            return index
+
+    def _save_index(self, index):
+        dir_ = os.path.dirname(self.index_path)
+        if not exists(dir_):
+            os.makedirs(dir_)
+        tmp_path = '%s.%s' % (self.index_path, _get_random_id())
+        try:
+            with open(tmp_path, 'w') as f:
+                json.dump(index, f)
+            os.replace(tmp_path, self.index_path)
+        except OSError as e:
+            # the index only saves time, failing to store it is no reason
+            # to fail
+            lgr.debug("Failed to store index %s: %s", self.index_path, e)
+            if exists(tmp_path):
+                unlink(tmp_path)
+
+    def extract_file(self, afile, dest):
+        """Write a single file from the archive into `dest`
+
+        In contrast to `get_extracted_file()` the archive is not extracted,
+        only the content of the requested file is read from it.
+
+        Compressed tarballs can only be read sequentially, so every direct
+        read would decompress the archive up to the requested file.  Hence,
+        only a single file is read directly from them.  Any further request
+        is declined, and should be served by extracting the archive once.
+
+        Parameters
+        ----------
+        afile : str
+          Path of the file within the archive.
+        dest : str
+          Path of the file to (over)write.
+
+        Returns
+        -------
+        bool
+          False if the file cannot be read directly from this archive (e.g.
+          unsupported archive format, or not a regular file).  Nothing was
+          written then, and the archive needs to be extracted instead.
+        """
+        index = self.get_member_index()
+        if index['format'] == 'compressed-tar':
+            with self._index_lock:
+                if self._compressed_read:
+                    lgr.debug("Not reading %s directly from compressed %s "
+                              "again", afile, self._archive)
+                    return False
+                self._compressed_read = True
+            return self._extract_compressed_tar_file(afile, dest)
+        member = index['members'].get(_normalize_member_name(afile))
+        if member is None:
+            lgr.debug("%s cannot be read directly from %s",
+                      afile, self._archive)
+            return False
+        offset, size = member[:2]
+        lgr.debug("Reading %s (%d bytes) directly from %s",
+                  afile, size, self._archive)
+        if index['format'] == 'zip':
+            with zipfile.ZipFile(self._archive) as zf, \
+                    zf.open(member[2]) as src, \
+                    open(dest, 'wb') as dst:
+                _copy_bytes(src, dst, size)
+        else:
+            with open(self._archive, 'rb') as src, \
+                    open(dest, 'wb') as dst:
+                src.seek(offset)
+                _copy_bytes(src, dst, size)
+        return True
+
+    def _extract_compressed_tar_file(self, afile, dest):
+        name = _normalize_member_name(afile)
+        with tarfile.open(self._archive) as tf:
+            while True:
+                ti = tf.next()
+                if ti is None:
+                    break
+                # do not accumulate all TarInfo's of huge archives in memory
+                tf.members = []
+                if _normalize_member_name(ti.name) != name:
+                    continue
+                if not ti.isreg() or ti.sparse:
+                    # e.g. links, which need the extracted archive
+                    break
+                lgr.debug("Reading %s (%d bytes) directly from %s",
+                          afile, ti.size, self._archive)
+                with tf.extractfile(ti) as src, open(dest, 'wb') as dst:
+                    _copy_bytes(src, dst, ti.size)
+                return True
+        lgr.debug("%s cannot be read directly from %s", afile, self._archive)
+        return False
+
     def __del__(self):
         try:
             if self._persistent:
@@ -0,0 +1,220 @@
+# emacs: -*- mode: python; py-indent-offset: 4; tab-width: 4; indent-tabs-mode: nil -*-
+# ex: set sts=4 ts=4 sw=4 et:
+# ## ### ### ### ### ### ### ### ### ### ### ### ### ### ### ### ### ### ### ##
+#
+#   See COPYING file distributed along with the datalad package for the
+#   copyright and license terms.
+#
+# ## ### ### ### ### ### ### ### ### ### ### ### ### ### ### ### ### ### ### ##
+"""Compact containers for content information reports
+
+Reports of `GitRepo.get_content_info()`, `AnnexRepo.get_content_annexinfo()`
+and `GitRepo.diffstatus()` map absolute path objects to dicts with content
+properties. For repositories with millions of files, this representation
+requires several GB of memory. The containers in this module implement the
+same (mutable) mapping interface with a much smaller footprint:
+
+- `ContentInfo` stores paths relative to the repository root as plain
+  strings, and only materializes path objects when they are requested.
+- `ContentRecord` stores the common properties in slots, and interns the
+  values of properties with a small set of possible values (like 'type').
+"""
+
+import os
+import sys
+from collections.abc import (
+    ItemsView,
+    MutableMapping,
+    ValuesView,
+)
+from pathlib import (
+    Path,
+    PurePath,
+)
+
+# properties that are stored in slots, any other property is stored in
+# an additional dict
+_RECORD_FIELDS = (
+    'type',
+    'gitshasum',
+    'prev_gitshasum',
+    'state',
+    'key',
+    'backend',
+    'keyname',
+    'bytesize',
+    'humansize',
+    'mtime',
+    'hashdirlower',
+    'hashdirmixed',
+    'has_content',
+    'objloc',
+)
+
+# properties with a small set of possible (string) values
+_INTERNED_FIELDS = frozenset(('type', 'state', 'backend', 'prev_type'))
+
+
+class ContentRecord(MutableMapping):
+    """Properties of a single content item
+
+    Behaves like a `dict` with string keys.
+    """
+    __slots__ = _RECORD_FIELDS + ('_extra',)
+
+    def __init__(self, *args, **kwargs):
+        self._extra = None
+        self.update(*args, **kwargs)
+
+    def __getitem__(self, name):
+        if name in _RECORD_FIELDS:
+            try:
+                return getattr(self, name)
+            except AttributeError:
+                raise KeyError(name) from None
+        if self._extra is None:
+            raise KeyError(name)
+        return self._extra[name]
+
+    def __setitem__(self, name, value):
+        if name in _INTERNED_FIELDS and type(value) is str:
+            value = sys.intern(value)
+        if name in _RECORD_FIELDS:
+            setattr(self, name, value)
+            return
+        if self._extra is None:
+            self._extra = {}
+        self._extra[name] = value
+
+    def __delitem__(self, name):
+        if name in _RECORD_FIELDS:
+            try:
+                delattr(self, name)
+            except AttributeError:
+                raise KeyError(name) from None
+            return
+        if self._extra is None:
+            raise KeyError(name)
+        del self._extra[name]
+
+    def __iter__(self):
+        for name in _RECORD_FIELDS:
+            if hasattr(self, name):
+                yield name
+        if self._extra:
+            yield from self._extra
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+    def __contains__(self, name):
+        if name in _RECORD_FIELDS:
+            return hasattr(self, name)
+        return self._extra is not None and name in self._extra
+
+    def copy(self):
+        return self.__class__(self)
+
+    def __repr__(self):
+        return '{}({!r})'.format(self.__class__.__name__, dict(self))
+
+
+class ContentInfo(MutableMapping):
+    """Mapping of absolute paths to content properties
+
+    Behaves like the `OrderedDict` reported by `GitRepo.get_content_info()`.
+    Keys are `pathlib.Path` instances (paths underneath the root path are
+    stored as relative path strings internally). Values are converted to
+    `ContentRecord` instances on assignment.
+
+    Parameters
+    ----------
+    root : Path-like
+      Path of the repository the reported paths are underneath.
+    other : Mapping, optional
+      Initial content.
+    """
+    __slots__ = ('_root', '_root_str', '_prefix', '_records')
+
+    def __init__(self, root, other=None):
+        self._root = Path(root)
+        self._root_str = str(self._root)
+        self._prefix = os.path.join(self._root_str, '')
+        self._records = {}
+        if other is not None:
+            self.update(other)
+
+    @property
+    def root(self):
+        return self._root
+
+    def _key(self, path):
+        if not isinstance(path, PurePath):
+            # would never match a path, but must not clash with a relative
+            # path string either
+            return (path,)
+        path_str = str(path)
+        if path_str.startswith(self._prefix):
+            return path_str[len(self._prefix):]
+        if path_str == self._root_str:
+            return ''
+        return path
+
+    def _path(self, key):
+        if type(key) is str:
+            return self._root / key if key else self._root
+        if type(key) is tuple:
+            return key[0]
+        return key
+
+    def __getitem__(self, path):
+        return self._records[self._key(path)]
+
+    def __setitem__(self, path, props):
+        if type(props) is not ContentRecord:
+            props = ContentRecord(props)
+        self._records[self._key(path)] = props
+
+    def __delitem__(self, path):
+        del self._records[self._key(path)]
+
+    def __contains__(self, path):
+        return self._key(path) in self._records
+
+    def __iter__(self):
+        for key in self._records:
+            yield self._path(key)
+
+    def __len__(self):
+        return len(self._records)
+
+    def items(self):
+        return _ContentInfoItems(self)
+
+    def values(self):
+        return _ContentInfoValues(self)
+
+    def copy(self):
+        # records are shared, like with dict.copy()
+        new = self.__class__(self._root)
+        new._records = self._records.copy()
+        return new
+
+    def __repr__(self):
+        return '{}({!r}, {{{}}})'.format(
+            self.__class__.__name__,
+            self._root_str,
+            ', '.join('{!r}: {!r}'.format(k, v)
+                      for k, v in self._records.items()))
+
+
+class _ContentInfoItems(ItemsView):
+    def __iter__(self):
+        path = self._mapping._path
+        for key, props in self._mapping._records.items():
+            yield path(key), props
+
+
+class _ContentInfoValues(ValuesView):
+    def __iter__(self):
+        yield from self._mapping._records.values()
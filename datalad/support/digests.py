@@ -10,6 +10,9 @@
 """
 
 import hashlib
+import mmap
+import os
+from concurrent.futures import ThreadPoolExecutor
 
 from ..utils import auto_repr
 
@@ -25,12 +28,16 @@ class Digester(object):
     # Loosely based on snippet by PM 2Ring 2014.10.23
     # http://unix.stackexchange.com/a/163769/55543
 
-    # Ideally we should find an efficient way to parallelize this but
-    # atm this one is sufficiently speedy
-
     DEFAULT_DIGESTS = ['md5', 'sha1', 'sha256', 'sha512']
 
-    def __init__(self, digests=None, blocksize=1 << 16):
+    # files of at least this size are memory mapped, and each digest is
+    # computed in its own thread (hashlib releases the GIL while hashing)
+    PARALLEL_MIN_SIZE = 1 << 22
+    # boundaries for the block size if none was given explicitly
+    MIN_BLOCKSIZE = 1 << 16
+    MAX_BLOCKSIZE = 1 << 23
+
+    def __init__(self, digests=None, blocksize=None):
         """
         Parameters
         ----------
@@ -38,8 +45,9 @@ class Digester(object):
           List of any supported algorithm labels, such as md5, sha1, etc.
           If None, a default set of hashes will be computed (md5, sha1,
           sha256, sha512).
-        blocksize : int
-          Chunk size (in bytes) by which to consume a file.
+        blocksize : int or None
+          Chunk size (in bytes) by which to consume a file. If None, the
+          chunk size is chosen depending on the size of the file.
         """
         self._digests = digests or self.DEFAULT_DIGESTS
         self._digest_funcs = [getattr(hashlib, digest) for digest in self._digests]
@@ -59,13 +67,128 @@ class Digester(object):
         dict
           Keys are algorithm labels, and values are checksum strings
         """
+        return self._digest(
+            fpath,
+            parallel=len(self._digest_funcs) > 1 and (os.cpu_count() or 1) > 1)
+
+    def digest_files(self, paths, jobs=None):
+        """Compute digests for a number of files concurrently
+
+        Parameters
+        ----------
+        paths : iterable
+          File paths for which checksums shall be computed.
+        jobs : int or None
+          Number of files to process in parallel. If None, the default
+          number of workers of a `ThreadPoolExecutor` is used.
+
+        Yields
+        ------
+        tuple
+          (path, dict) in the order of `paths`. The dict is the same as
+          returned for a single file.
+        """
+        paths = list(paths)
+        if not paths:
+            return
+        if jobs == 1 or len(paths) == 1:
+            for p in paths:
+                yield p, self(p)
+            return
+        # files are processed concurrently, there is no need to split up
+        # the digests of an individual file across threads, too
+        with ThreadPoolExecutor(jobs) as executor:
+            yield from zip(
+                paths,
+                executor.map(lambda p: self._digest(p, parallel=False),
+                             paths))
+
+    def digest_dir(self, path, jobs=None):
+        """Compute digests for all files underneath a directory
+
+        Parameters
+        ----------
+        path : str or Path
+          Directory to traverse. Symlinks to directories are not followed,
+          symlinks to files are digested.
+        jobs : int or None
+          Passed on to `digest_files()`.
+
+        Return
+        ------
+        dict
+          Keys are file paths relative to `path` (in platform convention),
+          values are dicts as returned for a single file.
+        """
+        path = str(path)
+        files = [
+            os.path.join(root, f)
+            for root, dirs, fnames in os.walk(path)
+            for f in fnames
+        ]
+        # e.g. broken symlinks
+        files = [f for f in files if os.path.isfile(f)]
+        return {
+            os.path.relpath(f, path): d
+            for f, d in self.digest_files(files, jobs=jobs)
+        }
+
+    def _get_blocksize(self, size):
+        if self.blocksize:
+            return self.blocksize
+        return min(max(size >> 6, self.MIN_BLOCKSIZE), self.MAX_BLOCKSIZE)
+
+    def _digest(self, fpath, parallel):
         lgr.debug("Estimating digests for %s", fpath)
         digests = [x() for x in self._digest_funcs]
         with open(fpath, 'rb') as f:
+            size = os.fstat(f.fileno()).st_size
+            blocksize = self._get_blocksize(size)
+            if size >= self.PARALLEL_MIN_SIZE:
+                try:
+                    mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                except (OSError, ValueError) as e:
+                    # e.g. special or network file systems
+                    lgr.debug("Cannot memory map %s: %s", fpath, e)
+                    mapped = None
+                if mapped is not None:
+                    with mapped:
+                        self._digest_mapped(mapped, digests, blocksize, parallel)
+                    return self._get_hexdigests(digests)
+            # read into a single, reused buffer
+            buf = bytearray(blocksize)
+            view = memoryview(buf)
             while True:
-                block = f.read(self.blocksize)
-                if not block:
+                n = f.readinto(buf)
+                if not n:
                     break
-                [d.update(block) for d in digests]
+                block = view[:n]
+                for d in digests:
+                    d.update(block)
+                block.release()
+            view.release()
+        return self._get_hexdigests(digests)
+
+    @staticmethod
+    def _digest_mapped(mapped, digests, blocksize, parallel):
+        view = memoryview(mapped)
+        try:
+            def update(d):
+                for offset in range(0, len(view), blocksize):
+                    d.update(view[offset:offset + blocksize])
+
+            if parallel:
+                with ThreadPoolExecutor(len(digests)) as executor:
+                    # consume to propagate exceptions
+                    list(executor.map(update, digests))
+            else:
+                for offset in range(0, len(view), blocksize):
+                    block = view[offset:offset + blocksize]
+                    for d in digests:
+                        d.update(block)
+                    block.release()
+        finally:
+            view.release()
 
+    def _get_hexdigests(self, digests):
         return {n: d.hexdigest() for n, d in zip(self.digests, digests)}
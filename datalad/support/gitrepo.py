@@ -59,6 +59,7 @@ from datalad.dataset.gitrepo import (
     path_based_str_repr,
 )
 from datalad.log import log_progress
+from datalad.runner.utils import BytesLineSplitter
 from datalad.support.due import (
     Doi,
     due,
@@ -93,7 +94,9 @@ from .network import (
     PathRI,
     is_ssh,
 )
+from .content_info import ContentInfo
 from .path import get_parent_paths
+from .worktree_cache import WorktreeContentInfoCache
 
 # shortcuts
 _curdirsep = curdir + sep
@@ -405,7 +408,7 @@ class GitProgress(WitlessProtocol):
 
     def __init__(self, *args):
         super().__init__(*args)
-        self._unprocessed = None
+        self._line_splitter = BytesLineSplitter(keep_ends=True)
 
     def connection_made(self, transport):
         super().connection_made(transport)
@@ -413,6 +416,10 @@ class GitProgress(WitlessProtocol):
         self._pbars = set()
 
     def process_exited(self):
+        # an unterminated last line is processed as is
+        line = self._line_splitter.finish_processing()
+        if line is not None:
+            self._process_line(2, line)
         # take down any progress bars that were not closed orderly
         for pbar_id in self._pbars:
             log_progress(
@@ -428,26 +435,20 @@ class GitProgress(WitlessProtocol):
             # let the base class decide what to do with it
             super().pipe_data_received(fd, byts)
             return
-        for line in byts.splitlines(keepends=True):
-            # put any unprocessed content back in front
-            line = self._unprocessed + line if self._unprocessed else line
-            self._unprocessed = None
-            if not self._parse_progress_line(line):
-                # anything that doesn't look like a progress report
-                # is retained and returned
-                # in case of partial progress lines, this can lead to
-                # leakage of progress info into the output, but
-                # it is better to enable better (maybe more expensive)
-                # subsequent filtering than hiding lines with
-                # unknown, potentially important info
-                lgr.debug('Non-progress stderr: %s', line)
-                if line.endswith((b'\r', b'\n')):
-                    # complete non-progress line, pass on
-                    super().pipe_data_received(fd, line)
-                else:
-                    # an incomplete line, maybe the next batch completes
-                    # it to become a recognizable progress report
-                    self._unprocessed = line
+        # incomplete lines are kept by the splitter, maybe the next batch
+        # completes them to become a recognizable progress report
+        for line in self._line_splitter.process(byts):
+            self._process_line(fd, line)
+
+    def _process_line(self, fd, line):
+        if not self._parse_progress_line(line):
+            # anything that doesn't look like a progress report
+            # is retained and returned
+            # it is better to enable better (maybe more expensive)
+            # subsequent filtering than hiding lines with
+            # unknown, potentially important info
+            lgr.debug('Non-progress stderr: %s', line)
+            super().pipe_data_received(fd, line)
 
     def _parse_progress_line(self, line):
         """Process a single line
@@ -911,6 +912,9 @@ class GitRepo(CoreGitRepo):
         if fake_dates:
             self.configure_fake_dates()
 
+        # created on demand by get_content_info()
+        self._content_info_cache = None
+
     @property
     def bare(self):
         """Returns a bool indicating whether the repository is bare
@@ -1499,6 +1503,23 @@ class GitRepo(CoreGitRepo):
         -------
         str or, if there are not commits yet, None.
         """
+        obj = '{}^{{commit}}'.format(commitish if commitish else 'HEAD')
+        if _batch_commit_format_regex.fullmatch(fmt) \
+                and self._cat_file.is_batchable(obj):
+            # all placeholders can be answered from the raw commit object,
+            # which a persistent cat-file process can give us
+            rec = self.cat_file(obj)
+            if rec is None:
+                if commitish is None:
+                    # no commits yet
+                    return None
+                raise ValueError("Unknown commit identifier: %s" % commitish)
+            props = _parse_commit_object(rec[0], rec[2])
+            if props is not None:
+                return _batch_commit_format_placeholder_regex.sub(
+                    lambda m: props[m.group(0)], fmt)
+            # unusual commit object (e.g. non-UTF8 encoding),
+            # let git do the work
         # use git-log and not git-show due to faster performance with
         # complex commits (e.g. octopus merges)
         # https://github.com/datalad/datalad/issues/4801
@@ -1544,6 +1565,14 @@ class GitRepo(CoreGitRepo):
           If a commitish was given, but no corresponding commit could be
           determined.
         """
+        obj = '{}^{{commit}}'.format(commitish if commitish else 'HEAD')
+        if not short and self._cat_file.is_batchable(obj):
+            rec = self.cat_file_check(obj)
+            if rec is not None:
+                return rec[0]
+            if commitish is None:
+                return None
+            raise ValueError("Unknown commit identifier: %s" % commitish)
         # use --quiet because the 'Needed a single revision' error message
         # that is the result of running this in a repo with no commits
         # isn't useful to report
@@ -1627,6 +1656,9 @@ class GitRepo(CoreGitRepo):
         # Note: The peeling operator "^{commit}" is required so that rev-parse
         # doesn't succeed if passed a full hexsha that is valid but doesn't
         # exist.
+        obj = commitish + "^{commit}"
+        if self._cat_file.is_batchable(obj):
+            return self.cat_file_check(obj) is not None
         return self.call_git_success(
             ["rev-parse", "--verify", commitish + "^{commit}"],
             read_only=True,
@@ -2713,8 +2745,115 @@ class GitRepo(CoreGitRepo):
                 "GitRepo.get_content_info(eval_file_type=) no longer supported",
                 DeprecationWarning)
         # TODO limit by file type to replace code in subdatasets command
-        info = OrderedDict()
+        info = self._new_content_info()
+
+        if paths is not None and not paths:
+            return info
+
+        cmd, path_strs, props_re = self._get_content_info_query(
+            paths, ref, untracked)
+
+        if not ref:
+            cache = self._get_content_info_cache(untracked, path_strs)
+            if cache is not None:
+                def ls_files(args, pathspecs):
+                    res = self._new_content_info()
+                    self._get_content_info_line_helper(
+                        None,
+                        res,
+                        self.call_git(
+                            ['ls-files', '-z'] + args,
+                            files=pathspecs,
+                            read_only=True).split('\0'),
+                        props_re)
+                    return res
+
+                info = cache.get(
+                    untracked, path_strs, ls_files,
+                    ignore_files=self._get_global_ignore_files(),
+                    container=self._new_content_info)
+                lgr.debug('Done %s.get_content_info(...)', self)
+                return info
+
+        lgr.debug('Query repo: %s', cmd)
+        try:
+            stdout = self.call_git(
+                cmd,
+                files=path_strs,
+                expect_fail=True,
+                read_only=True)
+        except CommandError as exc:
+            if "fatal: Not a valid object name" in exc.stderr:
+                raise InvalidGitReferenceError(ref)
+            raise
+        lgr.debug('Done query repo: %s', cmd)
+
+        self._get_content_info_line_helper(
+            ref,
+            info,
+            stdout.split('\0'),
+            props_re)
+
+        lgr.debug('Done %s.get_content_info(...)', self)
+        return info
+
+    def iter_content_info(self, paths=None, ref=None, untracked='all'):
+        """Yield identifier and type information on repository content
+
+        This is the streaming counterpart of `get_content_info()`. Items are
+        yielded as soon as Git reports them, in the order of Git's report
+        (untracked content first, tracked content sorted by path), rather
+        than collected in a single mapping first.
+
+        All arguments have identical names and semantics as their
+        `get_content_info()` counterparts.
+
+        Yields
+        ------
+        tuple
+          A `Path` instance with the absolute path of a content item, and a
+          dictionary with its properties (see `get_content_info()`).
+        """
+        if paths is not None and not paths:
+            return
+
+        cmd, path_strs, props_re = self._get_content_info_query(
+            paths, ref, untracked)
+
+        if not ref:
+            cache = self._get_content_info_cache(untracked, path_strs)
+            if cache is not None and cache.is_warm(untracked):
+                # nothing to gain from not using the report at hand
+                yield from self.get_content_info(
+                    paths=paths, ref=ref, untracked=untracked).items()
+                return
+
+        lgr.debug('Query repo: %s', cmd)
+        try:
+            yield from self._iter_content_info_lines(
+                ref,
+                self.call_git_items_(
+                    cmd,
+                    files=path_strs,
+                    expect_fail=True,
+                    read_only=True,
+                    sep='\0'),
+                props_re)
+        except CommandError as exc:
+            if "fatal: Not a valid object name" in exc.stderr:
+                raise InvalidGitReferenceError(ref)
+            raise
+        lgr.debug('Done query repo: %s', cmd)
+
+    def _get_content_info_query(self, paths, ref, untracked):
+        """Internal helper of get_content_info() to compose a Git query
 
+        Returns
+        -------
+        list, list or None, re.Pattern
+          The Git command, the paths to pass on to Git, and a regular
+          expression to parse Git's report on a content item.
+        """
         if paths:
             # path matching will happen against what Git reports
             # and Git always reports POSIX paths
@@ -2722,8 +2861,6 @@ class GitRepo(CoreGitRepo):
             # convert unconditionally
             # note: will be list-ified below
             paths = map(ut.PurePosixPath,  paths)
-        elif paths is not None:
-            return info
 
         path_strs = list(map(str, paths)) if paths else None
         if path_strs and (not ref or external_versions["cmd:git"] >= "2.29.0"):
@@ -2764,31 +2901,67 @@ class GitRepo(CoreGitRepo):
             cmd = ['ls-tree', ref, '-z', '-r', '--full-tree', '-l']
             props_re = re.compile(
                 r'(?P<type>[0-9]+) ([a-z]*) (?P<sha>[^ ]*) [\s]*(?P<size>[0-9-]+)\t(?P<fname>.*)$')
+        return cmd, path_strs, props_re
 
-        lgr.debug('Query repo: %s', cmd)
-        try:
-            stdout = self.call_git(
-                cmd,
-                files=path_strs,
-                expect_fail=True,
-                read_only=True)
-        except CommandError as exc:
-            if "fatal: Not a valid object name" in exc.stderr:
-                raise InvalidGitReferenceError(ref)
-            raise
-        lgr.debug('Done query repo: %s', cmd)
+    def _new_content_info(self):
+        """Return an empty container for a report on repository content
 
-        self._get_content_info_line_helper(
-            ref,
-            info,
-            stdout.split('\0'),
-            props_re)
+        By default this is an OrderedDict, or a more compact, but otherwise
+        equivalent ContentInfo instance, if enabled via the
+        'datalad.runtime.compact-content-info' configuration.
+        """
+        if self.config.getbool(
+                'datalad.runtime', 'compact-content-info', default=False):
+            return ContentInfo(self.pathobj)
+        return OrderedDict()
 
-        lgr.debug('Done %s.get_content_info(...)', self)
-        return info
+    def _get_content_info_cache(self, untracked, paths):
+        """Internal helper of get_content_info() to select a worktree cache
+
+        Returns
+        -------
+        WorktreeContentInfoCache or None
+          None, if a query cannot (or should not) be answered from a cache.
+        """
+        if self.bare or not self.config.getbool(
+                'datalad.runtime', 'worktree-cache', default=True):
+            return None
+        if not WorktreeContentInfoCache.supports(untracked, paths):
+            return None
+        cache = self._content_info_cache
+        if cache is None or cache._dot_git != str(self.dot_git):
+            # (re)initialized repository
+            cache = self._content_info_cache = WorktreeContentInfoCache(
+                self.pathobj, self.dot_git)
+        if paths and not cache.is_warm(untracked):
+            # a query for a few paths is cheaper than a full report
+            return None
+        return cache
+
+    def _get_global_ignore_files(self):
+        """Return the files with ignore rules that are not in the repository
+        """
+        excludes_file = self.config.get('core.excludesfile', None)
+        if excludes_file:
+            return [op.expanduser(excludes_file)]
+        return [op.join(
+            os.environ.get('XDG_CONFIG_HOME') or op.expanduser(
+                op.join('~', '.config')),
+            'git', 'ignore')]
 
     def _get_content_info_line_helper(self, ref, info, lines, props_re):
         """Internal helper of get_content_info() to parse Git output"""
+        for path, inf in self._iter_content_info_lines(ref, lines, props_re):
+            info[path] = inf
+
+    def _iter_content_info_lines(self, ref, lines, props_re):
+        """Internal helper of get_content_info() to parse Git output
+
+        Yields
+        ------
+        tuple
+          Path and property dict of a content item.
+        """
         mode_type_map = {
             '100644': 'file',
             '100755': 'file',
@@ -2833,7 +3006,7 @@ class GitRepo(CoreGitRepo):
                 # be nice and assign types for untracked content
                 inf['type'] = 'symlink' if path.is_symlink() \
                     else 'directory' if path.is_dir() else 'file'
-            info[path] = inf
+            yield path, inf
 
     def status(self, paths=None, untracked='all', eval_submodule_state='full'):
         """Simplified `git status` equivalent.
@@ -3015,7 +3188,7 @@ class GitRepo(CoreGitRepo):
                 from_state = {}
             _cache[key] = from_state
 
-        status = OrderedDict()
+        status = self._new_content_info()
         for f, to_state_r in to_state.items():
             props = self._diffstatus_get_state_props(
                 f,
@@ -3688,6 +3861,62 @@ class GitRepo(CoreGitRepo):
                     logger=lgr)
 
 
+# `git log --format` placeholders that can be reported from a raw commit
+# object without involving `git log`
+_batch_commit_format_placeholder_regex = re.compile(
+    r'%(?:an|ae|at|cn|ce|ct|x00|[HTPBn%])')
+_batch_commit_format_regex = re.compile(
+    r'(?:[^%]|{})*'.format(_batch_commit_format_placeholder_regex.pattern))
+_commit_person_regex = re.compile(r'(.*) <(.*)> (\d+) [+-]\d{4}')
+
+
+def _parse_commit_object(hexsha, content):
+    """Map the `git log --format` placeholders supported for batched queries
+    to their values for a raw commit object
+
+    Returns
+    -------
+    dict or None
+      None is returned when the commit object cannot be reported faithfully
+      without git's help (e.g. commit messages with a non-UTF8 encoding).
+    """
+    header, sep, message = content.partition('\n\n')
+    if not sep:
+        return None
+    props = {
+        '%H': hexsha,
+        '%B': message,
+        '%n': '\n',
+        '%x00': '\0',
+        '%%': '%',
+    }
+    parents = []
+    for line in header.split('\n'):
+        if line.startswith(' '):
+            # continuation of a multi-line header (e.g. gpgsig)
+            continue
+        field, _, value = line.partition(' ')
+        if field == 'tree':
+            props['%T'] = value
+        elif field == 'parent':
+            parents.append(value)
+        elif field in ('author', 'committer'):
+            match = _commit_person_regex.fullmatch(value)
+            if not match:
+                return None
+            name, email, timestamp = match.groups()
+            props['%{}n'.format(field[0])] = name
+            props['%{}e'.format(field[0])] = email
+            props['%{}t'.format(field[0])] = timestamp
+        elif field == 'encoding':
+            # git log would reencode the message
+            return None
+    if '%T' not in props or '%an' not in props or '%cn' not in props:
+        return None
+    props['%P'] = ' '.join(parents)
+    return props
+
+
 # used in in the get command and GitRepo.add_submodule(), the
 # latter is not used outside the tests
 def _fixup_submodule_dotgit_setup(ds, relativepath):
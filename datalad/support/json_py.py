@@ -12,6 +12,10 @@
 
 import io
 import codecs
+import mmap
+import struct
+import lzma
+from bisect import bisect_right
 from os.path import (
     dirname,
     exists,
@@ -24,6 +28,7 @@ import os.path as op
 # wrapped below
 from simplejson import load as jsonload
 from simplejson import dump as jsondump
+from simplejson import dumps as jsondumps
 # simply mirrored for now
 from simplejson import loads as json_loads
 from simplejson import JSONDecodeError
@@ -130,6 +135,152 @@ def dump2xzstream(obj, fname):
     dump2stream(obj, fname, compressed=True)
 
 
+# identifies a block stream file, and the version of its layout
+BLOCKSTREAM_MAGIC = b'DLJSONBLK1\n'
+# offset and length of the index, at the very end of a block stream file
+_blockstream_trailer = struct.Struct('<QQ')
+
+
+def dump2blockstream(obj, fname, key='path', blocksize=1 << 16):
+    """Dump a stream of JSON objects into a block-compressed, indexed file
+
+    Objects are serialized as in `dump2stream()`, but the resulting lines
+    are compressed in independent blocks. An index of the key value of the
+    first object in each block, and the location of the block is appended to
+    the file. This makes it possible to look up individual objects by their
+    key without decompressing the entire file (see `BlockStreamReader`).
+
+    Parameters
+    ----------
+    obj : iterable
+      JSON-serializable dicts, sorted by their `key` value.
+    fname : str
+      Name of the file to dump into.
+    key : str
+      Name of the property by which objects can be looked up.
+    blocksize : int
+      Size (in bytes) of serialized objects to collect into a single
+      compressed block.
+    """
+    indir = dirname(fname)
+    if op.lexists(fname):
+        os.remove(fname)
+    elif indir and not exists(indir):
+        makedirs(indir)
+    blocks = []
+    with open(fname, mode='wb') as f:
+        f.write(BLOCKSTREAM_MAGIC)
+        buf = io.BytesIO()
+        jwriter = codecs.getwriter('utf-8')(buf)
+        first = last = None
+
+        def flush():
+            data = lzma.compress(buf.getvalue())
+            blocks.append([first, f.tell(), len(data)])
+            f.write(data)
+            buf.seek(0)
+            buf.truncate()
+
+        for o in obj:
+            k = o[key]
+            if last is not None and k < last:
+                raise ValueError(
+                    'Objects are not sorted by {!r}: {!r} after {!r}'.format(
+                        key, k, last))
+            if first is None:
+                first = k
+            last = k
+            jsondump(o, jwriter, **compressed_json_dump_kwargs)
+            buf.write(b'\n')
+            if buf.tell() >= blocksize:
+                flush()
+                first = None
+        if first is not None:
+            flush()
+        index = lzma.compress(jsondumps(
+            {'key': key, 'blocks': blocks},
+            **compressed_json_dump_kwargs).encode('utf-8'))
+        index_offset = f.tell()
+        f.write(index)
+        f.write(_blockstream_trailer.pack(index_offset, len(index)))
+
+
+def is_blockstream(fname):
+    """Whether a file is a block stream written by `dump2blockstream()`"""
+    with open(fname, 'rb') as f:
+        return f.read(len(BLOCKSTREAM_MAGIC)) == BLOCKSTREAM_MAGIC
+
+
+class BlockStreamReader(object):
+    """Random access to the objects in a file written by `dump2blockstream()`
+
+    The file is memory-mapped, and only the blocks holding requested objects
+    are decompressed.
+    """
+    def __init__(self, fname):
+        self.fname = fname
+        with open(fname, 'rb') as f:
+            try:
+                self._data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except (OSError, ValueError) as e:
+                # e.g. special or network file systems
+                lgr.debug("Cannot memory map %s: %s", fname, e)
+                self._data = f.read()
+        if self._data[:len(BLOCKSTREAM_MAGIC)] != BLOCKSTREAM_MAGIC:
+            self.close()
+            raise ValueError('{} is not a JSON block stream'.format(fname))
+        index_offset, index_len = _blockstream_trailer.unpack(
+            self._data[-_blockstream_trailer.size:])
+        index = json_loads(lzma.decompress(
+            self._data[index_offset:index_offset + index_len]).decode('utf-8'))
+        self.key = index['key']
+        self._blocks = index['blocks']
+        self._firstkeys = [b[0] for b in self._blocks]
+
+    def close(self):
+        if isinstance(self._data, mmap.mmap):
+            self._data.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _iter_block(self, i):
+        _, offset, length = self._blocks[i]
+        for line in lzma.decompress(
+                self._data[offset:offset + length]).splitlines():
+            yield loads(line.decode('utf-8'))
+
+    def iter_range(self, start=None, stop=None):
+        """Yield objects with a key value in the half-open range [start, stop)
+
+        Parameters
+        ----------
+        start : str or None
+          If None, iteration starts with the first object.
+        stop : str or None
+          If None, iteration ends with the last object.
+        """
+        first_block = 0 if start is None \
+            else max(bisect_right(self._firstkeys, start) - 1, 0)
+        for i in range(first_block, len(self._blocks)):
+            if stop is not None and self._firstkeys[i] >= stop:
+                return
+            for o in self._iter_block(i):
+                k = o[self.key]
+                if start is not None and k < start:
+                    continue
+                if stop is not None and k >= stop:
+                    return
+                yield o
+
+    def get(self, k, default=None):
+        """Return the (first) object with a given key value"""
+        return next(self.iter_range(k, k + '\0'), default)
+
+
 def load_stream(fname, compressed=None):
     with _suitable_open(fname, compressed)(fname, mode='rb') as f:
         jreader = codecs.getreader('utf-8')(f)
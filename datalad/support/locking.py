@@ -1,5 +1,6 @@
 from fasteners import (
     InterProcessLock,
+    InterProcessReaderWriterLock,
     try_lock,
 )
 from contextlib import contextmanager
@@ -116,6 +117,52 @@ def lock_if_check_fails(
                 unlink(lock_filename)
 
 
+@contextmanager
+def lock_shared(lock_path):
+    """A context manager to hold a lock shared with other holders
+
+    Shared holders do not block each other, but prevent acquisition of the
+    same lock via `try_lock_exclusive()`.  E.g. processes reading some
+    content could hold it shared, while the content can only be removed
+    under an exclusive lock.
+
+    Note that, like `lock_if_check_fails`, it works only across processes.
+
+    Parameters
+    ----------
+    lock_path: str
+      Path of the lock file
+    """
+    lock = InterProcessReaderWriterLock(lock_path)
+    lgr.debug("Acquiring a shared lock %s", lock_path)
+    with lock.read_lock():
+        yield lock
+
+
+@contextmanager
+def try_lock_exclusive(lock_path):
+    """A context manager to try to hold a lock exclusively, without blocking
+
+    Parameters
+    ----------
+    lock_path: str
+      Path of the lock file, as used with `lock_shared()`
+
+    Returns
+    -------
+    bool
+      Whether the lock was acquired. If not, the lock is held by others.
+    """
+    lock = InterProcessReaderWriterLock(lock_path)
+    acquired = lock.acquire_write_lock(blocking=False)
+    lgr.debug("Acquired? exclusive lock %s: %s", lock_path, acquired)
+    try:
+        yield acquired
+    finally:
+        if acquired:
+            lock.release_write_lock()
+
+
 @contextmanager
 def try_lock_informatively(lock, purpose=None, timeouts=(5, 60, 240), proceed_unlocked=False):
     """Try to acquire lock (while blocking) multiple times while logging INFO messages on failure
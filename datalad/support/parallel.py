@@ -18,9 +18,15 @@ import sys
 import time
 import uuid
 
-from collections import defaultdict
+from collections import (
+    OrderedDict,
+    defaultdict,
+)
 from queue import Queue, Empty
-from threading import Thread
+from threading import (
+    Lock,
+    Thread,
+)
 
 from . import ansi_colors as colors
 from ..log import log_progress
@@ -359,7 +365,10 @@ class ProducerConsumer:
                     if (self._producer_finished and
                             not futures and
                             consumer_queue.empty() and
-                            producer_queue.empty()):
+                            # consumers might have kept adding to the
+                            # producer queue, but nothing will be submitted
+                            # anymore after an exception
+                            (producer_queue.empty() or interrupted_by_exception)):
                         # This will let us not "escape" the while loop and reraise any possible exception
                         # within the loop if we have any.
                         # Otherwise we might see "RuntimeError: generator ignored GeneratorExit"
@@ -465,6 +474,110 @@ class ProducerConsumer:
         return done_useful
 
 
+class TreeQueryPrefetcher:
+    """Evaluate queries on the nodes of a tree ahead of their consumption
+
+    Some trees (e.g. dataset hierarchies) must be traversed in a particular
+    order, while the evaluation of any node is expensive, but independent of
+    the evaluation of its siblings. `query` is called with a node and must
+    return a tuple with the query result and a list of child nodes.
+
+    An instance is called with the node whose query result is needed next,
+    and returns what `query` returned for it. The first node an instance is
+    called with is the root of the tree. Any subsequent node must be one
+    of the child nodes reported by a previous query.
+
+    With `jobs`, child nodes are queried in parallel threads as soon as they
+    become known, with at most `jobs` queries running at the same time, and
+    at most `window` query results held ahead of their consumption. A node
+    that is requested is always queried right away. Without `jobs` (None or
+    0), queries are evaluated on demand in the calling thread.
+
+    `ProducerConsumer` is not used, as it submits everything that is queued
+    and reports in the order of completion, hence could neither bound how
+    far queries run ahead, nor give priority to a requested node.
+    """
+
+    def __init__(self, query, *, key=None, jobs=None, window=None):
+        """
+        Parameters
+        ----------
+        query: callable
+          Called with a node, must return a tuple of a query result and a
+          list of child nodes.
+        key: callable, optional
+          Returns a unique, hashable identifier for a node. By default, nodes
+          themselves are used as identifiers.
+        jobs: int or 'auto', optional
+          Maximum number of parallel queries. With 'auto' the
+          'datalad.runtime.max-jobs' configuration variable is consulted.
+        window: int, optional
+          Maximum number of queries that are started ahead of the request
+          for their node. By default, twice the number of `jobs`.
+        """
+        self.query = query
+        self.key = key or (lambda node: node)
+        self.jobs = ProducerConsumer.get_effective_jobs(jobs) if jobs else 0
+        self.window = window or 2 * self.jobs
+        self._executor = None
+        self._lock = Lock()
+        # key -> future of queries started ahead of their request
+        self._futures = {}
+        # key -> node of known nodes whose query has not been started yet
+        self._pending = OrderedDict()
+
+    def __call__(self, node):
+        if not self.jobs:
+            return self.query(node)
+        key = self.key(node)
+        with self._lock:
+            if self._executor is None:
+                self._executor = concurrent.futures.ThreadPoolExecutor(
+                    self.jobs)
+            elif key not in self._futures and key not in self._pending:
+                raise ValueError(
+                    "{!r} is not a node of the queried tree".format(key))
+            future = self._futures.pop(key, None)
+            if future is None:
+                self._pending.pop(key, None)
+                future = self._executor.submit(self._query, node)
+            # a slot for a query ahead of time was freed
+            self._fill()
+        return future.result()
+
+    def _query(self, node):
+        res, children = self.query(node)
+        children = list(children)
+        with self._lock:
+            for child in children:
+                self._pending[self.key(child)] = child
+            self._fill()
+        return res, children
+
+    def _fill(self):
+        # must be called with the lock held
+        if self._executor is None:
+            # closed
+            return
+        while self._pending and len(self._futures) < self.window:
+            key, node = self._pending.popitem(last=False)
+            self._futures[key] = self._executor.submit(self._query, node)
+
+    def close(self):
+        """Stop any pending queries"""
+        with self._lock:
+            executor = self._executor
+            self._executor = None
+            for future in self._futures.values():
+                future.cancel()
+            self._futures = {}
+            self._pending = OrderedDict()
+        if executor is not None:
+            # wait for running queries, they might still operate on
+            # repositories
+            executor.shutdown(wait=True)
+
+
 class Sleeper():
     def __init__(self):
         self.min_sleep_time = 0.001
@@ -37,6 +37,14 @@ def _cat_blob(repo, obj, bad_ok=False):
     -------
     Blob's content (str) or None if `obj` is not and `bad_ok` is true.
     """
+    if repo._cat_file.is_batchable(obj):
+        rec = repo.cat_file(obj)
+        if rec is not None and rec[1] == "blob":
+            return rec[2]
+        elif bad_ok:
+            return None
+        # let git report the error
+
     if bad_ok:
         kwds = {"expect_fail": True, "expect_stderr": True}
     else:
@@ -80,8 +88,8 @@ def branch_blobs(repo, branch):
     log_progress(lgr.info, "repodates_branch_blobs",
                  "Checking %d objects", num_objects,
                  label="Checking objects", total=num_objects, unit=" objects")
-    # This is inefficient.  It makes a git call for each object, some of which
-    # aren't even blobs.  We could instead use 'git cat-file --batch'.
+    # Objects are queried via a persistent 'git cat-file --batch' process,
+    # hence no git call per object, even though some of them aren't blobs.
     for obj, fname in blob_trees:
         log_progress(lgr.info, "repodates_branch_blobs",
                      "Checking %s", obj,
@@ -987,6 +987,9 @@ def test_AnnexRepo_get_contentlocation(src=None, path=None, work_dir_outside=Non
         annex.get(fname)
     key_location = annex.get_contentlocation(key, batch=batch)
     assert(key_location)
+    if batch:
+        eq_(annex.get_contentlocation([key, 'MD5E-s1--bogus', key], batch=True),
+            [key_location, '', key_location])
 
     if annex.is_managed_branch():
         # the rest of the test assumes annexed files being symlinks
@@ -1558,6 +1561,8 @@ def test_is_available(p=None, *, batch):
     # with swallow_logs(), swallow_outputs():  # it will complain!
     assert is_available(fname, remote='unknown') is False
     assert_false(is_available("boguskey", key=True))
+    # multiple queries at once
+    eq_(is_available([key, "boguskey", key], key=True), [True, False, True])
 
     # remove url
     urls = annex.whereis(fname, output="full").get(uuid, {}).get("urls", [])
@@ -0,0 +1,114 @@
+# emacs: -*- mode: python; py-indent-offset: 4; tab-width: 4; indent-tabs-mode: nil -*-
+# ex: set sts=4 ts=4 sw=4 et:
+# ## ### ### ### ### ### ### ### ### ### ### ### ### ### ### ### ### ### ### ##
+#
+#   See COPYING file distributed along with the datalad package for the
+#   copyright and license terms.
+#
+# ## ### ### ### ### ### ### ### ### ### ### ### ### ### ### ### ### ### ### ##
+"""Test compact content info containers"""
+
+from collections import OrderedDict
+from unittest.mock import patch
+
+from datalad.support.content_info import (
+    ContentInfo,
+    ContentRecord,
+)
+from datalad.tests.utils_pytest import (
+    assert_equal,
+    assert_false,
+    assert_in,
+    assert_is_instance,
+    assert_not_in,
+    assert_raises,
+    get_deeply_nested_structure,
+    with_tempfile,
+)
+from datalad.utils import Path
+
+
+def test_ContentRecord():
+    rec = ContentRecord(type='file', gitshasum='abc')
+    assert_equal(rec, {'type': 'file', 'gitshasum': 'abc'})
+    assert_equal(len(rec), 2)
+    # arbitrary properties
+    rec['prev_key'] = 'MD5E-s1--c4ca4238a0b923820dcc509a6f75849b'
+    rec.update({'bytesize': 1, 'status': 'error'})
+    assert_in('prev_key', rec)
+    assert_equal(rec['bytesize'], 1)
+    assert_equal(rec.get('key'), None)
+    assert_raises(KeyError, rec.__getitem__, 'key')
+    del rec['bytesize']
+    del rec['status']
+    assert_not_in('bytesize', rec)
+    assert_raises(KeyError, rec.__delitem__, 'bytesize')
+    assert_raises(KeyError, rec.__delitem__, 'status')
+    assert_equal(
+        dict(rec, path='some'),
+        {'type': 'file', 'gitshasum': 'abc', 'path': 'some',
+         'prev_key': 'MD5E-s1--c4ca4238a0b923820dcc509a6f75849b'})
+    # copies are independent
+    rec2 = rec.copy()
+    rec2['type'] = 'symlink'
+    assert_equal(rec['type'], 'file')
+    # no per-instance dict
+    assert_false(hasattr(rec, '__dict__'))
+    # low-cardinality values are interned
+    assert ContentRecord(type=''.join(['fi', 'le']))['type'] is rec['type']
+
+
+def test_ContentInfo():
+    root = Path('/some/root')
+    info = ContentInfo(root)
+    info[root / 'a' / 'b'] = {'type': 'file'}
+    info[root / 'c'] = ContentRecord(type='directory')
+    info[root] = {'type': 'dataset'}
+    # paths outside the root are supported too
+    info[Path('/elsewhere')] = {'type': 'file'}
+    assert_equal(
+        list(info),
+        [root / 'a' / 'b', root / 'c', root, Path('/elsewhere')])
+    assert_equal(
+        info,
+        OrderedDict([
+            (root / 'a' / 'b', {'type': 'file'}),
+            (root / 'c', {'type': 'directory'}),
+            (root, {'type': 'dataset'}),
+            (Path('/elsewhere'), {'type': 'file'}),
+        ]))
+    assert_is_instance(info[root / 'a' / 'b'], ContentRecord)
+    assert_in(root / 'c', info)
+    # nothing but paths match
+    assert_not_in('c', info)
+    assert_equal(info.get('c'), None)
+    assert_equal([v['type'] for v in info.values()],
+                 ['file', 'directory', 'dataset', 'file'])
+    del info[root / 'c']
+    assert_equal(len(info), 3)
+    cinfo = info.copy()
+    del cinfo[root]
+    assert_in(root, info)
+    assert_equal(ContentInfo(root, info), info)
+
+
+@with_tempfile(mkdir=True)
+def test_compact_content_info_reports(path=None):
+    ds = get_deeply_nested_structure(path)
+    repo = ds.repo
+    reports = [
+        lambda: repo.get_content_info(),
+        lambda: repo.get_content_annexinfo(eval_availability=True),
+        lambda: repo.get_content_annexinfo(init=None, ref='HEAD'),
+        lambda: repo.diffstatus(fr='HEAD', to=None),
+        lambda: ds.status(annex='all', recursive=True,
+                          result_renderer='disabled'),
+        lambda: ds.diff(fr='HEAD~1', annex='basic', recursive=True,
+                        result_renderer='disabled'),
+    ]
+    targets = [r() for r in reports]
+    with patch.dict(repo.config._merged_store,
+                    {'datalad.runtime.compact-content-info': 'true'}):
+        assert_is_instance(repo.get_content_info(), ContentInfo)
+        for target, report in zip(targets, reports):
+            assert_equal(report(), target)
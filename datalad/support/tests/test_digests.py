@@ -8,6 +8,7 @@
 # ## ### ### ### ### ### ### ### ### ### ### ### ### ### ### ### ### ### ### ##
 
 from os.path import join as opj
+from unittest.mock import patch
 
 from datalad.tests.utils_pytest import (
     assert_equal,
@@ -48,3 +49,41 @@ def test_digester(path=None):
             'sha256': '80028815b3557e30d7cbef1d8dbc30af0ec0858eff34b960d2839fd88ad08871',
             'sha512': '684d23393eee455f44c13ab00d062980937a5d040259d69c6b291c983bf635e1d405ff1dc2763e433d69b8f299b3f4da500663b813ce176a43e29ffcc31b0159'
         })
+
+
+@with_tree(tree={'long.txt': '123abz\n' * 1000000,
+                 'sub': {'sample.txt': '123', 'empty': ''}})
+def test_digester_modes(path=None):
+    long_md5 = '81b196e3d8a1db4dd2e89faa39614396'
+    long_sha256 = \
+        '80028815b3557e30d7cbef1d8dbc30af0ec0858eff34b960d2839fd88ad08871'
+    fpath = opj(path, 'long.txt')
+    digester = Digester(['md5', 'sha256'])
+    target = {'md5': long_md5, 'sha256': long_sha256}
+    # memory mapped, each digest in its own thread
+    with patch.object(Digester, 'PARALLEL_MIN_SIZE', 1 << 10):
+        assert_equal(digester._digest(fpath, parallel=True), target)
+        assert_equal(digester._digest(fpath, parallel=False), target)
+    # plain reads into a buffer, with a block size that does not divide
+    # the file size
+    assert_equal(Digester(['md5', 'sha256'], blocksize=1000)(fpath), target)
+    # mmap failure is not fatal
+    with patch.object(Digester, 'PARALLEL_MIN_SIZE', 1 << 10), \
+            patch('datalad.support.digests.mmap.mmap',
+                  side_effect=OSError('no mmap')):
+        assert_equal(digester(fpath), target)
+
+    md5 = Digester(['md5'])
+    expected = {
+        'long.txt': {'md5': long_md5},
+        opj('sub', 'sample.txt'): {'md5': '202cb962ac59075b964b07152d234b70'},
+        opj('sub', 'empty'): {'md5': 'd41d8cd98f00b204e9800998ecf8427e'},
+    }
+    assert_equal(md5.digest_dir(path), expected)
+    assert_equal(md5.digest_dir(path, jobs=1), expected)
+    files = [opj(path, 'sub', 'empty'), fpath]
+    assert_equal(
+        list(md5.digest_files(files, jobs=2)),
+        [(files[0], expected[opj('sub', 'empty')]),
+         (files[1], expected['long.txt'])])
+    assert_equal(list(md5.digest_files([])), [])
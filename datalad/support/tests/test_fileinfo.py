@@ -8,8 +8,11 @@
 """Test file info getters"""
 
 
+import os
 import os.path as op
+import time
 from pathlib import Path
+from unittest.mock import patch
 
 import datalad.utils as ut
 from datalad.distribution.dataset import Dataset
@@ -280,6 +283,62 @@ def test_annexinfo_init(path=None):
     assert_not_in("gitshasum", cinfo_init_none[foo])
 
 
+@with_tree(tree={
+    'a-b': 'a-b',
+    'a': {'c': 'a/c', 'c.d': 'a/c.d', 'ä': 'a/ä'},
+    'a.b': 'a.b',
+    'ingit': {'f': 'ingit/f'},
+    'z': 'z',
+})
+def test_iter_content_annexinfo(path=None):
+    ds = Dataset(path).create(force=True)
+    with (ds.pathobj / '.gitattributes').open('a') as f:
+        f.write('ingit/** annex.largefiles=nothing\n')
+    ds.save()
+    ds.create('sub')
+    ds.drop('z', reckless='kill')
+    (ds.pathobj / 'untracked').write_text('untracked')
+    repo = ds.repo
+
+    for kwargs in (
+            {},
+            {'ref': 'HEAD'},
+            {'paths': ['a', 'z', 'untracked']},
+            {'ref': 'HEAD', 'paths': ['a']},
+            {'untracked': 'no'}):
+        ginfo = repo.get_content_info(**kwargs)
+        streamed = list(repo.iter_content_annexinfo(
+            eval_availability=True, **kwargs))
+        # same order as the Git report
+        assert_equal([p for p, _ in streamed], list(ginfo))
+        # same content as with the non-streaming code path
+        kwargs.pop('untracked', None)
+        assert_equal(
+            dict(streamed),
+            dict(repo.get_content_annexinfo(
+                init=ginfo, eval_availability=True, **kwargs)))
+    # nothing but git-annex's report
+    assert_equal(
+        dict(repo.iter_content_annexinfo(init=None)),
+        {p: props
+         for p, props in repo.get_content_annexinfo(
+             init={p: {} for p in repo.get_content_info()}).items()
+         if props})
+    assert_equal(
+        [p for p, props in repo.iter_content_annexinfo(
+            init=None, eval_availability=True) if props['has_content']],
+        [ds.pathobj / 'a-b', ds.pathobj / 'a.b', ds.pathobj / 'a' / 'c',
+         ds.pathobj / 'a' / 'c.d', ds.pathobj / 'a' / 'ä'])
+    # records of a given report are amended in-place, and only those
+    # git-annex reported on are yielded
+    ginfo = repo.get_content_info()
+    streamed = dict(repo.iter_content_annexinfo(init=ginfo))
+    assert_equal(streamed, {p: props for p, props in ginfo.items()
+                            if 'key' in props})
+    assert_in(ds.pathobj / 'a-b', streamed)
+    assert_not_in(ds.pathobj / 'ingit' / 'f', streamed)
+
+
 @with_tempfile
 def test_info_path_inside_submodule(path=None):
     ds = Dataset(path).create()
@@ -300,6 +359,85 @@ def test_get_content_info_dotgit(path=None):
     assert_false(ds.repo.get_content_info(paths=[op.join(".git", "config")]))
 
 
+def _age_worktree(repo, age=60):
+    # make all stat records in the worktree old enough to be trusted by a
+    # worktree cache, the repository's own .git is left alone
+    mtime = time.time() - age
+    for root, dirs, files in os.walk(repo.path):
+        if root == repo.path:
+            dirs.remove('.git')
+        for p in [root] + [op.join(root, f) for f in files]:
+            # only touch recently modified items, utime() changes the ctime
+            if os.lstat(p).st_mtime > mtime:
+                os.utime(p, (mtime, mtime), follow_symlinks=False)
+
+
+@with_tree(tree={
+    'top.txt': 'top',
+    'ignored.dat': 'ignored',
+    'd1': {'tracked.txt': 'tracked', 'untracked.txt': 'untracked',
+           'd2': {'deep.txt': 'deep'}},
+})
+def test_get_content_info_worktree_cache(path=None):
+    repo = GitRepo(path, create=True)
+    repo.add(['top.txt', op.join('d1', 'tracked.txt')])
+    repo.commit(msg='some')
+
+    def check(paths=None):
+        # compare to uncached reports, return the one with all untracked
+        # files
+        for untracked in ('no', 'normal', 'all'):
+            with patch.dict(repo.config._merged_store,
+                            {'datalad.runtime.worktree-cache': 'false'}):
+                ref = repo.get_content_info(paths=paths, untracked=untracked)
+            # query twice, the second one can be answered from the cache
+            for i in range(2):
+                info = repo.get_content_info(paths=paths, untracked=untracked)
+                assert_equal(list(info.items()), list(ref.items()))
+        return ref
+
+    _age_worktree(repo)
+    os.utime(str(repo.dot_git / 'index'), (time.time() - 60,) * 2)
+    check()
+    # nothing changed, no need to call Git
+    with patch.object(repo, 'call_git', side_effect=AssertionError):
+        info = repo.get_content_info()
+        assert_in(repo.pathobj / 'd1' / 'd2' / 'deep.txt', info)
+        assert_equal(
+            list(repo.get_content_info(paths=['d1/d2'])),
+            [repo.pathobj / 'd1' / 'd2' / 'deep.txt'])
+
+    # changes anywhere in the worktree are picked up
+    (repo.pathobj / 'd1' / 'd2' / 'new.txt').write_text('new')
+    os.unlink(str(repo.pathobj / 'd1' / 'untracked.txt'))
+    check()
+    _age_worktree(repo)
+    check()
+    assert_in(repo.pathobj / 'ignored.dat', check(paths=['ignored.dat']))
+    # absolute paths work too
+    assert_in(repo.pathobj / 'top.txt',
+              check(paths=[str(repo.pathobj / 'top.txt')]))
+    (repo.pathobj / '.gitignore').write_text('*.dat\n')
+    _age_worktree(repo)
+    assert_not_in(repo.pathobj / 'ignored.dat', check())
+    # a directory turning into a nested repository
+    subrepo = GitRepo(repo.pathobj / 'd1' / 'd2', create=True)
+    _age_worktree(repo)
+    info = check()
+    assert_equal(info[repo.pathobj / 'd1' / 'd2']['type'], 'directory')
+    # changes to the index
+    subrepo.add('.')
+    subrepo.commit(msg='sub')
+    repo.add([op.join('d1', 'd2')])
+    _age_worktree(repo)
+    info = check()
+    assert_equal(info[repo.pathobj / 'd1' / 'd2']['type'], 'dataset')
+    repo.call_git(['rm', '--cached', '-q', 'top.txt'])
+    _age_worktree(repo)
+    info = check()
+    assert_equal(info[repo.pathobj / 'top.txt']['gitshasum'], None)
+
+
 @with_tempfile
 def test_get_content_info_paths_empty_list(path=None):
     ds = Dataset(path).create()
@@ -1289,6 +1289,35 @@ def test_get_hexsha_tag(path=None):
     eq_(gr.get_hexsha("atag"), gr.get_hexsha())
 
 
+@with_tempfile(mkdir=True)
+def test_format_commit_batched(path=None):
+    gr = GitRepo(path, create=True)
+    eq_(gr.format_commit("%H"), None)
+    eq_(gr.get_hexsha(), None)
+    assert_false(gr.commit_exists("HEAD"))
+    create_tree(gr.path, {'file': "content"})
+    gr.add('file')
+    gr.commit(msg="subject\n\nbody \u0394\r\nwith\rodd line\x0bendings")
+    gr.commit(msg="second", options=["--allow-empty"])
+    for commitish in (None, "HEAD~1", gr.get_hexsha("HEAD~1")):
+        for fmt in ("%B", "%H%x00%T%x00%P", "%an <%ae> %at%n%cn <%ce> %ct",
+                    "100%% %H"):
+            # identical to what git-log reports
+            eq_(gr.format_commit(fmt, commitish),
+                gr._git_runner.run(
+                    ['git', 'log', '-1', '-z', '--format=' + fmt,
+                     (commitish or 'HEAD') + '^{commit}', '--'],
+                    protocol=StdOutCapture)['stdout'].rsplit("\0", 1)[0])
+    # unsupported placeholders are handled by git itself
+    eq_(gr.format_commit("%s", "HEAD~1"), "subject")
+    assert_raises(ValueError, gr.format_commit, "%B", "nothere")
+    assert_raises(ValueError, gr.get_hexsha, "nothere")
+    ok_(gr.commit_exists("HEAD~1"))
+    assert_false(gr.commit_exists("HEAD~2"))
+    # a blob is not a commit
+    assert_false(gr.commit_exists("HEAD:file"))
+
+
 @with_tempfile(mkdir=True)
 def test_get_tags(path=None):
     from unittest.mock import patch
@@ -11,19 +11,25 @@ import logging
 import os.path as op
 
 from datalad.support.json_py import (
+    BlockStreamReader,
     JSONDecodeError,
     dump,
+    dump2blockstream,
     dump2stream,
     dump2xzstream,
+    is_blockstream,
     load,
     load_stream,
     load_xzstream,
     loads,
 )
 from datalad.tests.utils_pytest import (
+    assert_false,
+    assert_greater,
     assert_in,
     assert_raises,
     eq_,
+    ok_,
     swallow_logs,
     with_tempfile,
 )
@@ -89,3 +95,29 @@ def test_dump2stream(path=None):
     # the same for compression
     dump2xzstream([dict(a=5), dict(b=4)], path)
     eq_(list(load_xzstream(path)), stream)
+
+
+@with_tempfile
+def test_dump2blockstream(path=None):
+    stream = [dict(path='f{:03d}'.format(i), v=[i] * 10) for i in range(300)]
+    # small blocks to get many of them
+    dump2blockstream(stream, path, blocksize=200)
+    ok_(is_blockstream(path))
+    with BlockStreamReader(path) as reader:
+        assert_greater(len(reader._blocks), 10)
+        eq_(list(reader.iter_range()), stream)
+        eq_(reader.get('f123'), stream[123])
+        eq_(reader.get('f1234'), None)
+        eq_(list(reader.iter_range('f010', 'f020')), stream[10:20])
+        eq_(list(reader.iter_range('f2999')), stream[300:])
+        eq_(list(reader.iter_range(stop='f000')), [])
+    # objects must be sorted to be found
+    assert_raises(ValueError, dump2blockstream, stream[::-1], path)
+
+    dump2blockstream([], path)
+    with BlockStreamReader(path) as reader:
+        eq_(list(reader.iter_range()), [])
+
+    dump2xzstream(stream, path)
+    assert_false(is_blockstream(path))
+    assert_raises(ValueError, BlockStreamReader, path)
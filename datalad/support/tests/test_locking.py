@@ -36,6 +36,8 @@ from ...cmd import (
 from ...utils import ensure_unicode
 from ..locking import (
     lock_if_check_fails,
+    lock_shared,
+    try_lock_exclusive,
     try_lock_informatively,
 )
 
@@ -183,3 +185,29 @@ with try_lock_informatively(lock, timeouts=[0.05, 0.15], proceed_unlocked={{proc
     assert_in('Lock acquired=True', res['stdout'])
     assert_not_in(f'Failed to acquire lock', res['stderr'])
     assert_not_in('PID', res['stderr'])
+
+
+@with_tempfile
+def test_lock_shared(tempfile=None):
+    lock_path = tempfile + '.lck'
+    runner = WitlessRunner()
+    script = f"""
+from datalad.support.locking import lock_shared, try_lock_exclusive
+
+with try_lock_exclusive({lock_path!r}) as acquired:
+    print("Exclusive acquired=%s" % acquired)
+with lock_shared({lock_path!r}):
+    print("Shared acquired")
+"""
+    with lock_shared(lock_path):
+        # shared holders do not block each other, but exclusive ones
+        res = runner.run([sys.executable, '-c', script],
+                         protocol=StdOutErrCapture)
+        assert_in('Exclusive acquired=False', res['stdout'])
+        assert_in('Shared acquired', res['stdout'])
+
+    res = runner.run([sys.executable, '-c', script],
+                     protocol=StdOutErrCapture)
+    assert_in('Exclusive acquired=True', res['stdout'])
+    with try_lock_exclusive(lock_path) as acquired:
+        assert_true(acquired)
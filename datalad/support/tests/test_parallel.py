@@ -9,6 +9,7 @@
 
 import logging
 from functools import partial
+from threading import Thread
 from time import (
     sleep,
     time,
@@ -23,12 +24,15 @@ from datalad.support.exceptions import IncompleteResultsError
 from datalad.support.parallel import (
     ProducerConsumer,
     ProducerConsumerProgressLog,
+    TreeQueryPrefetcher,
     no_parentds_in_futures,
 )
 from datalad.tests.utils_pytest import (
     assert_equal,
+    assert_false,
     assert_greater,
     assert_greater_equal,
+    assert_is_instance,
     assert_raises,
     assert_repo_status,
     known_failure_osx,
@@ -107,6 +111,78 @@ def test_ProducerConsumer():
         check_producer_future_key(jobs)
 
 
+def test_TreeQueryPrefetcher():
+    # a tree of depth 3, with 3 children per node: node -> children
+    tree = {}
+    todo = ['']
+    while todo:
+        node = todo.pop()
+        tree[node] = [node + c for c in 'abc'] if len(node) < 3 else []
+        todo.extend(tree[node])
+
+    queried = []
+
+    def query(node):
+        queried.append(node)
+        # later siblings finish first
+        sleep(0.001 * ('c' in node))
+        return node.upper(), tree[node]
+
+    def walk(fetch, node):
+        res, children = fetch(node)
+        yield res
+        for c in reversed(children):
+            yield from walk(fetch, c)
+
+    target = list(walk(query, ''))
+    assert_equal(len(target), 40)
+    for jobs in None, 0, 1, 5:
+        queried = []
+        fetch = TreeQueryPrefetcher(query, jobs=jobs)
+        assert_equal(list(walk(fetch, '')), target)
+        # each node is queried once
+        assert_equal(sorted(queried), sorted(tree))
+        fetch.close()
+
+    # unknown nodes are refused
+    fetch = TreeQueryPrefetcher(query, jobs=2)
+    fetch('')
+    assert_raises(ValueError, fetch, 'z')
+    fetch.close()
+
+    # exceptions are propagated
+    def failing_query(node):
+        if node == 'b':
+            raise RuntimeError('b')
+        return query(node)
+
+    fetch = TreeQueryPrefetcher(failing_query, jobs=2)
+    with assert_raises(RuntimeError):
+        list(walk(fetch, ''))
+    fetch.close()
+
+    # queries do not run ahead of the consumption by more than the window
+    consumed = []
+    ahead = []
+
+    def counting_query(node):
+        ahead.append(len(queried) - len(consumed))
+        return query(node)
+
+    def slow_fetch(node):
+        res = fetch(node)
+        consumed.append(node)
+        sleep(0.001)
+        return res
+
+    queried = []
+    fetch = TreeQueryPrefetcher(counting_query, jobs=5, window=3)
+    assert_equal(list(walk(slow_fetch, '')), target)
+    # the window, plus the node that is requested
+    assert_greater_equal(4, max(ahead))
+    fetch.close()
+
+
 @slow  # 12sec on Yarik's laptop
 @with_tempfile(mkdir=True)
 def test_creatsubdatasets(topds_path=None, n=2):
@@ -228,6 +304,37 @@ def test_gracefull_death():
         assert_greater_equal(20, len(consumed))
 
 
+def test_producing_consumer_failure():
+    # consumers which are still running when another one fails might keep
+    # adding to the producer queue, which must not keep us spinning
+    def consumer(i):
+        if i == 0:
+            # let the other one start
+            sleep(0.1)
+            raise ValueError()
+        sleep(0.5)
+        pc.add_to_producer_queue(i + 10)
+        return i
+
+    pc = ProducerConsumer([0, 1], consumer, jobs=2)
+    results = []
+
+    def consume():
+        try:
+            for r in pc:
+                results.append(r)
+        except ValueError as exc:
+            results.append(exc)
+
+    # consume in a thread to not hang the test run if we do spin
+    thread = Thread(target=consume, daemon=True)
+    thread.start()
+    thread.join(10)
+    assert_false(thread.is_alive())
+    assert_equal(results[0], 1)
+    assert_is_instance(results[1], ValueError)
+
+
 # it will stall! https://github.com/datalad/datalad/pull/5022#issuecomment-708716290
 def test_stalling(kill=False):
     import concurrent.futures
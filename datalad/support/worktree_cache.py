@@ -0,0 +1,370 @@
+# emacs: -*- mode: python; py-indent-offset: 4; tab-width: 4; indent-tabs-mode: nil -*-
+# ex: set sts=4 ts=4 sw=4 et:
+# ## ### ### ### ### ### ### ### ### ### ### ### ### ### ### ### ### ### ### ##
+#
+#   See COPYING file distributed along with the datalad package for the
+#   copyright and license terms.
+#
+# ## ### ### ### ### ### ### ### ### ### ### ### ### ### ### ### ### ### ### ##
+"""Stat-validated cache of worktree content reports of a Git repository
+
+`GitRepo.get_content_info()` for the worktree is based on `git ls-files`.
+Its output only depends on the content of the Git index (tracked content),
+and on the content of the worktree directories and the ignore rules
+(untracked content). This module implements a cache that is validated by
+the stat info of the index file, the worktree directories and the files
+with ignore rules, such that unchanged parts of a repository need not be
+listed and parsed again.
+"""
+
+import logging
+import os
+import os.path as op
+import threading
+import time
+from collections import (
+    OrderedDict,
+    namedtuple,
+)
+
+lgr = logging.getLogger('datalad.support.worktree_cache')
+
+# Stat records with a modification time less than this many seconds in the
+# past are not trusted. Within this window the same modification time
+# could be observed for content before and after a change (coarse timestamp
+# resolution of some file systems).
+RACY_SECONDS = 2.0
+
+# characters with special meaning in a pathspec
+_GLOB_CHARS = frozenset('*?[]\\')
+
+# state of a single worktree directory
+#   sig: stat signature, or None if it must not be trusted
+#   subdirs: names of the subdirectories to descend into
+#   ignore_sig: stat signature of a .gitignore file in this directory, if any
+_DirState = namedtuple('_DirState', 'sig subdirs ignore_sig')
+
+
+def _stat_sig(path):
+    """Return a signature of a file's stat info, or None if it is missing"""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_ino, st.st_size, st.st_mtime_ns, st.st_ctime_ns
+
+
+def _parent_dir(relpath):
+    """Return the POSIX parent directory of a relative path, '' for the root
+    """
+    return relpath.rpartition('/')[0]
+
+
+def _glob_escape(path):
+    return ''.join('\\' + c if c in _GLOB_CHARS else c for c in path)
+
+
+class WorktreeContentInfoCache(object):
+    """Cache for the worktree content reports of a single repository
+
+    Tracked content is cached for as long as the stat signature of the Git
+    index file remains unchanged. Untracked content is cached per worktree
+    directory (`untracked='all'`), or for the entire worktree
+    (`untracked='normal'`). A directory's report is considered up-to-date
+    for as long as the directory's stat signature, the Git index, and all
+    files with ignore rules remain unchanged. Modification times of
+    directories change whenever entries are added, removed, or renamed,
+    hence a change anywhere in the tree only invalidates the report of the
+    directories affected.
+
+    A cache instance does not call Git itself. Instead, a callable must be
+    provided that runs `git ls-files` with the given arguments and returns
+    its parsed report (see `get()`).
+    """
+    def __init__(self, pathobj, dot_git):
+        self.pathobj = pathobj
+        self._root = op.abspath(str(pathobj))
+        self._dot_git = str(dot_git)
+        self._index_path = op.join(self._dot_git, 'index')
+        self._lock = threading.Lock()
+        # (index signature, OrderedDict(path -> props)) of tracked content
+        self._tracked = None
+        # per untracked-mode state of the worktree directories and reports
+        self._untracked = {}
+
+    def clear(self):
+        """Discard all cached information"""
+        with self._lock:
+            self._tracked = None
+            self._untracked = {}
+
+    @staticmethod
+    def supports(untracked, paths):
+        """Whether a query can be answered from a cache at all
+
+        Parameters
+        ----------
+        untracked : {'no', 'normal', 'all'}
+        paths : list(str) or None
+          POSIX paths relative to the repository root.
+        """
+        if 'GIT_INDEX_FILE' in os.environ:
+            # we would be watching the wrong file
+            return False
+        if not paths:
+            return True
+        if untracked == 'normal':
+            # reports on untracked directories depend on the query paths
+            return False
+        # only literal, relative paths can be matched against a full report
+        # without reimplementing Git's pathspec logic
+        return not any(
+            _GLOB_CHARS.intersection(p) or op.isabs(p) or p.startswith('..')
+            for p in paths)
+
+    def is_warm(self, untracked):
+        """Whether there is a report for the given untracked-mode already"""
+        return self._tracked is not None and (
+            untracked == 'no' or untracked in self._untracked)
+
+    def get(self, untracked, paths, ls_files, ignore_files=None,
+            container=OrderedDict):
+        """Report worktree content, listing only what has changed
+
+        Parameters
+        ----------
+        untracked : {'no', 'normal', 'all'}
+          See `GitRepo.get_content_info()`.
+        paths : list(str) or None
+          POSIX paths relative to the repository root to limit the report
+          to. Must only be given if `supports()` is True.
+        ls_files : callable
+          Called with a list of arguments for `git ls-files -z` and a list of
+          pathspecs (or None). It must return an OrderedDict with absolute
+          path objects as keys, and content property dicts as values, as
+          reported by `GitRepo.get_content_info()`.
+        ignore_files : list(str), optional
+          Additional files with ignore rules, beyond those in the worktree
+          (e.g. the file configured via `core.excludesFile`).
+        container : callable, optional
+          Called to create the (empty) mapping that is returned.
+
+        Returns
+        -------
+        OrderedDict or `container`
+          Untracked content is reported first, in the same order as
+          `git ls-files` would report it. Each property dict is a
+          copy, that may be modified by a caller.
+        """
+        with self._lock:
+            racy_limit = time.time() - RACY_SECONDS
+            tracked = self._get_tracked(ls_files, racy_limit)
+            if untracked == 'no':
+                untracked_info = {}
+            elif untracked in ('normal', 'all'):
+                untracked_info = self._get_untracked(
+                    untracked, ls_files, ignore_files, racy_limit, tracked)
+            else:
+                raise ValueError(
+                    'unknown value for `untracked`: {}'.format(untracked))
+            return self._assemble(untracked_info, tracked, paths, container)
+
+    def _get_tracked(self, ls_files, racy_limit):
+        """Return the report on tracked content"""
+        index_sig = _stat_sig(self._index_path)
+        if self._tracked is not None and index_sig is not None \
+                and self._tracked[0] == index_sig:
+            return self._tracked[1]
+        lgr.debug('Refresh tracked content report of %s', self._root)
+        tracked = ls_files(['--stage'], None)
+        # do not trust an index that was modified a moment ago, we might
+        # have read an earlier state with the same signature
+        if index_sig is not None and index_sig[2] >= racy_limit * 1e9:
+            index_sig = None
+        self._tracked = (index_sig, tracked)
+        return tracked
+
+    def _get_untracked(self, untracked, ls_files, ignore_files, racy_limit,
+                       tracked):
+        states, changed = self._scan_dirs(
+            self._untracked.get(untracked, {}).get('states', {}),
+            racy_limit)
+        rules = dict(
+            (rpath, s.ignore_sig) for rpath, s in states.items()
+            if s.ignore_sig is not None)
+        for fpath in [op.join(self._dot_git, 'info', 'exclude'),
+                      op.join(self._dot_git, 'config')] \
+                + list(ignore_files or []):
+            rules[fpath] = _stat_sig(fpath)
+
+        untracked_args = ['--exclude-standard', '-o']
+        if untracked == 'normal':
+            untracked_args += ['--directory', '--no-empty-directory']
+
+        cached = self._untracked.get(untracked)
+        # the report on tracked content this report was based on
+        prev_tracked = None
+        if cached is not None and cached['tracked'] is not tracked:
+            prev_tracked = cached['tracked']
+        if cached is None or cached['rules'] != rules or (
+                untracked == 'normal' and (changed or prev_tracked is not None)):
+            lgr.debug('Refresh untracked content report of %s', self._root)
+            report = [
+                (p, props) for p, props in
+                ls_files(untracked_args, None).items()
+                if props['gitshasum'] is None
+            ]
+            if untracked == 'all':
+                report = self._group_by_dir(report)
+            self._untracked[untracked] = dict(
+                states=states, rules=rules, tracked=tracked, report=report)
+            return report
+
+        report = cached['report']
+        cached['states'] = states
+        cached['tracked'] = tracked
+        if untracked == 'normal':
+            # nothing has changed
+            return report
+
+        # figure out which directories need a fresh report
+        dirty = set(changed)
+        # a directory turning into a nested repository (or back) changes how
+        # it is reported in the context of its parent directory
+        dirty.update(_parent_dir(r) for r in changed if r)
+        if prev_tracked is not None:
+            # tracked-status changes affect the report on untracked content
+            for p in prev_tracked.keys() ^ tracked.keys():
+                dirty.add(_parent_dir(self._relpath(p)))
+        # discard reports on vanished directories
+        for rpath in [r for r in report if r not in states]:
+            del report[rpath]
+        dirty.intersection_update(states)
+        if not dirty:
+            return report
+        lgr.debug('Refresh untracked content report of %i directories in %s',
+                  len(dirty), self._root)
+        for rpath in dirty:
+            report.pop(rpath, None)
+        # the immediate content of each directory, '*/' is needed to match
+        # nested repositories, which are reported as directories
+        pathspecs = []
+        for rpath in sorted(dirty):
+            prefix = _glob_escape(rpath + '/' if rpath else rpath)
+            pathspecs.extend(
+                ':(glob){}{}'.format(prefix, g) for g in ('*', '*/'))
+        fresh = self._group_by_dir(
+            (p, props) for p, props in ls_files(
+                untracked_args, pathspecs).items()
+            if props['gitshasum'] is None)
+        for rpath, items in fresh.items():
+            if rpath in dirty:
+                report[rpath] = items
+        return report
+
+    def _scan_dirs(self, prev_states, racy_limit):
+        """Walk the worktree directories and compare them to a previous state
+
+        Directories with an unchanged stat signature are not listed again,
+        their set of subdirectories cannot have changed either.
+
+        Returns
+        -------
+        dict, set
+          Mapping of relative POSIX directory paths to their state, and the
+          set of directory paths that have changed.
+        """
+        states = {}
+        changed = set()
+        racy_limit_ns = racy_limit * 1e9
+        todo = ['']
+        while todo:
+            rpath = todo.pop()
+            apath = op.join(self._root, rpath) if rpath else self._root
+            try:
+                st = os.stat(apath)
+            except OSError:
+                continue
+            sig = (st.st_ino, st.st_mtime_ns, st.st_ctime_ns)
+            if sig[1] >= racy_limit_ns:
+                # we cannot be sure to notice further modifications in this
+                # very moment
+                sig = None
+            prev = prev_states.get(rpath)
+            if prev is not None and sig is not None and prev.sig == sig:
+                subdirs = prev.subdirs
+                has_ignore = prev.ignore_sig is not None
+            else:
+                changed.add(rpath)
+                subdirs, has_ignore = self._list_dir(rpath, apath)
+            states[rpath] = _DirState(
+                sig,
+                subdirs,
+                _stat_sig(op.join(apath, '.gitignore')) if has_ignore else None,
+            )
+            todo.extend(
+                '{}/{}'.format(rpath, s) if rpath else s for s in subdirs)
+        return states, changed
+
+    @staticmethod
+    def _list_dir(rpath, apath):
+        subdirs = []
+        has_ignore = False
+        try:
+            with os.scandir(apath) as entries:
+                for e in entries:
+                    if e.name == '.git':
+                        if rpath:
+                            # a nested repository, Git does not descend
+                            # into it
+                            return (), has_ignore
+                        continue
+                    if e.name == '.gitignore':
+                        has_ignore = True
+                    if e.is_dir(follow_symlinks=False):
+                        subdirs.append(e.name)
+        except OSError:
+            pass
+        return tuple(subdirs), has_ignore
+
+    def _relpath(self, path):
+        return path.relative_to(self.pathobj).as_posix()
+
+    def _group_by_dir(self, items):
+        report = {}
+        for p, props in items:
+            report.setdefault(
+                _parent_dir(self._relpath(p)), []).append((p, props))
+        return report
+
+    def _assemble(self, untracked_info, tracked, paths, container):
+        if isinstance(untracked_info, dict):
+            # per-directory report
+            # Git sorts by path name
+            untracked_items = sorted(
+                (i for items in untracked_info.values() for i in items),
+                key=lambda i: self._relpath(i[0]))
+        else:
+            untracked_items = untracked_info
+        info = container()
+        if paths and '.' not in paths:
+            match = _PathMatcher(paths)
+            for items in (untracked_items, tracked.items()):
+                for p, props in items:
+                    if match(self._relpath(p)):
+                        info[p] = props.copy()
+        else:
+            for items in (untracked_items, tracked.items()):
+                for p, props in items:
+                    info[p] = props.copy()
+        return info
+
+
+class _PathMatcher(object):
+    """Match relative POSIX paths against literal (non-glob) pathspecs"""
+    def __init__(self, paths):
+        self._paths = set(paths)
+        self._prefixes = tuple(p + '/' for p in paths)
+
+    def __call__(self, relpath):
+        return relpath in self._paths or relpath.startswith(self._prefixes)
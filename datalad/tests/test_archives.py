@@ -9,6 +9,11 @@
 
 import itertools
 import os
+import subprocess
+import sys
+import tarfile
+import time
+import zipfile
 from unittest.mock import patch
 
 import pytest
@@ -19,6 +24,7 @@ from datalad.support.archive_utils_patool import unixify_path
 from datalad.support.archives import (
     ArchivesCache,
     ExtractedArchive,
+    _evict_extracted,
     compress_files,
     decompress_file,
 )
@@ -39,6 +45,7 @@ from datalad.tests.utils_pytest import (
     with_tempfile,
     with_tree,
 )
+from datalad.utils import rmtree as rmtree_
 
 fn_in_archive_obscure = OBSCURE_FILENAME
 fn_archive_obscure = fn_in_archive_obscure.replace('a', 'b')
@@ -223,6 +230,69 @@ def test_ExtractedArchive(path=None):
         assert_false(op.exists(earchive.path))
 
 
+@with_tree(tree={'d': {'f1': 'content1', 'f2': 'content2' * 1000}})
+@with_tempfile(mkdir=True)
+def check_ExtractedArchive_extract_file(ext, path=None, outpath=None):
+    archive = op.join(outpath, 'archive' + ext)
+    if ext == '.zip':
+        with zipfile.ZipFile(archive, 'w') as zf:
+            for f in ('f1', 'f2'):
+                zf.write(op.join(path, 'd', f), 'd/' + f)
+    else:
+        mode = 'w:gz' if ext == '.tar.gz' else 'w'
+        with tarfile.open(archive, mode) as tf:
+            tf.add(op.join(path, 'd'), './d')
+            # hard link to the same content, and a symlink
+            ti = tf.gettarinfo(op.join(path, 'd', 'f1'), './d/hl')
+            ti.type, ti.linkname, ti.size = tarfile.LNKTYPE, './d/f1', 0
+            tf.addfile(ti)
+            ti = tf.gettarinfo(op.join(path, 'd', 'f1'), 'd/sl')
+            ti.type, ti.linkname, ti.size = tarfile.SYMTYPE, 'f1', 0
+            tf.addfile(ti)
+
+    earchive = ExtractedArchive(archive)
+    dest = op.join(outpath, 'dest')
+    assert_true(earchive.extract_file(op.join('d', 'f2'), dest))
+    ok_file_has_content(dest, 'content2' * 1000)
+    if ext == '.tar.gz':
+        # only a single file is read directly from a compressed tarball
+        assert_false(earchive.extract_file(op.join('d', 'f1'), dest))
+        ok_file_has_content(dest, 'content2' * 1000)
+        earchive = ExtractedArchive(archive)
+        # links need the extracted archive
+        assert_false(earchive.extract_file(op.join('d', 'hl'), dest))
+        earchive = ExtractedArchive(archive)
+        assert_false(earchive.extract_file('missing', dest))
+        earchive = ExtractedArchive(archive)
+    assert_true(earchive.extract_file(op.join('d', 'f1'), dest))
+    ok_file_has_content(dest, 'content1')
+    if ext == '.tar':
+        assert_true(earchive.extract_file(op.join('d', 'hl'), dest))
+        ok_file_has_content(dest, 'content1')
+        # symlinks need an extracted archive
+        assert_false(earchive.extract_file(op.join('d', 'sl'), dest))
+    assert_false(earchive.extract_file('missing', dest))
+    # nothing was extracted
+    assert_false(op.exists(earchive.path))
+    assert_true(op.exists(earchive.index_path))
+
+    # the stored index is used without scanning the archive again
+    with patch('datalad.support.archives._index_archive') as index_archive:
+        earchive2 = ExtractedArchive(archive, path=earchive.path,
+                                     persistent=True)
+        assert_true(earchive2.extract_file(op.join('d', 'f1'), dest))
+        ok_file_has_content(dest, 'content1')
+        assert_false(index_archive.called)
+
+    earchive.clean()
+    assert_false(op.exists(earchive.index_path))
+
+
+@pytest.mark.parametrize("ext", ['.tar', '.tar.gz', '.zip'])
+def test_ExtractedArchive_extract_file(ext):
+    check_ExtractedArchive_extract_file(ext)
+
+
 def test_ArchivesCache():
     # we don't actually need to test archives handling itself
     path1 = "/zuba/duba"
@@ -248,6 +318,94 @@ def test_ArchivesCache():
     assert_false(op.exists(cache_path))
 
 
+@with_tempfile(mkdir=True)
+def test_ArchivesCache_evict(path=None):
+    def decompress(archive, dir_, leading_directories=None):
+        with open(op.join(dir_, 'file'), 'w') as f:
+            f.write('x' * 100)
+
+    cache = ArchivesCache(path, persistent=True)
+    archives = [op.join(path, 'a%d.tar' % i) for i in range(3)]
+    with patch('datalad.support.archives.decompress_file', decompress), \
+            patch('datalad.support.archives.time') as time_:
+        # make sure the order of accesses is recorded reliably, past the
+        # modification of the stamps
+        time_.time_ns.side_effect = itertools.count(
+            os.stat(path).st_mtime_ns + 10 ** 9, 10 ** 9)
+        for archive in archives + archives[:1]:
+            cache[archive].get_extracted_file('file')
+    eq_(cache.get_stats(),
+        dict(path=cache.path, archives=3, size=300, max_size=None))
+    # no budget
+    eq_(cache.evict(), [])
+
+    # the least recently used archive is in use and must be kept
+    with open(cache[archives[2]].index_path, 'w'):
+        pass
+    with cache[archives[1]].use():
+        eq_(cache.evict(150), [cache[archives[2]].path])
+    assert_false(cache[archives[2]].is_extracted)
+    # nothing but the lock file is left behind of an evicted archive
+    eq_([p for p in os.listdir(cache.path)
+         if p.startswith(op.basename(cache[archives[2]].path))],
+        [op.basename(cache[archives[2]].use_lock_path)])
+    eq_(cache.get_stats()['archives'], 2)
+    cache.max_size = 150
+    eq_(cache.evict(), [cache[archives[1]].path])
+    # the most recently used one is kept even if it exceeds the budget
+    eq_(cache.evict(0), [])
+    assert_true(cache[archives[0]].is_extracted)
+    eq_(cache.get_stats(),
+        dict(path=cache.path, archives=1, size=100, max_size=150))
+    cache.clean(force=True)
+
+
+@with_tempfile(mkdir=True)
+def test_ArchivesCache_evict_while_waiting_for_use(path=None):
+    def decompress(archive, dir_, leading_directories=None):
+        with open(op.join(dir_, 'file'), 'w') as f:
+            f.write('x' * 100)
+
+    cache = ArchivesCache(path, persistent=True)
+    earchive = cache[op.join(path, 'a.tar')]
+    # another process requests to use the archive while it is being evicted
+    # and blocks until the eviction is done
+    user = subprocess.Popen(
+        [sys.executable, '-c',
+         'import sys\n'
+         'from datalad.support.locking import lock_shared\n'
+         'print("waiting", flush=True)\n'
+         'with lock_shared(sys.argv[1]):\n'
+         '    print("locked", flush=True)\n'
+         '    sys.stdin.read()\n',
+         earchive.use_lock_path],
+        stdin=subprocess.PIPE, stdout=subprocess.PIPE, text=True)
+    try:
+        def rmtree(path, *args, **kwargs):
+            eq_(user.stdout.readline(), 'waiting\n')
+            # give it time to block in lock_shared()
+            time.sleep(1)
+            rmtree_(path, *args, **kwargs)
+
+        with patch('datalad.support.archives.decompress_file', decompress):
+            earchive.get_extracted_file('file')
+            with patch('datalad.support.archives.rmtree', rmtree):
+                assert_true(_evict_extracted(earchive.path))
+            # the archive is extracted anew for the waiting process
+            earchive.get_extracted_file('file')
+        eq_(user.stdout.readline(), 'locked\n')
+        # which now protects it from eviction
+        assert_false(_evict_extracted(earchive.path))
+        assert_true(earchive.is_extracted)
+    finally:
+        user.stdin.close()
+        user.wait()
+        user.stdout.close()
+    # once no longer in use, it can go
+    assert_true(_evict_extracted(earchive.path))
+    cache.clean(force=True)
+
+
 @pytest.mark.parametrize(
     "return_value,target_value,kwargs",
     [
@@ -16,9 +16,12 @@ from datalad.cmd import (
     BatchedCommand,
     readline_rstripped,
 )
+from datalad.support.exceptions import CommandError
 from datalad.runner.tests.utils import py2cmd
 from datalad.tests.utils_pytest import (
     assert_equal,
+    assert_false,
+    assert_is_instance,
     assert_is_none,
     assert_is_not_none,
     assert_not_equal,
@@ -112,6 +115,24 @@ def test_batched_close_ok():
     assert_equal(bc.return_code, 3)
 
 
+def test_batched_close_terminate():
+    # a process that would never exit after its stdin was closed is
+    # terminated right away, also when closed as an inactive instance
+    bc = BatchedCommand(
+        cmd=[sys.executable, "-i", "-u", "-q", "-"],
+        terminate_on_close=True)
+    response = bc("import time; print('a')")
+    assert_equal(response, "a")
+    bc.stdin_queue.put("time.sleep(60)\n".encode())
+    process = bc.generator.runner.process
+    bc._active_last = bc._active_last.replace(year=2000)
+    with unittest.mock.patch("datalad.cfg") as cfg_mock:
+        cfg_mock.configure_mock(**{"obtain.return_value": 0})
+        BatchedCommand.clean_inactive()
+    assert_is_none(bc.runner)
+    assert_not_equal(process.wait(timeout=10), 0)
+
+
 def test_tuple_requests():
     bc = BatchedCommand(
         cmd=py2cmd(
@@ -147,6 +168,75 @@ def test_batched_restart():
     bc.close(return_stderr=False)
 
 
+def test_batched_process_requests():
+    bc = BatchedCommand(
+        cmd=py2cmd(
+            "import sys\n"
+            "for line in sys.stdin:\n"
+            "    print(line.strip().upper(), flush=True)\n"))
+    requests = [f"line-{i}" for i in range(20)]
+    for window in (1, 3, 100):
+        assert_equal(
+            list(bc.process_requests(iter(requests), window=window)),
+            [r.upper() for r in requests])
+    # responses are produced lazily, and the process is kept around
+    responses = bc.process_requests(requests)
+    assert_equal(next(responses), "LINE-0")
+    responses.close()
+    assert_equal(bc("after"), "AFTER")
+    assert_equal(list(bc.process_requests([])), [])
+    bc.close(return_stderr=False)
+
+    # a process that exits with pending requests is reported
+    bc = BatchedCommand(
+        cmd=py2cmd(
+            "import sys\n"
+            "print(sys.stdin.readline().strip(), flush=True)\n"))
+    responses = bc.process_requests(["one", "two", "three"])
+    assert_equal(next(responses), "one")
+    with assert_raises(CommandError):
+        next(responses)
+    # and a subsequent request starts a new process
+    assert_equal(list(bc.process_requests(["four"])), ["four"])
+    bc.close(return_stderr=False)
+
+
+def test_batched_submit():
+    bc = BatchedCommand(
+        cmd=py2cmd(
+            "import sys\n"
+            "for line in sys.stdin:\n"
+            "    print(line.strip().upper(), flush=True)\n"))
+    futures = [bc.submit(f"line-{i}", window=3) for i in range(5)]
+    # the window was exceeded, hence the first responses were received
+    assert_equal([f.done() for f in futures],
+                 [True, True, False, False, False])
+    assert_equal(futures[3].result(), "LINE-3")
+    assert_true(futures[2].done())
+    assert_false(futures[4].done())
+    # synchronous calls receive the pending responses first
+    assert_equal(bc("after"), "AFTER")
+    assert_true(futures[4].done())
+    assert_equal([f.result() for f in futures],
+                 [f"LINE-{i}" for i in range(5)])
+    # so does closing
+    future = bc.submit("last")
+    bc.close(return_stderr=False)
+    assert_equal(future.result(), "LAST")
+
+    # a process that exits fails all pending requests
+    bc = BatchedCommand(
+        cmd=py2cmd(
+            "import sys\n"
+            "print(sys.stdin.readline().strip(), flush=True)\n"))
+    futures = [bc.submit(r) for r in ("one", "two", "three")]
+    assert_equal(futures[0].result(), "one")
+    assert_is_instance(futures[2].exception(), CommandError)
+    assert_raises(CommandError, futures[1].result)
+    assert_equal(bc.submit("four").result(), "four")
+    bc.close(return_stderr=False)
+
+
 def test_command_fail_1():
     # Expect that the return code of a failing command is caught,
     # that None is returned as result.
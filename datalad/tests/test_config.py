@@ -25,10 +25,15 @@ from datalad.config import (
     ConfigManager,
     _where_to_scope,
     parse_gitconfig_dump,
+    read_gitconfig,
     rewrite_url,
     write_config_section,
 )
 from datalad.distribution.dataset import Dataset
+from datalad.runner import (
+    GitRunner,
+    StdOutErrCapture,
+)
 from datalad.support.annexrepo import AnnexRepo
 from datalad.support.gitrepo import GitRepo
 from datalad.tests.utils_pytest import (
@@ -757,6 +762,141 @@ def test_external_modification(path=None):
     assert_equal(config[key], '11')
 
 
+@with_tempfile()
+@with_tempfile()
+def test_shared_snapshot(path=None, gitconfig=None):
+    Path(gitconfig).write_text(
+        '[sec]\n\tmulti = global\n\tglobalonly = 1\n')
+    with patch.dict(
+            'os.environ',
+            {'GIT_CONFIG_GLOBAL': gitconfig,
+             'GIT_CONFIG_PARAMETERS': "'sec.multi=cmdline'"}):
+        repo = GitRepo(path, create=True)
+        repo.config.add('sec.multi', 'local', scope='local')
+        cfg = ConfigManager(repo)
+        # git's order of precedence is kept
+        assert_equal(cfg.get('sec.multi', get_all=True),
+                     ('global', 'local', 'cmdline'))
+        assert_equal(cfg['sec.globalonly'], '1')
+        assert_in(Path(gitconfig), cfg._stores['git']['files'])
+        assert_in(repo.dot_git / 'config', cfg._stores['git']['files'])
+        assert_equal(cfg.get_from_source('local', 'sec.globalonly'), '1')
+        # no repository configuration without a repository
+        cfg = ConfigManager()
+        assert_equal(cfg.get('sec.multi', get_all=True),
+                     ('global', 'cmdline'))
+        # a global config snapshot is shared across instances, but
+        # modifications are picked up
+        with patch('datalad.config.ConfigManager._read_shared_snapshot',
+                   side_effect=AssertionError('re-read')):
+            cfg = ConfigManager(repo)
+        cfg.set('sec.globalonly', '2', scope='global')
+        assert_equal(cfg['sec.globalonly'], '2')
+        assert_equal(ConfigManager(repo)['sec.globalonly'], '2')
+        # conditional includes depend on the repository, and are not shared
+        with open(gitconfig, 'a') as f:
+            f.write('[includeIf "gitdir:{}/"]\n\tpath = {}\n'.format(
+                path, repo.dot_git / 'extra'))
+        (repo.dot_git / 'extra').write_text('[sec]\n\tconditional = 1\n')
+        assert_equal(ConfigManager(repo)['sec.conditional'], '1')
+
+
+_gitconfig_syntax = r"""# comment
+; another comment
+[core]
+	Editor = vim  # trailing comment
+	spaced =   a 	 b	  
+	empty =
+	novalue
+[Section "Sub \"quoted\" \\ x"]
+	key = "quoted ; # value"  with "inner  spaces"
+	esc = tab\there\nnewline \"q\" back\\slash
+	cont = line one \
+continued
+	multi = 1
+[section.DepReCated]
+	k = v
+[core] inline = yes
+[section "Sub \"quoted\" \\ x"]
+	multi = 2
+[include]
+	path = inc
+[includeIf "gitdir:nowhere/"]
+	path = nope
+[includeIf "onbranch:nobranch"]
+	path = nope
+"""
+
+
+@with_tree(tree={
+    'cfg': _gitconfig_syntax,
+    'inc': '[inc]\n\tluded = yes\n[include]\n\tpath = ./sub/inc\n',
+    'sub': {'inc': '[deep]\n\tval = 1\n'},
+    'nope': '[not]\n\tincluded = 1\n',
+})
+def test_read_gitconfig(path=None):
+    path = Path(path)
+    for includes in (True, False):
+        assert_equal(
+            read_gitconfig([path / 'cfg'], includes=includes),
+            parse_gitconfig_dump(
+                GitRunner().run(
+                    ['git', 'config', '-z', '-l', '--show-origin',
+                     '--includes' if includes else '--no-includes',
+                     '--file', str(path / 'cfg')],
+                    protocol=StdOutErrCapture)['stdout'],
+                cwd=path))
+    cfg, files = read_gitconfig([path / 'cfg'])
+    assert_equal(cfg['section.Sub "quoted" \\ x.multi'], ('1', '2'))
+    assert_equal(cfg['deep.val'], '1')
+    assert_not_in('not.included', cfg)
+    assert_equal(files, {path / 'cfg', path / 'inc', path / 'sub' / 'inc'})
+    # invalid syntax or conditions that need git's evaluation
+    for invalid in ('[core\n', 'novalue # comment\n', '[c]\nv = "open\n',
+                    '[c]\nv = \\x\n',
+                    '[includeIf "hasconfig:remote.*.url:x"]\npath = nope\n'):
+        (path / 'cfg').write_text(invalid)
+        assert_raises(ValueError, read_gitconfig, [path / 'cfg'])
+
+
+@with_tempfile()
+def test_native_config_reader(path=None):
+    repo = GitRepo(path, create=True)
+    repo.config.set('sec.key', 'local', scope='local')
+    repo.config.set('sec.key', 'branch', scope='branch')
+    # conditional includes are evaluated for the repository
+    (repo.dot_git / 'extra').write_text('[sec]\n\tconditional = 1\n')
+    (repo.dot_git / 'notextra').write_text('[sec]\n\tnotconditional = 1\n')
+    repo.config.add(
+        'includeIf.gitdir:{}.path'.format(repo.dot_git), 'extra',
+        scope='local')
+    repo.config.add(
+        'includeIf.onbranch:{}.path'.format(repo.get_active_branch()),
+        str(repo.dot_git / 'extra'), scope='local')
+    repo.config.add(
+        'includeIf.onbranch:other.path', 'notextra', scope='local')
+    with patch('datalad.config.ConfigManager._reload_native',
+               return_value=None):
+        target = ConfigManager(repo)
+    with patch('datalad.config.ConfigManager._run',
+               side_effect=AssertionError('git config was called')):
+        cfg = ConfigManager(repo)
+    for store in ('git', 'branch'):
+        assert_equal(cfg._stores[store]['cfg'], target._stores[store]['cfg'])
+        assert_equal(cfg._stores[store]['files'],
+                     target._stores[store]['files'])
+    assert_equal(cfg.get('sec.conditional', get_all=True), ('1', '1'))
+    assert_not_in('sec.notconditional', cfg)
+    # anything that needs git's evaluation is left to git
+    repo.config.add(
+        'includeIf.hasconfig:remote.*.url:x.path', 'notextra', scope='local')
+    assert_equal(ConfigManager(repo)._stores['git']['cfg'],
+                 ConfigManager(repo, source='local')._stores['git']['cfg'])
+    with patch('datalad.config.ConfigManager._run',
+               side_effect=AssertionError('git config was called')):
+        assert_raises(AssertionError, ConfigManager, repo)
+
+
 # TODO: remove test along with the removal of deprecated 'where'
 @pytest.mark.filterwarnings("ignore: 'where' is deprecated")
 @pytest.mark.filterwarnings("ignore: 'where=\"dataset\"' is deprecated")
@@ -32,7 +32,7 @@ requires = {
         'importlib-metadata >=3.6; python_version < "3.10"',
         'iso8601',
         'humanize',
-        'fasteners>=0.14',
+        'fasteners>=0.16',
         'packaging',
         'patool>=1.7',
         'tqdm',